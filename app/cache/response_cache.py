@@ -0,0 +1,210 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, Collection, Type
+
+from sqlalchemy import Engine, Table, delete, event, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction, object_mapper
+
+from app.cache.ttl_cache import TTLCache
+from app.db.entities.response_cache import ResponseCacheEntry, ResponseCacheGeneration
+
+CHANGED_TABLES = "response_cache_changed_tables"
+
+# The ON DELETE actions that make the database change the rows that refer to a row
+CHANGING_ACTIONS = {"CASCADE", "SET NULL", "SET DEFAULT"}
+
+
+class ResponseCacheBackend(ABC):
+    """
+    Stores rendered responses. Entries depend on entity types, the names of the
+    tables their data is read from. Every entity type has a generation that is
+    bumped when one of its rows changes. The generations are part of the cache key,
+    so a change makes the older entries unreachable without having to find them.
+    """
+
+    @abstractmethod
+    async def version(self, entity_types: Collection[str]) -> str:
+        """
+        Returns the current generations of `entity_types` as one string.
+        """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, body: bytes) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate(self, entity_types: Collection[str]) -> None:
+        """
+        Bumps the generation of `entity_types`. Called after a commit, from a sync
+        session event.
+        """
+
+
+class MemoryResponseCache(ResponseCacheBackend):
+    """
+    Least recently used responses of this process. Only suitable when the API runs
+    in a single process, as the other processes do not see the invalidations.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self._entries: TTLCache[str, bytes] = TTLCache(
+            "responses", maxsize=maxsize, ttl=ttl
+        )
+        self._generations: dict[str, int] = {}
+
+    async def version(self, entity_types: Collection[str]) -> str:
+        return ",".join(
+            str(self._generations.get(entity_type, 0))
+            for entity_type in sorted(entity_types)
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        return self._entries.get(key)
+
+    async def set(self, key: str, body: bytes) -> None:
+        self._entries.set(key, body)
+
+    def invalidate(self, entity_types: Collection[str]) -> None:
+        for entity_type in entity_types:
+            self._generations[entity_type] = self._generations.get(entity_type, 0) + 1
+
+
+class DatabaseResponseCache(ResponseCacheBackend):
+    """
+    Responses stored in the database, shared by all processes of the API. A hit
+    costs two primary key lookups instead of building the page. Expired entries
+    are removed whenever a new entry is stored.
+    """
+
+    def __init__(self, engine: Engine, async_engine: AsyncEngine, ttl: float = 60.0):
+        self.engine = engine
+        self.async_engine = async_engine
+        self.ttl = timedelta(seconds=ttl)
+
+    async def version(self, entity_types: Collection[str]) -> str:
+        async with self.async_engine.connect() as connection:
+            rows = await connection.execute(
+                select(
+                    ResponseCacheGeneration.entity_type,
+                    ResponseCacheGeneration.generation,
+                ).where(ResponseCacheGeneration.entity_type.in_(entity_types))
+            )
+            generations = dict(rows.tuples().all())
+
+        return ",".join(
+            str(generations.get(entity_type, 0)) for entity_type in sorted(entity_types)
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        async with self.async_engine.connect() as connection:
+            body: bytes | None = await connection.scalar(
+                select(ResponseCacheEntry.body).where(
+                    ResponseCacheEntry.key == key,
+                    ResponseCacheEntry.expires_at > datetime.now(),
+                )
+            )
+            return body
+
+    async def set(self, key: str, body: bytes) -> None:
+        now = datetime.now()
+        async with self.async_engine.begin() as connection:
+            await connection.execute(
+                delete(ResponseCacheEntry).where(
+                    (ResponseCacheEntry.key == key)
+                    | (ResponseCacheEntry.expires_at <= now)
+                )
+            )
+            await connection.execute(
+                insert(ResponseCacheEntry).values(
+                    key=key, body=body, expires_at=now + self.ttl
+                )
+            )
+
+    def invalidate(self, entity_types: Collection[str]) -> None:
+        bump = (
+            update(ResponseCacheGeneration)
+            .where(ResponseCacheGeneration.entity_type.in_(entity_types))
+            .values(generation=ResponseCacheGeneration.generation + 1)
+            .returning(ResponseCacheGeneration.entity_type)
+        )
+        with self.engine.begin() as connection:
+            bumped = set(connection.scalars(bump).all())
+            new = [
+                {"entity_type": entity_type, "generation": 1}
+                for entity_type in entity_types
+                if entity_type not in bumped
+            ]
+            if not new:
+                return
+            try:
+                with connection.begin_nested():
+                    connection.execute(insert(ResponseCacheGeneration), new)
+            except IntegrityError:
+                # Another process added the generations in the meantime
+                connection.execute(bump)
+
+
+def cascaded_tables(table: Table) -> set[str]:
+    """
+    Returns the names of `table` and of the tables whose rows the database changes
+    when rows of `table` are deleted, by following the ON DELETE actions of the
+    foreign keys that refer to it.
+    """
+    names = {table.name}
+    pending = [table]
+    while pending:
+        parent = pending.pop()
+        for child in parent.metadata.tables.values():
+            if child.name in names:
+                continue
+            # ORM statements carry annotated copies of their table, so compare names
+            if any(
+                key.column.table.name == parent.name
+                and (key.ondelete or "").upper() in CHANGING_ACTIONS
+                for key in child.foreign_keys
+            ):
+                names.add(child.name)
+                pending.append(child)
+
+    return names
+
+
+def invalidate_on_commit(
+    backend: ResponseCacheBackend, session_class: Type[Session]
+) -> None:
+    """
+    Invalidates the entity types written by sessions of `session_class` once they
+    commit. Flushed entities as well as bulk UPDATE and DELETE statements count,
+    and a DELETE also counts for the tables its ON DELETE CASCADE reaches.
+    """
+
+    def collect_flushed(session: Session, flush_context: UOWTransaction) -> None:
+        changed = session.info.setdefault(CHANGED_TABLES, set())
+        for instance in chain(session.new, session.dirty, session.deleted):
+            changed.update(table.name for table in object_mapper(instance).tables)
+
+    def collect_executed(state: ORMExecuteState) -> None:
+        if state.is_update or state.is_delete or state.is_insert:
+            table: Any = state.statement.table  # type: ignore[attr-defined]
+            changed = state.session.info.setdefault(CHANGED_TABLES, set())
+            changed.update(cascaded_tables(table) if state.is_delete else {table.name})
+
+    def invalidate(session: Session) -> None:
+        changed = session.info.pop(CHANGED_TABLES, None)
+        if changed:
+            backend.invalidate(changed)
+
+    def discard(session: Session, *args: Any) -> None:
+        session.info.pop(CHANGED_TABLES, None)
+
+    event.listen(session_class, "after_flush", collect_flushed)
+    event.listen(session_class, "do_orm_execute", collect_executed)
+    event.listen(session_class, "after_commit", invalidate)
+    event.listen(session_class, "after_rollback", discard)
@@ -0,0 +1,82 @@
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable, Generic, Hashable, TypeVar
+
+from app.metrics.registry import Counter
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Lookups in the in-process caches by result",
+    labels=["cache", "result"],
+)
+
+
+class TTLCache(Generic[K, V]):
+    """
+    In-process cache that keeps at most `maxsize` entries, each for `ttl` seconds.
+    When it is full the least recently used entry is evicted. A ttl of 0 turns the
+    cache off. The cache is per process, so other workers only see a write once
+    their entries expire.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        timer: Callable[[], float] = monotonic,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._timer():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                CACHE_LOOKUPS.inc(self.name, "miss")
+                return None
+
+            self._entries.move_to_end(key)
+            CACHE_LOOKUPS.inc(self.name, "hit")
+            return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        if self.ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (self._timer() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: K, load: Callable[[], V]) -> V:
+        """
+        Returns the cached value, or calls `load` and caches its result. Concurrent
+        misses may both call `load`; the last result is kept.
+        """
+        value = self.get(key)
+        if value is None:
+            value = load()
+            self.set(key, value)
+
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -17,12 +17,41 @@ class LogLevel(str, Enum):
     critical = "critical"
 
 
+class ResponseCacheBackendType(str, Enum):
+    none = "none"
+    memory = "memory"
+    database = "database"
+
+
 class ConfigApp(BaseModel):
     loglevel: LogLevel = Field(default=LogLevel.info)
+    debug_queries: bool = Field(default=False)
 
 
 class ConfigDatabase(BaseModel):
     dsn: str
+    json_pages: bool = Field(default=False)
+
+
+class ConfigDatabaseReplica(BaseModel):
+    dsn: str
+    sticky_seconds: float = Field(default=5, ge=0)
+
+
+class ConfigSnapshot(BaseModel):
+    dsn: str
+    refresh_seconds: float = Field(default=300, gt=0)
+    listen: bool = Field(default=True)
+
+
+class ConfigCache(BaseModel):
+    reference_data_ttl: float = Field(default=300, ge=0)
+    reference_data_size: int = Field(default=1024, gt=0)
+    response_backend: ResponseCacheBackendType = Field(
+        default=ResponseCacheBackendType.none
+    )
+    response_ttl: float = Field(default=60, gt=0)
+    response_size: int = Field(default=1024, gt=0)
 
 
 class ConfigUvicorn(BaseModel):
@@ -41,7 +70,10 @@ class ConfigUvicorn(BaseModel):
 class Config(BaseModel):
     app: ConfigApp
     database: ConfigDatabase
+    database_replica: ConfigDatabaseReplica | None = None
+    snapshot: ConfigSnapshot | None = None
     uvicorn: ConfigUvicorn
+    cache: ConfigCache = Field(default_factory=ConfigCache)
 
 
 def read_ini_file(path: str) -> Any:
@@ -1,8 +1,27 @@
+from typing import Any, cast
+
 import inject
 from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
-from app.config import get_config
+from app.cache.response_cache import (
+    DatabaseResponseCache,
+    MemoryResponseCache,
+    ResponseCacheBackend,
+    invalidate_on_commit,
+)
+from app.cache.ttl_cache import TTLCache
+from app.config import Config, ResponseCacheBackendType, get_config
+from app.db.session_manager import ReadReplica
+from app.metrics.database import instrument_engine, timed_pool
+from app.snapshot.refresher import SnapshotRefresher
 from app.db.services import (
     ApplicationService,
     ApplicationTypeService,
@@ -15,26 +34,150 @@ from app.db.services import (
     ApplicationRolesService,
     ApplicationVersionService,
     RoleService,
+    SearchService,
     SystemTypeService,
     VendorService,
 )
 
 
+def reference_data_cache(name: str, config: Config) -> TTLCache[Any, Any]:
+    return TTLCache(
+        name,
+        maxsize=config.cache.reference_data_size,
+        ttl=config.cache.reference_data_ttl,
+    )
+
+
+def response_cache_backend(
+    config: Config, engine: Engine, async_engine: AsyncEngine
+) -> ResponseCacheBackend | None:
+    match config.cache.response_backend:
+        case ResponseCacheBackendType.memory:
+            return MemoryResponseCache(
+                maxsize=config.cache.response_size, ttl=config.cache.response_ttl
+            )
+        case ResponseCacheBackendType.database:
+            return DatabaseResponseCache(
+                engine, async_engine, ttl=config.cache.response_ttl
+            )
+
+    return None
+
+
+def read_replica(config: Config) -> ReadReplica | None:
+    if config.database_replica is None:
+        return None
+
+    # Every transaction on the replica is READ ONLY, so a read path that writes by
+    # mistake fails instead of being routed to a database that cannot take it
+    engine = create_engine(
+        config.database_replica.dsn,
+        echo=False,
+        pool_recycle=25,
+        pool_size=10,
+        poolclass=timed_pool(QueuePool, "replica_sync"),
+        execution_options={"postgresql_readonly": True},
+    )
+    instrument_engine(engine, "replica_sync")
+    async_engine = create_async_engine(
+        config.database_replica.dsn,
+        echo=False,
+        pool_recycle=25,
+        pool_size=10,
+        poolclass=timed_pool(AsyncAdaptedQueuePool, "replica_async"),
+        execution_options={"postgresql_readonly": True},
+    )
+    instrument_engine(async_engine.sync_engine, "replica_async")
+
+    return ReadReplica(
+        sessionmaker(engine), async_sessionmaker(async_engine, expire_on_commit=False)
+    )
+
+
+def snapshot_refresher(config: Config) -> SnapshotRefresher | None:
+    if config.snapshot is None:
+        return None
+
+    # All tables of a snapshot are read in one READ ONLY transaction that sees a
+    # single point in time
+    engine = create_engine(
+        config.snapshot.dsn,
+        echo=False,
+        pool_size=1,
+        poolclass=timed_pool(QueuePool, "snapshot"),
+        isolation_level="REPEATABLE READ",
+        execution_options={"postgresql_readonly": True},
+    )
+    instrument_engine(engine, "snapshot")
+    # The listening connection is held for as long as the API runs, it is not pooled
+    listen_engine = (
+        create_async_engine(config.snapshot.dsn, poolclass=NullPool)
+        if config.snapshot.listen
+        else None
+    )
+
+    return SnapshotRefresher(
+        sessionmaker(engine),
+        refresh_seconds=config.snapshot.refresh_seconds,
+        listen_engine=listen_engine,
+    )
+
+
 def container_config(binder: inject.Binder) -> None:
     config = get_config()
-    application_service = ApplicationService()
+    role_service = RoleService(cache=reference_data_cache("roles", config))
+    system_type_service = SystemTypeService(
+        cache=reference_data_cache("system_types", config)
+    )
+    application_service = ApplicationService(
+        role_service=role_service,
+        system_type_service=system_type_service,
+        json_pages=config.database.json_pages,
+    )
     healthcare_provider_service = HealthcareProviderService()
-    protocol_service = ProtocolService()
+    protocol_service = ProtocolService(cache=reference_data_cache("protocols", config))
     engine = create_engine(
-        config.database.dsn, echo=False, pool_recycle=25, pool_size=10
+        config.database.dsn,
+        echo=False,
+        pool_recycle=25,
+        pool_size=10,
+        poolclass=timed_pool(QueuePool, "sync"),
+    )
+    instrument_engine(engine, "sync")
+    # The psycopg dialect picks its async driver when used with create_async_engine
+    async_engine = create_async_engine(
+        config.database.dsn,
+        echo=False,
+        pool_recycle=25,
+        pool_size=10,
+        poolclass=timed_pool(AsyncAdaptedQueuePool, "async"),
     )
+    instrument_engine(async_engine.sync_engine, "async")
+    session_factory = sessionmaker(engine)
+    # Both factories create sessions of the same class, so the session events
+    # registered on it apply to the sync and async sessions alike
+    async_session_factory = async_sessionmaker(
+        async_engine, expire_on_commit=False, sync_session_class=session_factory.class_
+    )
+    response_cache = response_cache_backend(config, engine, async_engine)
+    if response_cache is not None:
+        invalidate_on_commit(response_cache, session_factory.class_)
+        binder.bind(ResponseCacheBackend, response_cache)
+    replica = read_replica(config)
+    if replica is not None:
+        binder.bind(ReadReplica, replica)
+    refresher = snapshot_refresher(config)
+    if refresher is not None:
+        binder.bind(SnapshotRefresher, refresher)
 
     (
         binder.bind(Engine, engine)
-        .bind(sessionmaker[Session], sessionmaker(engine))
-        .bind(VendorService, VendorService())
-        .bind(RoleService, RoleService())
-        .bind(SystemTypeService, SystemTypeService())
+        .bind(sessionmaker[Session], session_factory)
+        .bind(AsyncEngine, async_engine)
+        .bind(async_sessionmaker[AsyncSession], async_session_factory)
+        .bind(VendorService, VendorService(json_pages=config.database.json_pages))
+        .bind(RoleService, role_service)
+        .bind(SystemTypeService, system_type_service)
         .bind(ApplicationService, application_service)
         .bind(ApplicationTypeService, ApplicationTypeService())
         .bind(ProtocolService, protocol_service)
@@ -65,70 +208,89 @@ def container_config(binder: inject.Binder) -> None:
             HealthcareProviderQualificationService,
             HealthcareProviderQualificationService(),
         )
+        .bind(SearchService, SearchService())
     )
 
 
-def get_vendors_service() -> VendorService:
+# The service providers are async so FastAPI resolves them on the event loop
+# instead of handing each one to the threadpool.
+async def get_vendors_service() -> VendorService:
     return inject.instance(VendorService)
 
 
-def get_system_type_service() -> SystemTypeService:
+async def get_system_type_service() -> SystemTypeService:
     return inject.instance(SystemTypeService)
 
 
-def get_application_service() -> ApplicationService:
+async def get_application_service() -> ApplicationService:
     return inject.instance(ApplicationService)
 
 
-def get_roles_service() -> RoleService:
+async def get_roles_service() -> RoleService:
     return inject.instance(RoleService)
 
 
-def get_application_roles_service() -> ApplicationRolesService:
+async def get_application_roles_service() -> ApplicationRolesService:
     return inject.instance(ApplicationRolesService)
 
 
-def get_application_type_service() -> ApplicationTypeService:
+async def get_application_type_service() -> ApplicationTypeService:
     return inject.instance(ApplicationTypeService)
 
 
-def get_application_version_service() -> ApplicationVersionService:
+async def get_application_version_service() -> ApplicationVersionService:
     return inject.instance(ApplicationVersionService)
 
 
-def get_healthcare_provider_service() -> HealthcareProviderService:
+async def get_healthcare_provider_service() -> HealthcareProviderService:
     return inject.instance(HealthcareProviderService)
 
 
-def get_healthcare_provider_application_version_service() -> (
+async def get_healthcare_provider_application_version_service() -> (
     HealthcareProviderApplicationVersionService
 ):
     return inject.instance(HealthcareProviderApplicationVersionService)
 
 
-def get_protocol_application_qualification_service() -> (
+async def get_protocol_application_qualification_service() -> (
     ProtocolApplicationQualificationService
 ):
     return inject.instance(ProtocolApplicationQualificationService)
 
 
-def get_protocol_service() -> ProtocolService:
+async def get_protocol_service() -> ProtocolService:
     return inject.instance(ProtocolService)
 
 
-def get_protocol_version_service() -> ProtocolVersionService:
+async def get_protocol_version_service() -> ProtocolVersionService:
     return inject.instance(ProtocolVersionService)
 
 
-def get_healthcare_provider_qualification_service() -> (
+async def get_healthcare_provider_qualification_service() -> (
     HealthcareProviderQualificationService
 ):
     return inject.instance(HealthcareProviderQualificationService)
 
 
+async def get_search_service() -> SearchService:
+    return inject.instance(SearchService)
+
+
 def get_engine() -> Engine:
     return inject.instance(Engine)
 
 
+def get_response_cache() -> ResponseCacheBackend:
+    return cast(ResponseCacheBackend, inject.instance(ResponseCacheBackend))
+
+
+def get_read_replica() -> ReadReplica:
+    return inject.instance(ReadReplica)
+
+
+def get_snapshot_refresher() -> SnapshotRefresher:
+    return inject.instance(SnapshotRefresher)
+
+
 if not inject.is_configured():
     inject.configure(container_config)
\ No newline at end of file
@@ -10,6 +10,7 @@ from .healthcare_provider_application_version import (
 from .healthcare_provider_qualification import HealthcareProviderQualification
 from .protocol import Protocol
 from .protocol_version import ProtocolVersion
+from .response_cache import ResponseCacheEntry, ResponseCacheGeneration
 from .role import Role
 from .system_type import SystemType
 from .vendor import Vendor
@@ -26,6 +27,8 @@ __all__ = [
     "HealthcareProviderQualification",
     "Protocol",
     "ProtocolVersion",
+    "ResponseCacheEntry",
+    "ResponseCacheGeneration",
     "Role",
     "SystemType",
     "Vendor",
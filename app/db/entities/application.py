@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List
 from uuid import UUID, uuid4
 
-from sqlalchemy import UniqueConstraint, types, String, ForeignKey, TIMESTAMP
+from sqlalchemy import UniqueConstraint, types, String, ForeignKey, TIMESTAMP, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
@@ -14,7 +14,21 @@ from app.db.entities import application_role
 
 class Application(SQLModelBase):
     __tablename__ = "applications"
-    __table_args__ = (UniqueConstraint("id", "name"),)
+    __table_args__ = (
+        UniqueConstraint("id", "name"),
+        UniqueConstraint("vendor_id", "name", name="applications_vendor_id_name_key"),
+        Index(
+            "applications_vendor_id_created_at_id_idx", "vendor_id", "created_at", "id"
+        ),
+        Index("applications_created_at_id_idx", "created_at", "id"),
+        Index("applications_modified_at_idx", "modified_at"),
+        Index(
+            "applications_name_trgm_idx",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         "id",
@@ -23,34 +37,41 @@ class Application(SQLModelBase):
         nullable=False,
         default=uuid4,
     )
-    name: Mapped[str] = mapped_column("name", String(150), unique=True, nullable=False)
+    name: Mapped[str] = mapped_column("name", String(150), nullable=False)
     vendor_id: Mapped[UUID] = mapped_column(
-        ForeignKey("vendors.id", name="applications_vendors_fk")
+        ForeignKey("vendors.id", name="applications_vendors_fk", ondelete="CASCADE")
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     vendor: Mapped["vendor.Vendor"] = relationship(
-        back_populates="applications", lazy="joined"
+        back_populates="applications", lazy="raise_on_sql"
     )
     versions: Mapped[List["application_version.ApplicationVersion"]] = relationship(
         back_populates="application",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete, delete-orphan",
+        passive_deletes=True,
     )
     system_types: Mapped[List["application_type.ApplicationType"]] = relationship(
         back_populates="application",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="save-update, delete, delete-orphan",
+        passive_deletes=True,
     )
     roles: Mapped[List["application_role.ApplicationRole"]] = relationship(
         back_populates="application",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="save-update, delete, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import types, ForeignKey, TIMESTAMP, PrimaryKeyConstraint
+from sqlalchemy import types, ForeignKey, TIMESTAMP, PrimaryKeyConstraint, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
@@ -17,6 +17,7 @@ class ApplicationRole(SQLModelBase):
     __tablename__ = "applications_roles"
     __table_args__ = (
         PrimaryKeyConstraint("application_id", "role_id", name="applications_roles_pk"),
+        Index("applications_roles_role_id_idx", "role_id"),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -27,19 +28,25 @@ class ApplicationRole(SQLModelBase):
         default=uuid4,
     )
     application_id: Mapped[UUID] = mapped_column(
-        ForeignKey("applications.id"), nullable=False
+        ForeignKey("applications.id", ondelete="CASCADE"), nullable=False
+    )
+    role_id: Mapped[UUID] = mapped_column(
+        ForeignKey("roles.id", ondelete="CASCADE"), nullable=False
     )
-    role_id: Mapped[UUID] = mapped_column(ForeignKey("roles.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     application: Mapped["application.Application"] = relationship(
-        back_populates="roles",
+        back_populates="roles", lazy="raise_on_sql"
     )
     role: Mapped["role.Role"] = relationship(
-        back_populates="applications", lazy="selectin"
+        back_populates="applications", lazy="raise_on_sql"
     )
@@ -6,6 +6,7 @@ from sqlalchemy import (
     ForeignKey,
     TIMESTAMP,
     PrimaryKeyConstraint,
+    Index,
 )
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
@@ -24,6 +25,7 @@ class ApplicationType(SQLModelBase):
         PrimaryKeyConstraint(
             "application_id", "system_type_id", name="applications_types_pk"
         ),
+        Index("applications_types_system_type_id_idx", "system_type_id"),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -34,21 +36,25 @@ class ApplicationType(SQLModelBase):
         default=uuid4,
     )
     application_id: Mapped[UUID] = mapped_column(
-        ForeignKey("applications.id"), nullable=False
+        ForeignKey("applications.id", ondelete="CASCADE"), nullable=False
     )
     system_type_id: Mapped[UUID] = mapped_column(
-        ForeignKey("system_types.id"), nullable=False
+        ForeignKey("system_types.id", ondelete="CASCADE"), nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     application: Mapped["application.Application"] = relationship(
-        back_populates="system_types"
+        back_populates="system_types", lazy="raise_on_sql"
     )
     system_type: Mapped["system_type.SystemType"] = relationship(
-        back_populates="applications", lazy="selectin"
+        back_populates="applications", lazy="raise_on_sql"
     )
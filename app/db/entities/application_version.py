@@ -3,7 +3,7 @@ from typing import List
 from uuid import UUID, uuid4
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
-from sqlalchemy import TIMESTAMP, ForeignKey, String, types
+from sqlalchemy import TIMESTAMP, ForeignKey, String, types, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.entities import (
@@ -15,6 +15,10 @@ from app.db.entities import (
 
 class ApplicationVersion(SQLModelBase):
     __tablename__ = "application_versions"
+    __table_args__ = (
+        Index("application_versions_application_id_idx", "application_id"),
+        Index("application_versions_created_at_id_idx", "created_at", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         "id",
@@ -25,23 +29,39 @@ class ApplicationVersion(SQLModelBase):
     )
     version: Mapped[str] = mapped_column("version", String(50), nullable=False)
     application_id: Mapped[UUID] = mapped_column(
-        ForeignKey("applications.id", name="applications_versions_application_fk")
+        ForeignKey(
+            "applications.id",
+            name="applications_versions_application_fk",
+            ondelete="CASCADE",
+        )
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     application: Mapped["application.Application"] = relationship(
-        back_populates="versions"
+        back_populates="versions", lazy="raise_on_sql"
     )
     healthcare_providers: Mapped[
         List[
             "healthcare_provider_application_version.HealthcareProviderApplicationVersion"
         ]
-    ] = relationship(back_populates="application_version", lazy="selectin")
+    ] = relationship(
+        back_populates="application_version",
+        lazy="raise_on_sql",
+        passive_deletes="all",
+    )
     qualified_protocol_versions: Mapped[
         List["application_version_qualification.ProtocolApplicationQualification"]
-    ] = relationship(back_populates="application_version", lazy="selectin")
+    ] = relationship(
+        back_populates="application_version",
+        lazy="raise_on_sql",
+        passive_deletes="all",
+    )
@@ -3,7 +3,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
-from sqlalchemy import TIMESTAMP, Date, ForeignKey, PrimaryKeyConstraint, types
+from sqlalchemy import TIMESTAMP, Date, ForeignKey, PrimaryKeyConstraint, types, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.entities import application_version, protocol_version
@@ -23,6 +23,10 @@ class ProtocolApplicationQualification(SQLModelBase):
             "protocol_version_id",
             name="application_versions_qualifications_pk",
         ),
+        Index(
+            "protocol_application_qualifications_protocol_version_id_idx",
+            "protocol_version_id",
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -33,10 +37,10 @@ class ProtocolApplicationQualification(SQLModelBase):
         default=uuid4,
     )
     application_version_id: Mapped[UUID] = mapped_column(
-        ForeignKey("application_versions.id"), nullable=False
+        ForeignKey("application_versions.id", ondelete="CASCADE"), nullable=False
     )
     protocol_version_id: Mapped[UUID] = mapped_column(
-        ForeignKey("protocol_versions.id"), nullable=False
+        ForeignKey("protocol_versions.id", ondelete="CASCADE"), nullable=False
     )
     qualification_date: Mapped[date] = mapped_column(
         "qualification_date", Date, nullable=False
@@ -45,17 +49,21 @@ class ProtocolApplicationQualification(SQLModelBase):
         "archived_date", TIMESTAMP, nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     protocol_version: Mapped["protocol_version.ProtocolVersion"] = relationship(
-        back_populates="qualified_application_versions"
+        back_populates="qualified_application_versions", lazy="raise_on_sql"
     )
     application_version: Mapped["application_version.ApplicationVersion"] = (
-        relationship(back_populates="qualified_protocol_versions", lazy="selectin")
+        relationship(back_populates="qualified_protocol_versions", lazy="raise_on_sql")
     )
 
     def __repr__(self) -> str:
@@ -3,7 +3,7 @@ from typing import List
 from uuid import UUID, uuid4
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
-from sqlalchemy import types, String, TIMESTAMP
+from sqlalchemy import types, String, TIMESTAMP, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from app.db.entities import healthcare_provider_application_version
@@ -12,6 +12,34 @@ from app.db.entities import healthcare_provider_qualification
 
 class HealthcareProvider(SQLModelBase):
     __tablename__ = "healthcare_providers"
+    __table_args__ = (
+        Index("healthcare_providers_created_at_id_idx", "created_at", "id"),
+        Index("healthcare_providers_modified_at_idx", "modified_at"),
+        Index(
+            "healthcare_providers_trade_name_trgm_idx",
+            "trade_name",
+            postgresql_using="gin",
+            postgresql_ops={"trade_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "healthcare_providers_statutory_name_trgm_idx",
+            "statutory_name",
+            postgresql_using="gin",
+            postgresql_ops={"statutory_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "healthcare_providers_ura_code_trgm_idx",
+            "ura_code",
+            postgresql_using="gin",
+            postgresql_ops={"ura_code": "gin_trgm_ops"},
+        ),
+        Index(
+            "healthcare_providers_agb_code_trgm_idx",
+            "agb_code",
+            postgresql_using="gin",
+            postgresql_ops={"agb_code": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         "id",
@@ -31,10 +59,14 @@ class HealthcareProvider(SQLModelBase):
         "statutory_name", String(150), nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     application_versions: Mapped[
@@ -43,13 +75,15 @@ class HealthcareProvider(SQLModelBase):
         ]
     ] = relationship(
         back_populates="healthcare_provider",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="save-update, delete, delete-orphan",
+        passive_deletes=True,
     )
     qualified_protocols: Mapped[
         List["healthcare_provider_qualification.HealthcareProviderQualification"]
     ] = relationship(
         back_populates="healthcare_provider",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="save-update, delete, delete-orphan",
+        passive_deletes=True,
     )
@@ -2,7 +2,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
-from sqlalchemy import PrimaryKeyConstraint, types, ForeignKey, TIMESTAMP
+from sqlalchemy import PrimaryKeyConstraint, types, ForeignKey, TIMESTAMP, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.entities import application_version
@@ -21,6 +21,9 @@ class HealthcareProviderApplicationVersion(SQLModelBase):
             "application_version_id",
             name="healthcare_providers_application_version_pk",
         ),
+        Index(
+            "healthcare_providers_app_versions_version_id_idx", "application_version_id"
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -31,21 +34,25 @@ class HealthcareProviderApplicationVersion(SQLModelBase):
         default=uuid4,
     )
     healthcare_provider_id: Mapped[UUID] = mapped_column(
-        ForeignKey("healthcare_providers.id"), nullable=False
+        ForeignKey("healthcare_providers.id", ondelete="CASCADE"), nullable=False
     )
     application_version_id: Mapped[UUID] = mapped_column(
-        ForeignKey("application_versions.id"), nullable=False
+        ForeignKey("application_versions.id", ondelete="CASCADE"), nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     healthcare_provider: Mapped["healthcare_provider.HealthcareProvider"] = (
-        relationship(back_populates="application_versions", lazy="selectin")
+        relationship(back_populates="application_versions", lazy="raise_on_sql")
     )
     application_version: Mapped["application_version.ApplicationVersion"] = (
-        relationship(back_populates="healthcare_providers", lazy="selectin")
+        relationship(back_populates="healthcare_providers", lazy="raise_on_sql")
     )
@@ -3,7 +3,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
-from sqlalchemy import types, TIMESTAMP, PrimaryKeyConstraint, Date, ForeignKey
+from sqlalchemy import types, TIMESTAMP, PrimaryKeyConstraint, Date, ForeignKey, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 
@@ -24,6 +24,10 @@ class HealthcareProviderQualification(SQLModelBase):
             "protocol_version_id",
             name="healthcare_providers_qualifications_pk",
         ),
+        Index(
+            "healthcare_providers_qualifications_protocol_version_id_idx",
+            "protocol_version_id",
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -34,10 +38,10 @@ class HealthcareProviderQualification(SQLModelBase):
         default=uuid4,
     )
     healthcare_provider_id: Mapped[UUID] = mapped_column(
-        ForeignKey("healthcare_providers.id"), nullable=False
+        ForeignKey("healthcare_providers.id", ondelete="CASCADE"), nullable=False
     )
     protocol_version_id: Mapped[UUID] = mapped_column(
-        ForeignKey("protocol_versions.id"), nullable=False
+        ForeignKey("protocol_versions.id", ondelete="CASCADE"), nullable=False
     )
     qualification_date: Mapped[datetime] = mapped_column(
         "qualification_date", Date, nullable=False
@@ -46,17 +50,21 @@ class HealthcareProviderQualification(SQLModelBase):
         "archived_date", TIMESTAMP, nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     healthcare_provider: Mapped["healthcare_provider.HealthcareProvider"] = (
-        relationship(back_populates="qualified_protocols")
+        relationship(back_populates="qualified_protocols", lazy="raise_on_sql")
     )
     protocol_version: Mapped["protocol_version.ProtocolVersion"] = relationship(
-        back_populates="qualified_healthcare_providers", lazy="selectin"
+        back_populates="qualified_healthcare_providers", lazy="raise_on_sql"
     )
 
     def __repr__(self) -> str:
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Literal, get_args
 from uuid import UUID, uuid4
 
-from sqlalchemy import types, String, TIMESTAMP, Enum
+from sqlalchemy import types, String, TIMESTAMP, Enum, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship, validates
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
@@ -13,6 +13,7 @@ ProtocolTypes = Literal["InformationStandard", "Directive"]
 
 class Protocol(SQLModelBase):
     __tablename__ = "protocols"
+    __table_args__ = (Index("protocols_created_at_id_idx", "created_at", "id"),)
 
     id: Mapped[UUID] = mapped_column(
         "id",
@@ -35,14 +36,21 @@ class Protocol(SQLModelBase):
         "description", String, nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     versions: Mapped[List["protocol_version.ProtocolVersion"]] = relationship(
-        back_populates="protocol", lazy="selectin", cascade="all, delete, delete-orphan"
+        back_populates="protocol",
+        lazy="raise_on_sql",
+        cascade="all, delete, delete-orphan",
+        passive_deletes=True,
     )
 
     @validates("protocol_type")
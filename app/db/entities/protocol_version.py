@@ -3,7 +3,7 @@ from typing import List
 from uuid import UUID, uuid4
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
-from sqlalchemy import TIMESTAMP, ForeignKey, String, types
+from sqlalchemy import TIMESTAMP, ForeignKey, String, types, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.entities import (
@@ -15,6 +15,10 @@ from app.db.entities import (
 
 class ProtocolVersion(SQLModelBase):
     __tablename__ = "protocol_versions"
+    __table_args__ = (
+        Index("protocol_versions_protocol_id_idx", "protocol_id"),
+        Index("protocol_versions_created_at_id_idx", "created_at", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         "id",
@@ -28,23 +32,36 @@ class ProtocolVersion(SQLModelBase):
         "description", String, nullable=True
     )
     protocol_id: Mapped[UUID] = mapped_column(
-        ForeignKey("protocols.id", name="protocols_versions_protocols_fk")
+        ForeignKey(
+            "protocols.id", name="protocols_versions_protocols_fk", ondelete="CASCADE"
+        )
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
-    protocol: Mapped["protocol.Protocol"] = relationship(back_populates="versions")
+    protocol: Mapped["protocol.Protocol"] = relationship(
+        back_populates="versions", lazy="raise_on_sql"
+    )
     qualified_healthcare_providers: Mapped[
         List["healthcare_provider_qualification.HealthcareProviderQualification"]
-    ] = relationship(back_populates="protocol_version")
+    ] = relationship(
+        back_populates="protocol_version",
+        lazy="raise_on_sql",
+        passive_deletes="all",
+    )
     qualified_application_versions: Mapped[
         List["application_version_qualification.ProtocolApplicationQualification"]
     ] = relationship(
         back_populates="protocol_version",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="save-update, delete, delete-orphan",
+        passive_deletes=True,
     )
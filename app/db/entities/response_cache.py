@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from gfmodules_python_shared.schema.sql_model import SQLModelBase
+from sqlalchemy import Index, Integer, LargeBinary, String, TIMESTAMP
+from sqlalchemy.orm import mapped_column, Mapped
+
+
+class ResponseCacheEntry(SQLModelBase):
+    __tablename__ = "response_cache_entries"
+    __table_args__ = (Index("response_cache_entries_expires_at_idx", "expires_at"),)
+
+    key: Mapped[str] = mapped_column("key", String, primary_key=True)
+    body: Mapped[bytes] = mapped_column("body", LargeBinary, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        "expires_at", TIMESTAMP, nullable=False
+    )
+
+
+class ResponseCacheGeneration(SQLModelBase):
+    __tablename__ = "response_cache_generations"
+
+    entity_type: Mapped[str] = mapped_column(
+        "entity_type", String(150), primary_key=True
+    )
+    generation: Mapped[int] = mapped_column("generation", Integer, nullable=False)
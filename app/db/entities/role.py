@@ -3,7 +3,7 @@ from typing import List
 from uuid import UUID, uuid4
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
-from sqlalchemy import types, String, TIMESTAMP
+from sqlalchemy import types, String, TIMESTAMP, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from app.db.entities import application_role
@@ -11,6 +11,7 @@ from app.db.entities import application_role
 
 class Role(SQLModelBase):
     __tablename__ = "roles"
+    __table_args__ = (Index("roles_created_at_id_idx", "created_at", "id"),)
 
     id: Mapped[UUID] = mapped_column(
         "id", types.Uuid, primary_key=True, nullable=False, default=uuid4
@@ -20,14 +21,21 @@ class Role(SQLModelBase):
         "description", String, nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     applications: Mapped[List["application_role.ApplicationRole"]] = relationship(
-        back_populates="role", cascade="delete,delete-orphan", lazy="selectin"
+        back_populates="role",
+        cascade="delete,delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
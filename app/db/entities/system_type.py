@@ -3,7 +3,7 @@ from typing import List
 from uuid import UUID, uuid4
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
-from sqlalchemy import types, String, TIMESTAMP
+from sqlalchemy import types, String, TIMESTAMP, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from app.db.entities import application_type
@@ -11,6 +11,7 @@ from app.db.entities import application_type
 
 class SystemType(SQLModelBase):
     __tablename__ = "system_types"
+    __table_args__ = (Index("system_types_created_at_id_idx", "created_at", "id"),)
 
     id: Mapped[UUID] = mapped_column(
         "id",
@@ -24,12 +25,18 @@ class SystemType(SQLModelBase):
         "description", String, nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     applications: Mapped[List["application_type.ApplicationType"]] = relationship(
-        back_populates="system_type", lazy="selectin"
+        back_populates="system_type",
+        lazy="raise_on_sql",
+        passive_deletes="all",
     )
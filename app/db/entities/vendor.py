@@ -3,7 +3,7 @@ from typing import List
 from uuid import UUID, uuid4
 
 from gfmodules_python_shared.schema.sql_model import SQLModelBase
-from sqlalchemy import types, String, TIMESTAMP
+from sqlalchemy import types, String, TIMESTAMP, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from app.db.entities import application
@@ -11,6 +11,28 @@ from app.db.entities import application
 
 class Vendor(SQLModelBase):
     __tablename__ = "vendors"
+    __table_args__ = (
+        Index("vendors_created_at_id_idx", "created_at", "id"),
+        Index("vendors_modified_at_idx", "modified_at"),
+        Index(
+            "vendors_trade_name_trgm_idx",
+            "trade_name",
+            postgresql_using="gin",
+            postgresql_ops={"trade_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "vendors_statutory_name_trgm_idx",
+            "statutory_name",
+            postgresql_using="gin",
+            postgresql_ops={"statutory_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "vendors_kvk_number_trgm_idx",
+            "kvk_number",
+            postgresql_using="gin",
+            postgresql_ops={"kvk_number": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         "id",
@@ -29,12 +51,19 @@ class Vendor(SQLModelBase):
         "statutory_name", String(150), nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
-        "created_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "created_at", TIMESTAMP, nullable=False, default=datetime.now
     )
     modified_at: Mapped[datetime] = mapped_column(
-        "modified_at", TIMESTAMP, nullable=False, default=datetime.now()
+        "modified_at",
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
     )
 
     applications: Mapped[List["application.Application"]] = relationship(
-        back_populates="vendor", lazy="selectin", cascade="all, delete, delete-orphan"
+        back_populates="vendor",
+        lazy="raise_on_sql",
+        cascade="all, delete, delete-orphan",
+        passive_deletes=True,
     )
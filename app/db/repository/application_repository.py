@@ -1,15 +1,220 @@
 import logging
-from typing import Any
+from typing import Any, Callable, Collection
+from uuid import UUID
 
 from gfmodules_python_shared.repository.base import RepositoryBase
-from sqlalchemy import ColumnExpressionArgument
+from sqlalchemy import (
+    ColumnElement,
+    ColumnExpressionArgument,
+    exists,
+    select,
+    tuple_,
+)
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+from sqlalchemy.sql.base import ExecutableOption
 
-from app.db.entities import Application
+from app.db.entities import (
+    Application,
+    ApplicationRole,
+    ApplicationType,
+    ApplicationVersion,
+    ProtocolApplicationQualification,
+    Role,
+    SystemType,
+    Vendor,
+)
+from app.db.repository.bulk import BulkMixin
+from app.db.repository.json_objects import (
+    json_array_agg,
+    json_object,
+    json_subquery,
+)
+from app.db.repository.on_conflict import OnConflictMixin
+from app.db.repository.pagination import KeysetPaginationMixin
+from app.db.repository.search import SearchMixin
+from app.schemas.enums.search_hit_type import SearchHitType
+from app.schemas.filter_query_params.schema import ApplicationFilterQueryParams
 
 logger = logging.getLogger(__name__)
 
 
-class ApplicationRepository(RepositoryBase[Application]):
+def application_versions_json() -> ColumnElement[Any]:
+    return json_subquery(
+        select(
+            json_array_agg(
+                json_object(
+                    {"id": ApplicationVersion.id, "version": ApplicationVersion.version}
+                )
+            )
+        ).where(ApplicationVersion.application_id == Application.id)
+    )
+
+
+def application_roles_json() -> ColumnElement[Any]:
+    return json_subquery(
+        select(
+            json_array_agg(
+                json_object(
+                    {"id": Role.id, "name": Role.name, "description": Role.description}
+                )
+            )
+        )
+        .select_from(ApplicationRole)
+        .join(Role, Role.id == ApplicationRole.role_id)
+        .where(ApplicationRole.application_id == Application.id)
+    )
+
+
+def application_system_types_json() -> ColumnElement[Any]:
+    return json_subquery(
+        select(
+            json_array_agg(
+                json_object(
+                    {
+                        "id": SystemType.id,
+                        "name": SystemType.name,
+                        "description": SystemType.description,
+                    }
+                )
+            )
+        )
+        .select_from(ApplicationType)
+        .join(SystemType, SystemType.id == ApplicationType.system_type_id)
+        .where(ApplicationType.application_id == Application.id)
+    )
+
+
+def application_children_options() -> list[_AbstractLoad]:
+    """
+    Returns the options that load the versions, roles and system types of
+    applications, to be applied below a relationship that loads applications.
+    """
+    return [
+        selectinload(Application.versions),
+        selectinload(Application.roles).joinedload(ApplicationRole.role),
+        selectinload(Application.system_types).joinedload(ApplicationType.system_type),
+    ]
+
+
+class ApplicationRepository(
+    RepositoryBase[Application],
+    KeysetPaginationMixin[Application],
+    SearchMixin[Application],
+    BulkMixin,
+    OnConflictMixin,
+):
+    search_type = SearchHitType.APPLICATION
+    search_columns = (Application.name,)
+
     @property
     def order_by(self) -> tuple[ColumnExpressionArgument[Any] | str, ...]:
-        return (Application.created_at.desc(),)
+        return (Application.created_at.desc(), Application.id.desc())
+
+    def loader_options(
+        self, expand: Collection[str] | None = None
+    ) -> list[ExecutableOption]:
+        versions, roles, system_types = application_children_options()
+        options = {
+            "vendor": joinedload(Application.vendor, innerjoin=True),
+            "versions": versions,
+            "roles": roles,
+            "system_types": system_types,
+        }
+        return [
+            option
+            for name, option in options.items()
+            if expand is None or name in expand
+        ]
+
+    def filter_criteria(
+        self, filters: ApplicationFilterQueryParams | None
+    ) -> list[ColumnElement[bool]]:
+        """
+        Returns the criteria of `filters` for `get_page` and `get_json_page`. The
+        filters on children are EXISTS subqueries, so an application is returned
+        once however many of its children match.
+        """
+        criteria = self.timestamp_criteria(filters)
+        if filters is None:
+            return criteria
+
+        if filters.vendor_id is not None:
+            criteria.append(Application.vendor_id == filters.vendor_id)
+        if filters.role is not None:
+            criteria.append(
+                exists().where(
+                    ApplicationRole.application_id == Application.id,
+                    ApplicationRole.role_id == Role.id,
+                    Role.name == filters.role,
+                )
+            )
+        if filters.system_type is not None:
+            criteria.append(
+                exists().where(
+                    ApplicationType.application_id == Application.id,
+                    ApplicationType.system_type_id == SystemType.id,
+                    SystemType.name == filters.system_type,
+                )
+            )
+        if filters.qualified_for is not None:
+            criteria.append(
+                exists().where(
+                    ApplicationVersion.application_id == Application.id,
+                    ProtocolApplicationQualification.application_version_id
+                    == ApplicationVersion.id,
+                    ProtocolApplicationQualification.protocol_version_id
+                    == filters.qualified_for,
+                    ProtocolApplicationQualification.archived_date.is_(None),
+                )
+            )
+
+        return criteria
+
+    def json_item(self, fields: Collection[str] | None) -> ColumnElement[Any]:
+        """
+        Returns the expression that renders an application as the JSON of its DTO,
+        for `get_json_page`. Only the DTO fields in `fields` are rendered, all of
+        them when it is None.
+        """
+        values: dict[str, Callable[[], ColumnExpressionArgument[Any]]] = {
+            "name": lambda: Application.name,
+            "id": lambda: Application.id,
+            "vendor": lambda: json_subquery(
+                select(
+                    json_object(
+                        {
+                            "id": Vendor.id,
+                            "trade_name": Vendor.trade_name,
+                            "statutory_name": Vendor.statutory_name,
+                            "kvk_number": Vendor.kvk_number,
+                        }
+                    )
+                ).where(Vendor.id == Application.vendor_id)
+            ),
+            "versions": application_versions_json,
+            "roles": application_roles_json,
+            "system_types": application_system_types_json,
+            "created_at": lambda: Application.created_at,
+            "modified_at": lambda: Application.modified_at,
+        }
+        return json_object(
+            {
+                name: value()
+                for name, value in values.items()
+                if fields is None or name in fields
+            }
+        )
+
+    def taken_names(self, names: Collection[tuple[UUID, str]]) -> set[tuple[UUID, str]]:
+        """
+        Returns the (vendor id, application name) pairs of `names` that are in use,
+        in one query.
+        """
+        if not names:
+            return set()
+
+        stmt = select(Application.vendor_id, Application.name).where(
+            tuple_(Application.vendor_id, Application.name).in_(names)
+        )
+        return {(row.vendor_id, row.name) for row in self.session.execute(stmt)}
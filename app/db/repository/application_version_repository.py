@@ -13,4 +13,4 @@ logger = logging.getLogger(__name__)
 class ApplicationVersionRepository(RepositoryBase[ApplicationVersion]):
     @property
     def order_by(self) -> tuple[ColumnExpressionArgument[Any] | str, ...]:
-        return (ApplicationVersion.created_at.desc(),)
+        return (ApplicationVersion.created_at.desc(), ApplicationVersion.id.desc())
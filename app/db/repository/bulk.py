@@ -0,0 +1,74 @@
+from typing import Any, Collection, Mapping, Sequence, Type, TypeVar
+from uuid import UUID
+
+from sqlalchemy import ColumnExpressionArgument, delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.repository.modification import touch_deleted
+
+T = TypeVar("T")
+
+
+class BulkMixin:
+    """
+    Set-based helpers for bulk requests and deletes. They work on the table of any
+    entity, as a bulk request writes the children of its entities in the same
+    transaction.
+    """
+
+    session: Session
+
+    def existing_ids(self, entity: Type[Any], ids: Collection[UUID]) -> set[UUID]:
+        """
+        Returns the ids of `ids` that exist, in one query that loads no entities.
+        """
+        if not ids:
+            return set()
+
+        stmt = select(entity.id).where(entity.id.in_(ids))
+        return set(self.session.scalars(stmt).all())
+
+    def insert_many(
+        self, entity: Type[Any], rows: Sequence[Mapping[str, Any]]
+    ) -> list[UUID]:
+        """
+        Inserts `rows` with multi-row INSERT ... RETURNING statements and returns the
+        new ids in the order of `rows`. Column defaults are applied, but no entities
+        are created, so relationships and their cascades are not involved, and the
+        resources the rows are nested in are not bumped.
+        """
+        if not rows:
+            return []
+
+        stmt = insert(entity).returning(entity.id, sort_by_parameter_order=True)
+        return list(self.session.scalars(stmt, rows).all())
+
+    def delete_returning(
+        self, entity: Type[T], *criteria: ColumnExpressionArgument[bool]
+    ) -> Sequence[T]:
+        """
+        Deletes the rows matching `criteria` with one DELETE statement and returns
+        them as entities. Their children are deleted by the ON DELETE CASCADE of
+        the foreign keys that refer to them, so none are loaded or deleted one by
+        one.
+        """
+        touch_deleted(self.session, entity, *criteria)
+        stmt = delete(entity).where(*criteria).returning(entity)
+        return self.session.scalars(stmt).all()
+
+    def delete_many(
+        self,
+        entity: Type[Any],
+        ids: Collection[UUID],
+        *criteria: ColumnExpressionArgument[bool],
+    ) -> set[UUID]:
+        """
+        Deletes the rows of `ids` that match `criteria` like `delete_returning`,
+        and returns the ids that were deleted.
+        """
+        if not ids:
+            return set()
+
+        touch_deleted(self.session, entity, entity.id.in_(ids), *criteria)
+        stmt = delete(entity).where(entity.id.in_(ids), *criteria).returning(entity.id)
+        return set(self.session.scalars(stmt).all())
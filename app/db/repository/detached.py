@@ -0,0 +1,17 @@
+from typing import Generic
+
+from gfmodules_python_shared.schema.sql_model import TSQLModel
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+
+class AttachMixin(Generic[TSQLModel]):
+    session: Session
+
+    def attach(self, entity: TSQLModel) -> TSQLModel:
+        """
+        Adds an entity built from known column values, e.g. from a cache, to the
+        session as if it was loaded from the database, without a SELECT. The entity
+        must exist. Attributes that were not set are loaded on first access.
+        """
+        make_transient_to_detached(entity)
+        return self.session.merge(entity, load=False)
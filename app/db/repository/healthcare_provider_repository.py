@@ -1,18 +1,91 @@
 import logging
-from typing import Any
+from typing import Any, Collection
 
 from gfmodules_python_shared.repository.base import RepositoryBase
-from sqlalchemy import ColumnExpressionArgument, exists
+from sqlalchemy import ColumnElement, ColumnExpressionArgument, exists, or_, select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
-from app.db.entities import HealthcareProvider
+from app.db.entities import (
+    HealthcareProvider,
+    HealthcareProviderApplicationVersion,
+    HealthcareProviderQualification,
+)
+from app.db.repository.bulk import BulkMixin
+from app.db.repository.on_conflict import OnConflictMixin
+from app.db.repository.pagination import KeysetPaginationMixin
+from app.db.repository.search import SearchMixin
+from app.schemas.enums.search_hit_type import SearchHitType
+from app.schemas.filter_query_params.schema import (
+    HealthcareProviderFilterQueryParams,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class HealthcareProviderRepository(RepositoryBase[HealthcareProvider]):
+class HealthcareProviderRepository(
+    RepositoryBase[HealthcareProvider],
+    KeysetPaginationMixin[HealthcareProvider],
+    SearchMixin[HealthcareProvider],
+    BulkMixin,
+    OnConflictMixin,
+):
+    search_type = SearchHitType.HEALTHCARE_PROVIDER
+    search_columns = (
+        HealthcareProvider.trade_name,
+        HealthcareProvider.statutory_name,
+        HealthcareProvider.ura_code,
+        HealthcareProvider.agb_code,
+    )
+
     @property
     def order_by(self) -> tuple[ColumnExpressionArgument[Any] | str, ...]:
-        return (HealthcareProvider.created_at.desc(),)
+        return (HealthcareProvider.created_at.desc(), HealthcareProvider.id.desc())
+
+    def loader_options(
+        self, expand: Collection[str] | None = None
+    ) -> list[ExecutableOption]:
+        return [
+            selectinload(HealthcareProvider.application_versions).joinedload(
+                HealthcareProviderApplicationVersion.application_version
+            ),
+            selectinload(HealthcareProvider.qualified_protocols).joinedload(
+                HealthcareProviderQualification.protocol_version
+            ),
+        ]
+
+    def filter_criteria(
+        self, filters: HealthcareProviderFilterQueryParams | None
+    ) -> list[ColumnElement[bool]]:
+        """
+        Returns the criteria of `filters` for `get_page`. The filters on application
+        versions and qualifications are EXISTS subqueries on the junction tables.
+        """
+        criteria = self.timestamp_criteria(filters)
+        if filters is None:
+            return criteria
+
+        if filters.application_version_id is not None:
+            criteria.append(
+                exists().where(
+                    HealthcareProviderApplicationVersion.healthcare_provider_id
+                    == HealthcareProvider.id,
+                    HealthcareProviderApplicationVersion.application_version_id
+                    == filters.application_version_id,
+                )
+            )
+        if filters.qualified_for is not None:
+            criteria.append(
+                exists().where(
+                    HealthcareProviderQualification.healthcare_provider_id
+                    == HealthcareProvider.id,
+                    HealthcareProviderQualification.protocol_version_id
+                    == filters.qualified_for,
+                    HealthcareProviderQualification.archived_date.is_(None),
+                )
+            )
+
+        return criteria
 
     def ura_code_exists(self, ura_code: str) -> bool:
         stmt = exists(1).where(HealthcareProvider.ura_code == ura_code).select()
@@ -29,3 +102,19 @@ class HealthcareProviderRepository(RepositoryBase[HealthcareProvider]):
             return result
 
         raise TypeError("Incorrect return from sql statement")
+
+    def taken_codes(
+        self, ura_codes: Collection[str], agb_codes: Collection[str]
+    ) -> tuple[set[str], set[str]]:
+        """
+        Returns the URA and AGB codes of `ura_codes` and `agb_codes` that are in use,
+        in one query.
+        """
+        stmt = select(HealthcareProvider.ura_code, HealthcareProvider.agb_code).where(
+            or_(
+                HealthcareProvider.ura_code.in_(ura_codes),
+                HealthcareProvider.agb_code.in_(agb_codes),
+            )
+        )
+        rows = self.session.execute(stmt).all()
+        return {row.ura_code for row in rows}, {row.agb_code for row in rows}
@@ -0,0 +1,96 @@
+from typing import Any, Mapping
+
+from pydantic.alias_generators import to_camel
+from sqlalchemy import ColumnElement, ColumnExpressionArgument, Select, literal_column
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class JsonObject(FunctionElement[Any]):
+    name = "json_object"
+    inherit_cache = True
+
+
+class JsonArrayAgg(FunctionElement[Any]):
+    name = "json_array_agg"
+    inherit_cache = True
+
+
+class JsonSubquery(FunctionElement[Any]):
+    name = "json_subquery"
+    inherit_cache = True
+
+
+@compiles(JsonObject)
+def _compile_json_object(element: JsonObject, compiler: SQLCompiler, **kw: Any) -> str:
+    return f"json_build_object({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(JsonObject, "sqlite")
+def _compile_sqlite_json_object(
+    element: JsonObject, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return f"json_object({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(JsonArrayAgg)
+def _compile_json_array_agg(
+    element: JsonArrayAgg, compiler: SQLCompiler, **kw: Any
+) -> str:
+    # json_agg over no rows is NULL rather than an empty array
+    return f"coalesce(json_agg({compiler.process(element.clauses, **kw)}), '[]')"
+
+
+@compiles(JsonArrayAgg, "sqlite")
+def _compile_sqlite_json_array_agg(
+    element: JsonArrayAgg, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return f"json_group_array({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(JsonSubquery)
+def _compile_json_subquery(
+    element: JsonSubquery, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(JsonSubquery, "sqlite")
+def _compile_sqlite_json_subquery(
+    element: JsonSubquery, compiler: SQLCompiler, **kw: Any
+) -> str:
+    # SQLite returns JSON from a subquery as text, which would be nested as a string
+    return f"json({compiler.process(element.clauses, **kw)})"
+
+
+def json_object(
+    values: Mapping[str, ColumnExpressionArgument[Any]],
+) -> ColumnElement[Any]:
+    """
+    Builds a JSON object in the database. The keys are the camelCase names the DTOs
+    are serialized with, so `values` is keyed by DTO field name.
+    """
+    arguments: list[ColumnExpressionArgument[Any]] = []
+    for name, value in values.items():
+        # Field names are identifiers, a literal key keeps its type known to
+        # PostgreSQL where a bound parameter would not be
+        arguments += [literal_column(f"'{to_camel(name)}'"), value]
+
+    return JsonObject(*arguments)
+
+
+def json_array_agg(item: ColumnExpressionArgument[Any]) -> ColumnElement[Any]:
+    """
+    Aggregates `item` over the rows of a query into a JSON array, which is empty
+    when there are no rows.
+    """
+    return JsonArrayAgg(item)
+
+
+def json_subquery(stmt: Select[Any]) -> ColumnElement[Any]:
+    """
+    Nests the JSON that `stmt` selects, e.g. an aggregate of related rows, in
+    another JSON object.
+    """
+    return JsonSubquery(stmt.scalar_subquery())
@@ -0,0 +1,99 @@
+from datetime import datetime
+from typing import Any, Collection, Generic, Sequence, Type, get_args
+
+from gfmodules_python_shared.schema.sql_model import TSQLModel
+from sqlalchemy import Select, exists, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import ExecutableOption
+
+
+class LoadingMixin(Generic[TSQLModel]):
+    """
+    Relationships raise instead of loading themselves when they are accessed, so a
+    query loads the relationships its caller uses with loader options. This keeps
+    the queries of a request visible where they are made, instead of spread over
+    lazy loads in the mappers.
+    """
+
+    session: Session
+
+    @property
+    def entity(self) -> Type[TSQLModel]:
+        for base in getattr(type(self), "__orig_bases__", ()):
+            for arg in get_args(base):
+                if isinstance(arg, type):
+                    return arg  # type: ignore
+
+        raise TypeError(f"Cannot determine entity of {type(self).__name__}")
+
+    def loader_options(
+        self, expand: Collection[str] | None = None
+    ) -> list[ExecutableOption]:
+        """
+        Returns the options that load the relationships the DTO of the entity is
+        mapped from. Only the relationships listed in `expand` are loaded, all of
+        them when it is None.
+        """
+        return []
+
+    def loaded_statement(
+        self,
+        options: Sequence[ExecutableOption] = (),
+        lock: bool = False,
+        **kwargs: Any,
+    ) -> Select[tuple[TSQLModel]]:
+        """
+        Returns the query of `get_loaded`. With `lock` the row of the entity is
+        locked with SELECT ... FOR UPDATE until the transaction ends, so a check
+        made on it still holds when the entity is changed afterwards.
+        """
+        stmt = select(self.entity).filter_by(**kwargs).options(*options)
+        if lock:
+            stmt = stmt.with_for_update(of=self.entity)
+
+        return stmt
+
+    def get_loaded(
+        self,
+        options: Sequence[ExecutableOption] = (),
+        lock: bool = False,
+        **kwargs: Any,
+    ) -> TSQLModel | None:
+        stmt = self.loaded_statement(options, lock, **kwargs)
+        return self.session.scalars(stmt).first()
+
+    def get_all_loaded(
+        self, options: Sequence[ExecutableOption] = (), **kwargs: Any
+    ) -> Sequence[TSQLModel]:
+        """
+        Returns every entity matching `kwargs`, with the relationships of
+        `options` loaded.
+        """
+        stmt = self.loaded_statement(options, **kwargs)
+        return self.session.scalars(stmt).all()
+
+    def get_expanded(
+        self, expand: Collection[str] | None = None, lock: bool = False, **kwargs: Any
+    ) -> TSQLModel | None:
+        return self.get_loaded(self.loader_options(expand), lock, **kwargs)
+
+    def get_modified_at(self, lock: bool = False, **kwargs: Any) -> datetime | None:
+        """
+        Returns the `modified_at` of the entity matching `kwargs`, which its ETag is
+        derived from, without loading the entity. `lock` works as in
+        `loaded_statement`.
+        """
+        modified_at = self.entity.modified_at  # type: ignore
+        stmt = select(modified_at).filter_by(**kwargs)
+        if lock:
+            stmt = stmt.with_for_update(of=self.entity)
+
+        return self.session.scalars(stmt).first()
+
+    def exists(self, **kwargs: Any) -> bool:
+        """
+        Returns whether an entity matching `kwargs` exists, with an EXISTS query
+        that loads nothing.
+        """
+        criteria = [getattr(self.entity, key) == value for key, value in kwargs.items()]
+        return bool(self.session.execute(select(exists().where(*criteria))).scalar())
@@ -0,0 +1,218 @@
+from collections import defaultdict
+from datetime import datetime
+from itertools import chain
+from typing import Any, Type
+
+from sqlalchemy import (
+    ColumnElement,
+    ColumnExpressionArgument,
+    Subquery,
+    event,
+    select,
+    update,
+)
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Mapper,
+    Session,
+    UOWTransaction,
+    object_mapper,
+)
+from sqlalchemy.orm.attributes import instance_state
+
+from app.db.entities import (
+    Application,
+    ApplicationRole,
+    ApplicationType,
+    ApplicationVersion,
+    HealthcareProviderApplicationVersion,
+    HealthcareProviderQualification,
+    ProtocolVersion,
+)
+
+# The relationship from an entity to the resource its rows are nested in, in the
+# representation of that resource. The ETag of a resource is derived from its
+# `modified_at`, so it is bumped whenever a row nested in it changes
+CONTAINERS: dict[Type[Any], InstrumentedAttribute[Any]] = {
+    Application: Application.vendor,
+    ApplicationRole: ApplicationRole.application,
+    ApplicationType: ApplicationType.application,
+    ApplicationVersion: ApplicationVersion.application,
+    HealthcareProviderApplicationVersion: (
+        HealthcareProviderApplicationVersion.healthcare_provider
+    ),
+    HealthcareProviderQualification: HealthcareProviderQualification.healthcare_provider,
+    ProtocolVersion: ProtocolVersion.protocol,
+}
+
+_CONTAINERS_BY_TABLE = {
+    entity.__table__: container for entity, container in CONTAINERS.items()
+}
+
+
+def touch(
+    session: Session, entity: Type[Any], *criteria: ColumnExpressionArgument[bool]
+) -> None:
+    """
+    Sets `modified_at` of the rows of `entity` matching `criteria`, and of the
+    resources they are nested in, to now, with one UPDATE per level.
+    """
+    now = datetime.now()
+    table = entity.__table__
+    where: tuple[ColumnExpressionArgument[bool], ...] = criteria
+    while True:
+        session.execute(update(table).where(*where).values(modified_at=now))
+        container = _CONTAINERS_BY_TABLE.get(table)
+        if container is None:
+            return
+
+        where = (_contains(container, select(table).where(*where).subquery()),)
+        table = container.property.mapper.class_.__table__
+
+
+def touch_containers(
+    session: Session, entity: Type[Any], *criteria: ColumnExpressionArgument[bool]
+) -> None:
+    """
+    Bumps the resources that the rows of `entity` matching `criteria` are nested
+    in, after the rows were written with a statement the flush does not see.
+    """
+    container = CONTAINERS.get(entity)
+    if container is not None:
+        rows = select(entity.__table__).where(*criteria).subquery()
+        touch(session, container.property.mapper.class_, _contains(container, rows))
+
+
+def touch_deleted(
+    session: Session, entity: Type[Any], *criteria: ColumnExpressionArgument[bool]
+) -> None:
+    """
+    Bumps the resources that lose nested rows when the rows of `entity` matching
+    `criteria` are deleted, including the rows the ON DELETE CASCADE of the foreign
+    keys reaches. Called before the delete, while the rows can still be found.
+    """
+    table = entity.__table__
+    deleted = {table: select(table).where(*criteria).subquery()}
+    pending = [table]
+    while pending:
+        table = pending.pop()
+        rows = deleted[table]
+        for child in table.metadata.tables.values():
+            for key in child.foreign_keys:
+                if (
+                    key.column.table is table
+                    and (key.ondelete or "").upper() == "CASCADE"
+                    and child not in deleted
+                ):
+                    deleted[child] = (
+                        select(child)
+                        .where(key.parent.in_(select(rows.c[key.column.name])))
+                        .subquery()
+                    )
+                    pending.append(child)
+
+    for table, rows in deleted.items():
+        container = _CONTAINERS_BY_TABLE.get(table)
+        if (
+            container is not None
+            and container.property.mapper.class_.__table__ not in deleted
+        ):
+            touch(session, container.property.mapper.class_, _contains(container, rows))
+
+
+def identifies(mapper: Mapper[Any], instance: Any) -> list[ColumnElement[bool]]:
+    """
+    Returns the criteria that select the row of `instance`.
+    """
+    return [
+        column == value
+        for column, value in zip(
+            mapper.primary_key, mapper.primary_key_from_instance(instance)
+        )
+    ]
+
+
+def _contains(
+    container: InstrumentedAttribute[Any], rows: Subquery
+) -> ColumnElement[bool]:
+    """
+    Returns the criterion that selects the rows `container` refers to from `rows`.
+    """
+    [(local, remote)] = container.property.local_remote_pairs
+    return remote.in_(select(rows.c[local.name]))
+
+
+@event.listens_for(Session, "before_flush")
+def _touch_flushed_containers(
+    session: Session, flush_context: UOWTransaction, instances: Any
+) -> None:
+    """
+    Bumps `modified_at` of the entities the flush changes, also when only their
+    collections changed, which the onupdate of the column does not see, and of the
+    resources the changed entities are nested in.
+    """
+    now = datetime.now()
+    pending = list(
+        chain(
+            session.new,
+            session.deleted,
+            (instance for instance in session.dirty if session.is_modified(instance)),
+        )
+    )
+    seen: set[int] = set()
+    container_ids: defaultdict[InstrumentedAttribute[Any], set[Any]] = defaultdict(set)
+    while pending:
+        instance = pending.pop()
+        if id(instance) in seen:
+            continue
+        seen.add(id(instance))
+
+        state = instance_state(instance)
+        if instance in session.deleted:
+            _touch_deleted_instance(session, instance)
+            continue
+
+        if state.persistent:
+            if "modified_at" in state.mapper.columns:
+                instance.modified_at = now
+            # Orphans are deleted by the flush, after this hook
+            for relationship in state.mapper.relationships:
+                if relationship.cascade.delete_orphan:
+                    for orphan in state.attrs[relationship.key].history.deleted:
+                        _touch_deleted_instance(session, orphan)
+
+        container = CONTAINERS.get(type(instance))
+        if container is None:
+            continue
+
+        containers = [
+            value
+            for value in chain(*state.attrs[container.key].history)
+            if value is not None
+        ]
+        if containers:
+            pending.extend(containers)
+            continue
+
+        [(local, _)] = container.property.local_remote_pairs
+        container_id = state.dict.get(state.mapper.get_property_by_column(local).key)
+        if container_id is None:
+            continue
+
+        container_mapper = container.property.mapper
+        loaded = session.identity_map.get(
+            container_mapper.identity_key_from_primary_key([container_id])
+        )
+        if loaded is not None:
+            pending.append(loaded)
+        else:
+            container_ids[container].add(container_id)
+
+    for container, ids in container_ids.items():
+        [(_, remote)] = container.property.local_remote_pairs
+        touch(session, container.property.mapper.class_, remote.in_(ids))
+
+
+def _touch_deleted_instance(session: Session, instance: Any) -> None:
+    mapper = object_mapper(instance)
+    touch_deleted(session, type(instance), *identifies(mapper, instance))
@@ -0,0 +1,82 @@
+from typing import Any, Mapping, Sequence, Type, TypeVar
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import InstrumentedAttribute, Session, class_mapper
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.db.repository.modification import identifies, touch_containers
+
+T = TypeVar("T")
+
+
+class OnConflictMixin:
+    """
+    Inserts that let the database decide whether a row already exists, with
+    INSERT ... ON CONFLICT DO NOTHING. Unlike a lookup followed by an insert, this
+    takes a single round trip and concurrent inserts of the same row cannot fail
+    with an IntegrityError.
+    """
+
+    session: Session
+
+    def insert_unique(
+        self,
+        entity: Type[T],
+        values: Mapping[str, Any],
+        relationships: Mapping[str, Any] | None = None,
+    ) -> T | None:
+        """
+        Inserts one row and returns it as an entity of the session, or None when it
+        conflicts with an existing row. The collections of the new entity are known
+        to be empty, and `relationships` sets the ones whose value is known, such as
+        the parent it refers to, so neither is loaded when accessed.
+        """
+        stmt = (
+            self._insert(entity)
+            .values(**values)
+            .on_conflict_do_nothing()
+            .returning(entity)
+        )
+        new: T | None = self.session.scalars(stmt).one_or_none()
+        if new is None:
+            return None
+
+        for relationship in class_mapper(entity).relationships:
+            if relationship.uselist:
+                set_committed_value(new, relationship.key, [])
+        for key, value in (relationships or {}).items():
+            set_committed_value(new, key, value)
+
+        touch_containers(self.session, entity, *identifies(class_mapper(entity), new))
+        return new
+
+    def insert_missing(
+        self,
+        entity: Type[Any],
+        rows: Sequence[Mapping[str, Any]],
+        returning: InstrumentedAttribute[Any],
+    ) -> set[Any]:
+        """
+        Inserts the rows of `rows` that do not conflict with an existing row and
+        returns the `returning` column of the rows that were inserted. Rows that
+        already exist are left untouched.
+        """
+        if not rows:
+            return set()
+
+        stmt = self._insert(entity).on_conflict_do_nothing().returning(returning)
+        inserted = set(self.session.scalars(stmt, rows).all())
+        if inserted:
+            touch_containers(self.session, entity, returning.in_(inserted))
+        return inserted
+
+    def _insert(self, entity: Type[Any]) -> postgresql.Insert | sqlite.Insert:
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(entity)
+        if dialect == "sqlite":
+            return sqlite.insert(entity)
+
+        raise NotImplementedError(
+            f"INSERT ... ON CONFLICT is not supported on {dialect}"
+        )
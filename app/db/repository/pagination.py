@@ -0,0 +1,243 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Generic, NamedTuple, Sequence, TypeVar
+from uuid import UUID
+
+from gfmodules_python_shared.schema.sql_model import TSQLModel
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    ScalarResult,
+    Select,
+    Text,
+    cast,
+    func,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import ExecutableOption
+
+from app.db.repository.loading import LoadingMixin
+from app.exceptions.app_exceptions import InvalidCursorException
+from app.schemas.enums.count_mode import CountMode
+from app.schemas.filter_query_params.schema import TimestampFilterQueryParams
+
+T = TypeVar("T")
+
+
+class KeysetCursor(NamedTuple):
+    """
+    Position of the last row of a page in the stable (created_at, id) ordering.
+    """
+
+    created_at: datetime
+    id: UUID
+
+
+class PageResult(NamedTuple, Generic[T]):
+    items: Sequence[T]
+    next_cursor: str | None
+    total: int | None
+
+
+def encode_cursor(entity: Any) -> str:
+    payload = json.dumps([entity.created_at.isoformat(), str(entity.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> KeysetCursor:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, entity_id = json.loads(base64.urlsafe_b64decode(padded))
+        return KeysetCursor(
+            created_at=datetime.fromisoformat(created_at), id=UUID(entity_id)
+        )
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise InvalidCursorException() from e
+
+
+class KeysetPaginationMixin(LoadingMixin[TSQLModel]):
+    """
+    Adds keyset pagination to a repository. Rows are ordered by (created_at, id)
+    descending, so a page can be continued from the last row of the previous one
+    without scanning and discarding the rows before it like OFFSET does.
+    """
+
+    session: Session
+
+    def keyset_statement(self) -> Select[tuple[TSQLModel]]:
+        return select(self.entity).order_by(
+            self.entity.created_at.desc(),  # type: ignore
+            self.entity.id.desc(),  # type: ignore
+        )
+
+    def timestamp_criteria(
+        self, filters: TimestampFilterQueryParams | None
+    ) -> list[ColumnElement[bool]]:
+        """
+        Returns the criteria for `get_page` and `get_json_page` that keep the
+        entities created and modified within the ranges of `filters`.
+        """
+        if filters is None:
+            return []
+
+        created_at = self.entity.created_at  # type: ignore
+        modified_at = self.entity.modified_at  # type: ignore
+        criteria: list[ColumnElement[bool]] = []
+        if filters.created_after is not None:
+            criteria.append(created_at > filters.created_after)
+        if filters.created_before is not None:
+            criteria.append(created_at < filters.created_before)
+        if filters.modified_after is not None:
+            criteria.append(modified_at > filters.modified_after)
+        if filters.modified_before is not None:
+            criteria.append(modified_at < filters.modified_before)
+
+        return criteria
+
+    def exact_count(self, criteria: Sequence[ColumnElement[bool]] = ()) -> int:
+        stmt = select(func.count()).select_from(self.entity).where(*criteria)
+        return self.session.execute(stmt).scalar_one()
+
+    def estimated_count(self) -> int:
+        """
+        Returns the row estimate the planner keeps in pg_class. It is updated by
+        VACUUM and ANALYZE, so it lags behind recent writes. Falls back to an exact
+        count on other databases or when the table has never been analyzed.
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            return self.exact_count()
+
+        stmt = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:name AS regclass)"
+        )
+        estimate = self.session.execute(
+            stmt, {"name": self.entity.__tablename__}
+        ).scalar()
+        if estimate is None or estimate < 0:
+            return self.exact_count()
+
+        return int(estimate)
+
+    def get_page(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode | None = CountMode.EXACT,
+        options: Sequence[ExecutableOption] = (),
+        criteria: Sequence[ColumnElement[bool]] = (),
+    ) -> PageResult[TSQLModel]:
+        """
+        Returns a page of at most `limit` entities. When a cursor is given the page
+        continues after the cursor position and the offset is ignored. One extra
+        row is fetched to find out whether a next page exists.
+
+        The total is left out when no count mode is given. In window mode the total
+        is read from a count(*) over () column of the page query itself, so the page
+        costs a single round trip.
+
+        `options` are applied to the page query, e.g. loader options for the
+        relationships the caller maps. Only the entities that match all `criteria`
+        are paged and counted.
+        """
+        stmt = self.keyset_statement().options(*options)
+        rows, total = self._page_rows(stmt, limit, offset, cursor, count_mode, criteria)
+        entities: Sequence[TSQLModel] = [row[0] for row in rows]
+        if len(entities) <= limit:
+            return PageResult(items=entities, next_cursor=None, total=total)
+
+        entities = entities[:limit]
+        return PageResult(
+            items=entities, next_cursor=encode_cursor(entities[-1]), total=total
+        )
+
+    def get_json_page(
+        self,
+        item: ColumnElement[Any],
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        count_mode: CountMode | None = CountMode.EXACT,
+        criteria: Sequence[ColumnElement[bool]] = (),
+    ) -> PageResult[str]:
+        """
+        Returns a page like `get_page`, but every row is rendered to JSON by the
+        database with the `item` expression instead of loaded as an entity.
+        """
+        stmt = self.keyset_statement().with_only_columns(
+            cast(item, Text).label("item"),
+            self.entity.created_at,  # type: ignore
+            self.entity.id,  # type: ignore
+        )
+        rows, total = self._page_rows(stmt, limit, offset, cursor, count_mode, criteria)
+        items = [row.item for row in rows[:limit]]
+        if len(rows) <= limit:
+            return PageResult(items=items, next_cursor=None, total=total)
+
+        return PageResult(
+            items=items, next_cursor=encode_cursor(rows[limit - 1]), total=total
+        )
+
+    def _page_rows(
+        self,
+        stmt: Select[Any],
+        limit: int,
+        offset: int,
+        cursor: str | None,
+        count_mode: CountMode | None,
+        criteria: Sequence[ColumnElement[bool]],
+    ) -> tuple[Sequence[Row[Any]], int | None]:
+        stmt = stmt.where(*criteria).limit(limit + 1)
+        if cursor is not None:
+            position = decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(self.entity.created_at, self.entity.id)  # type: ignore
+                < (position.created_at, position.id)
+            )
+        else:
+            stmt = stmt.offset(offset)
+
+        total: int | None = None
+        if count_mode is CountMode.WINDOW and cursor is None:
+            rows = self.session.execute(
+                stmt.add_columns(func.count().over().label("total"))
+            ).all()
+            if rows:
+                total = rows[0].total
+            elif offset == 0:
+                total = 0
+        else:
+            rows = self.session.execute(stmt).all()
+
+        # The planner estimate covers the whole table, so filtered pages are counted
+        if total is None and count_mode is not None:
+            total = (
+                self.estimated_count()
+                if count_mode is CountMode.ESTIMATED and not criteria
+                else self.exact_count(criteria)
+            )
+
+        return rows, total
+
+    def stream(
+        self, batch_size: int = 500, options: Sequence[ExecutableOption] = ()
+    ) -> ScalarResult[TSQLModel]:
+        """
+        Returns all entities in keyset order. Rows are fetched from a server-side
+        cursor in batches of `batch_size`, so memory use does not grow with the size
+        of the table. The session must stay open while the result is consumed.
+
+        `options` are applied to the query. Rows are loaded per batch, so
+        collections must be loaded with selectinload rather than joinedload.
+        """
+        stmt = (
+            self.keyset_statement()
+            .options(*options)
+            .execution_options(yield_per=batch_size)
+        )
+        return self.session.scalars(stmt)
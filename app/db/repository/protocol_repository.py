@@ -1,15 +1,26 @@
 import logging
-from typing import Any
+from typing import Any, Collection
 
 from gfmodules_python_shared.repository.base import RepositoryBase
 from sqlalchemy import ColumnExpressionArgument
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
 from app.db.entities.protocol import Protocol
+from app.db.repository.bulk import BulkMixin
+from app.db.repository.pagination import KeysetPaginationMixin
 
 logger = logging.getLogger(__name__)
 
 
-class ProtocolRepository(RepositoryBase[Protocol]):
+class ProtocolRepository(
+    RepositoryBase[Protocol], KeysetPaginationMixin[Protocol], BulkMixin
+):
     @property
     def order_by(self) -> tuple[ColumnExpressionArgument[Any] | str, ...]:
-        return (Protocol.created_at.desc(),)
+        return (Protocol.created_at.desc(), Protocol.id.desc())
+
+    def loader_options(
+        self, expand: Collection[str] | None = None
+    ) -> list[ExecutableOption]:
+        return [selectinload(Protocol.versions)]
@@ -1,15 +1,130 @@
 import logging
-from typing import Any
+from datetime import date, datetime
+from typing import Any, Collection, List, Type
+from uuid import UUID
 
 from gfmodules_python_shared.repository.base import RepositoryBase
-from sqlalchemy import ColumnExpressionArgument
+from sqlalchemy import ColumnExpressionArgument, select, update
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
-from app.db.entities import ProtocolVersion
+from app.db.entities import (
+    HealthcareProviderQualification,
+    ProtocolApplicationQualification,
+    ProtocolVersion,
+)
+from app.db.repository.bulk import BulkMixin
+from app.db.repository.loading import LoadingMixin
+from app.db.repository.modification import touch_containers
+from app.db.repository.on_conflict import OnConflictMixin
 
 logger = logging.getLogger(__name__)
 
+Qualification = Type[ProtocolApplicationQualification | HealthcareProviderQualification]
+
+
+class ProtocolVersionRepository(
+    RepositoryBase[ProtocolVersion],
+    LoadingMixin[ProtocolVersion],
+    BulkMixin,
+    OnConflictMixin,
+):
+    """
+    The qualification methods work on the qualifications of one protocol version.
+    `key` names the column of `entity` that refers to the qualified application
+    version or healthcare provider.
+    """
 
-class ProtocolVersionRepository(RepositoryBase[ProtocolVersion]):
     @property
     def order_by(self) -> tuple[ColumnExpressionArgument[Any] | str, ...]:
-        return (ProtocolVersion.created_at.desc(),)
+        return (ProtocolVersion.created_at.desc(), ProtocolVersion.id.desc())
+
+    def loader_options(
+        self, expand: Collection[str] | None = None
+    ) -> list[ExecutableOption]:
+        return [
+            selectinload(ProtocolVersion.qualified_application_versions).joinedload(
+                ProtocolApplicationQualification.application_version
+            )
+        ]
+
+    def qualify(
+        self,
+        entity: Qualification,
+        key: str,
+        protocol_version_id: UUID,
+        ids: Collection[UUID],
+        qualification_date: date,
+    ) -> set[UUID]:
+        """
+        Qualifies `ids` for the protocol version and returns the ones that were not
+        qualified before.
+        """
+        return self.insert_missing(
+            entity,
+            [
+                {
+                    key: id,
+                    "protocol_version_id": protocol_version_id,
+                    "qualification_date": qualification_date,
+                }
+                for id in ids
+            ],
+            returning=getattr(entity, key),
+        )
+
+    def archive(
+        self,
+        entity: Qualification,
+        key: str,
+        protocol_version_id: UUID,
+        ids: Collection[UUID] | None = None,
+    ) -> List[UUID]:
+        """
+        Archives the active qualifications of `ids`, or of everything qualified for
+        the protocol version when `ids` is None, and returns the archived ids.
+        """
+        column = getattr(entity, key)
+        stmt = (
+            update(entity)
+            .where(
+                entity.protocol_version_id == protocol_version_id,
+                entity.archived_date.is_(None),
+            )
+            .values(archived_date=datetime.now())
+            .returning(column)
+        )
+        if ids is not None:
+            stmt = stmt.where(column.in_(ids))
+
+        archived = list(self.session.scalars(stmt).all())
+        if archived:
+            touch_containers(
+                self.session,
+                entity,
+                entity.protocol_version_id == protocol_version_id,
+                column.in_(archived),
+            )
+        return archived
+
+    def archived(
+        self,
+        entity: Qualification,
+        key: str,
+        protocol_version_id: UUID,
+        ids: Collection[UUID],
+    ) -> set[UUID]:
+        """
+        Returns the ids of `ids` whose qualification for the protocol version is
+        archived.
+        """
+        if not ids:
+            return set()
+
+        column = getattr(entity, key)
+        stmt = select(column).where(
+            entity.protocol_version_id == protocol_version_id,
+            entity.archived_date.is_not(None),
+            column.in_(ids),
+        )
+        return set(self.session.scalars(stmt).all())
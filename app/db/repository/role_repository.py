@@ -5,11 +5,21 @@ from gfmodules_python_shared.repository.base import RepositoryBase
 from sqlalchemy import ColumnExpressionArgument
 
 from app.db.entities import Role
+from app.db.repository.bulk import BulkMixin
+from app.db.repository.detached import AttachMixin
+from app.db.repository.on_conflict import OnConflictMixin
+from app.db.repository.pagination import KeysetPaginationMixin
 
 logger = logging.getLogger(__name__)
 
 
-class RoleRepository(RepositoryBase[Role]):
+class RoleRepository(
+    RepositoryBase[Role],
+    KeysetPaginationMixin[Role],
+    AttachMixin[Role],
+    BulkMixin,
+    OnConflictMixin,
+):
     @property
     def order_by(self) -> tuple[ColumnExpressionArgument[Any] | str, ...]:
-        return (Role.created_at.desc(),)
+        return (Role.created_at.desc(), Role.id.desc())
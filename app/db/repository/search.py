@@ -0,0 +1,120 @@
+import base64
+import binascii
+import json
+from typing import Any, NamedTuple, Sequence
+from uuid import UUID
+
+from gfmodules_python_shared.schema.sql_model import TSQLModel
+from sqlalchemy import (
+    Select,
+    case,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from app.db.repository.loading import LoadingMixin
+from app.db.repository.pagination import PageResult
+from app.exceptions.app_exceptions import InvalidCursorException
+from app.schemas.enums.search_hit_type import SearchHitType
+
+
+class SearchHit(NamedTuple):
+    type: SearchHitType
+    id: UUID
+    name: str
+    rank: int
+
+
+class SearchCursor(NamedTuple):
+    """
+    Position of the last hit of a page in the (rank, name, id) ordering.
+    """
+
+    rank: int
+    name: str
+    id: UUID
+
+
+def encode_search_cursor(hit: SearchHit) -> str:
+    payload = json.dumps([hit.rank, hit.name, str(hit.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> SearchCursor:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, name, hit_id = json.loads(base64.urlsafe_b64decode(padded))
+        return SearchCursor(rank=int(rank), name=str(name), id=UUID(hit_id))
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise InvalidCursorException() from e
+
+
+def escape_like(query: str) -> str:
+    return query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class SearchMixin(LoadingMixin[TSQLModel]):
+    """
+    Adds the entity to the search. A repository sets `search_type` and the
+    `search_columns` that are matched with ILIKE, which trigram indexes serve on
+    PostgreSQL. The first of them names a hit.
+    """
+
+    search_type: SearchHitType
+    search_columns: tuple[InstrumentedAttribute[str], ...]
+
+    def search_statement(self, query: str) -> Select[Any]:
+        """
+        Returns the hits of `query` as (type, id, name, rank) rows. A column that
+        equals the query ranks 0, one that starts with it 1, one that contains it 2.
+        """
+        columns = self.search_columns
+        pattern = escape_like(query)
+        exact = [func.lower(column) == query.lower() for column in columns]
+        prefix = [column.ilike(f"{pattern}%", escape="\\") for column in columns]
+        contains = [column.ilike(f"%{pattern}%", escape="\\") for column in columns]
+        rank = case((or_(*exact), 0), (or_(*prefix), 1), else_=2)
+        return select(
+            literal(self.search_type.value).label("type"),
+            self.entity.id.label("id"),  # type: ignore
+            columns[0].label("name"),
+            rank.label("rank"),
+        ).where(or_(*contains))
+
+
+def search_page(
+    session: Session,
+    statements: Sequence[Select[Any]],
+    limit: int,
+    cursor: str | None = None,
+) -> PageResult[SearchHit]:
+    """
+    Returns a page of at most `limit` hits of the `search_statement`s, best ranked
+    first and by name within a rank. A cursor continues the page after the last
+    hit of the previous one. Hits are not counted, the total is always None.
+    """
+    hits = union_all(*statements).subquery()
+    stmt = select(hits).order_by(hits.c.rank, hits.c.name, hits.c.id).limit(limit + 1)
+    if cursor is not None:
+        position = decode_search_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(hits.c.rank, hits.c.name, hits.c.id)
+            > (position.rank, position.name, position.id)
+        )
+
+    rows = session.execute(stmt).all()
+    items = [
+        SearchHit(type=SearchHitType(row.type), id=row.id, name=row.name, rank=row.rank)
+        for row in rows[:limit]
+    ]
+    if len(rows) <= limit:
+        return PageResult(items=items, next_cursor=None, total=None)
+
+    return PageResult(
+        items=items, next_cursor=encode_search_cursor(items[-1]), total=None
+    )
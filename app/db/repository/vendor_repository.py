@@ -1,15 +1,120 @@
 import logging
-from typing import Any
+from typing import Any, Callable, Collection
+from uuid import UUID
 
 from gfmodules_python_shared.repository.base import RepositoryBase
-from sqlalchemy import ColumnExpressionArgument
+from sqlalchemy import ColumnElement, ColumnExpressionArgument, or_, select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
-from app.db.entities import Vendor
+from app.db.entities import Application, Vendor
+from app.db.repository.application_repository import (
+    application_children_options,
+    application_roles_json,
+    application_system_types_json,
+    application_versions_json,
+)
+from app.db.repository.bulk import BulkMixin
+from app.db.repository.json_objects import (
+    json_array_agg,
+    json_object,
+    json_subquery,
+)
+from app.db.repository.on_conflict import OnConflictMixin
+from app.db.repository.pagination import KeysetPaginationMixin
+from app.db.repository.search import SearchMixin
+from app.schemas.enums.search_hit_type import SearchHitType
 
 logger = logging.getLogger(__name__)
 
 
-class VendorRepository(RepositoryBase[Vendor]):
+def vendor_applications_json() -> ColumnElement[Any]:
+    return json_subquery(
+        select(
+            json_array_agg(
+                json_object(
+                    {
+                        "name": Application.name,
+                        "id": Application.id,
+                        "created_at": Application.created_at,
+                        "modified_at": Application.modified_at,
+                        "versions": application_versions_json(),
+                        "roles": application_roles_json(),
+                        "system_types": application_system_types_json(),
+                    }
+                )
+            )
+        ).where(Application.vendor_id == Vendor.id)
+    )
+
+
+class VendorRepository(
+    RepositoryBase[Vendor],
+    KeysetPaginationMixin[Vendor],
+    SearchMixin[Vendor],
+    BulkMixin,
+    OnConflictMixin,
+):
+    search_type = SearchHitType.VENDOR
+    search_columns = (Vendor.trade_name, Vendor.statutory_name, Vendor.kvk_number)
+
     @property
     def order_by(self) -> tuple[ColumnExpressionArgument[Any] | str, ...]:
-        return (Vendor.created_at.desc(),)
+        return (Vendor.created_at.desc(), Vendor.id.desc())
+
+    def loader_options(
+        self, expand: Collection[str] | None = None
+    ) -> list[ExecutableOption]:
+        if expand is not None and "applications" not in expand:
+            return []
+
+        return [
+            selectinload(Vendor.applications).options(*application_children_options())
+        ]
+
+    def json_item(self, fields: Collection[str] | None) -> ColumnElement[Any]:
+        """
+        Returns the expression that renders a vendor as the JSON of its DTO, for
+        `get_json_page`. Only the DTO fields in `fields` are rendered, all of them
+        when it is None.
+        """
+        values: dict[str, Callable[[], ColumnExpressionArgument[Any]]] = {
+            "kvk_number": lambda: Vendor.kvk_number,
+            "trade_name": lambda: Vendor.trade_name,
+            "statutory_name": lambda: Vendor.statutory_name,
+            "id": lambda: Vendor.id,
+            "applications": vendor_applications_json,
+        }
+        return json_object(
+            {
+                name: value()
+                for name, value in values.items()
+                if fields is None or name in fields
+            }
+        )
+
+    def in_use(self, vendor_ids: Collection[UUID]) -> set[UUID]:
+        """
+        Returns the ids of `vendor_ids` that have applications, in one query that
+        loads no applications.
+        """
+        if not vendor_ids:
+            return set()
+
+        stmt = select(Vendor.id).where(
+            Vendor.id.in_(vendor_ids), Vendor.applications.any()
+        )
+        return set(self.session.scalars(stmt).all())
+
+    def taken_names(
+        self, kvk_numbers: Collection[str], trade_names: Collection[str]
+    ) -> tuple[set[str], set[str]]:
+        """
+        Returns the KVK numbers and trade names of `kvk_numbers` and `trade_names`
+        that are in use, in one query.
+        """
+        stmt = select(Vendor.kvk_number, Vendor.trade_name).where(
+            or_(Vendor.kvk_number.in_(kvk_numbers), Vendor.trade_name.in_(trade_names))
+        )
+        rows = self.session.execute(stmt).all()
+        return {row.kvk_number for row in rows}, {row.trade_name for row in rows}
@@ -15,6 +15,7 @@ from .protocol_application_qualification_service import (
 from .protocol_service import ProtocolService
 from .protocol_version_service import ProtocolVersionService
 from .roles_service import RoleService
+from .search_service import SearchService
 from .system_type_service import SystemTypeService
 from .vendors_service import VendorService
 from ._type import Service
@@ -33,6 +34,7 @@ __all__ = [
     "ProtocolService",
     "ProtocolVersionService",
     "RoleService",
+    "SearchService",
     "SystemTypeService",
     "VendorService",
 ]
@@ -16,6 +16,7 @@ from .protocol_application_qualification_service import (
 from .protocol_service import ProtocolService
 from .protocol_version_service import ProtocolVersionService
 from .roles_service import RoleService
+from .search_service import SearchService
 from .system_type_service import SystemTypeService
 from .vendors_service import VendorService
 
@@ -32,6 +33,7 @@ Service: TypeAlias = Union[
     ProtocolVersionService,
     ProtocolApplicationQualificationService,
     RoleService,
+    SearchService,
     SystemTypeService,
     VendorService,
 ]
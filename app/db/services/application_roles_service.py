@@ -1,9 +1,6 @@
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
-    get_repository,
-)
+from app.db.session_manager import get_repository, session_manager
 
 from app.db.entities import Application
 from app.db.repository import ApplicationRepository, RoleRepository
@@ -34,7 +31,7 @@ class ApplicationRolesService:
         application_repository: ApplicationRepository = get_repository(),
         role_repository: RoleRepository = get_repository(),
     ) -> Application:
-        application = application_repository.get(id=application_id)
+        application = application_repository.get_expanded(id=application_id)
         if application is None:
             raise ApplicationNotFoundException()
 
@@ -46,10 +43,7 @@ class ApplicationRolesService:
             if app_role.role_id == role_id:
                 raise RoleExistInApplicationException()
 
-        new_application_role = ApplicationRolesFactory.create_instance(
-            application=application, role=role
-        )
-        application.roles.append(new_application_role)
+        ApplicationRolesFactory.create_instance(application=application, role=role)
         return application
 
     @session_manager
@@ -61,7 +55,7 @@ class ApplicationRolesService:
         application_repository: ApplicationRepository = get_repository(),
         role_repository: RoleRepository = get_repository(),
     ) -> Application:
-        application = application_repository.get(id=application_id)
+        application = application_repository.get_expanded(id=application_id)
         if application is None:
             raise ApplicationNotFoundException()
 
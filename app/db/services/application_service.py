@@ -1,45 +1,104 @@
-from typing import Sequence, List
+from datetime import datetime
+from typing import Collection, Sequence, List, Iterator
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
+from app.db.session_manager import (
     get_repository,
+    session_manager,
+    streaming_session,
 )
-
 from app.db.repository import RoleRepository, SystemTypeRepository, VendorRepository
-from app.db.entities import Application
+from app.db.entities import (
+    Application,
+    ApplicationRole,
+    ApplicationType,
+    ApplicationVersion,
+    Role,
+    SystemType,
+    Vendor,
+)
 from app.db.repository import ApplicationRepository
+from app.db.repository.modification import touch
+from app.db.services.roles_service import RoleService
+from app.db.services.system_type_service import SystemTypeService
 from app.exceptions.app_exceptions import (
     ApplicationNotFoundException,
     ApplicationAlreadyExistsException,
+    RoleNotFoundException,
+    SystemTypeNotFoundException,
+    VendorNotFoundException,
 )
 from app.factory import ApplicationFactory
-from app.schemas.application.mapper import map_application_entity_to_dto
-from app.schemas.application.schema import ApplicationDto
-from app.schemas.meta.schema import Page
+from app.schemas.application.mapper import (
+    map_application_entities_to_dtos,
+    map_application_entity_to_dto,
+)
+from app.schemas.application.schema import ApplicationCreateDto, ApplicationDto
+from app.schemas.enums.bulk_item_status import BulkItemStatus
+from app.schemas.enums.count_mode import CountMode
+from app.schemas.filter_query_params.schema import ApplicationFilterQueryParams
+from app.schemas.mapping import json_page
+from app.schemas.meta.schema import BulkItemResult, Page
 
 
 class ApplicationService:
+    def __init__(
+        self,
+        role_service: RoleService,
+        system_type_service: SystemTypeService,
+        json_pages: bool = False,
+    ) -> None:
+        self.role_service = role_service
+        self.system_type_service = system_type_service
+        # Serve list pages from get_paginated_json instead of get_paginated
+        self.json_pages = json_pages
+
     @session_manager
     def get_by_vendor_id(
-        self, vendor_id: UUID, *, vendor_repository: VendorRepository = get_repository()
+        self,
+        vendor_id: UUID,
+        *,
+        application_repository: ApplicationRepository = get_repository(),
+        vendor_repository: VendorRepository = get_repository(),
     ) -> Sequence[Application]:
-        vendor = vendor_repository.get_or_fail(id=vendor_id)
-        return vendor.applications
+        if not vendor_repository.exists(id=vendor_id):
+            raise VendorNotFoundException()
+
+        return application_repository.get_all_loaded(
+            application_repository.loader_options(), vendor_id=vendor_id
+        )
 
     @session_manager
     def get_one(
         self,
         application_id: UUID,
+        expand: Collection[str] | None = None,
+        lock: bool = False,
         *,
         application_repository: ApplicationRepository = get_repository(),
     ) -> Application:
-        application = application_repository.get(id=application_id)
+        application = application_repository.get_expanded(
+            expand, lock, id=application_id
+        )
         if application is None:
             raise ApplicationNotFoundException()
 
         return application
 
+    @session_manager
+    def get_modified_at(
+        self,
+        application_id: UUID,
+        lock: bool = False,
+        *,
+        application_repository: ApplicationRepository = get_repository(),
+    ) -> datetime:
+        modified_at = application_repository.get_modified_at(lock, id=application_id)
+        if modified_at is None:
+            raise ApplicationNotFoundException()
+
+        return modified_at
+
     @session_manager
     def remove_one(
         self,
@@ -47,12 +106,13 @@ class ApplicationService:
         *,
         application_repository: ApplicationRepository = get_repository(),
     ) -> Application:
-        application = self.get_one(application_id)
-        if application is None:
+        deleted = application_repository.delete_returning(
+            Application, Application.id == application_id
+        )
+        if not deleted:
             raise ApplicationNotFoundException()
 
-        application_repository.delete(application)
-        return application
+        return deleted[0]
 
     @session_manager
     def remove_one_by_name(
@@ -62,14 +122,15 @@ class ApplicationService:
         *,
         application_repository: ApplicationRepository = get_repository(),
     ) -> Application:
-        application = application_repository.get(
-            name=application_name, vendor_id=vendor_id
+        deleted = application_repository.delete_returning(
+            Application,
+            Application.name == application_name,
+            Application.vendor_id == vendor_id,
         )
-        if application is None:
+        if not deleted:
             raise ApplicationNotFoundException()
 
-        application_repository.delete(application)
-        return application
+        return deleted[0]
 
     @session_manager
     def add_one(
@@ -87,39 +148,239 @@ class ApplicationService:
     ) -> Application:
         vendor = vendor_repository.get_or_fail(id=vendor_id)
 
-        system_types = system_type_repository.get_by_property_exact(
-            "name", system_type_names
-        )
-
-        roles = roles_repository.get_by_property_exact("name", role_names)
+        # Names are resolved through the cached reference data and the rows are
+        # attached without loading them, so registering does not query them
+        system_types = [
+            system_type_repository.attach(
+                SystemType(
+                    id=system_type.id,
+                    name=system_type.name,
+                    description=system_type.description,
+                )
+            )
+            for system_type in self.system_type_service.resolve_names(system_type_names)
+        ]
+        roles = [
+            roles_repository.attach(
+                Role(id=role.id, name=role.name, description=role.description)
+            )
+            for role in self.role_service.resolve_names(role_names)
+        ]
 
-        application = application_repository.get(
-            name=application_name, vendor_id=vendor.id
+        new_application = application_repository.insert_unique(
+            Application,
+            {"name": application_name, "vendor_id": vendor.id},
+            relationships={"vendor": vendor},
         )
-        if application is not None:
+        if new_application is None:
             raise ApplicationAlreadyExistsException()
 
-        new_application = ApplicationFactory.create_instance(
-            application_name=application_name,
+        ApplicationFactory.add_children(
+            new_application,
             application_version=version,
-            vendor=vendor,
             application_roles=roles,
             application_types=system_types,
         )
-        application_repository.create(new_application)
 
         return new_application
 
+    @session_manager
+    def add_many(
+        self,
+        applications: Sequence[ApplicationCreateDto],
+        *,
+        application_repository: ApplicationRepository = get_repository(),
+    ) -> List[BulkItemResult]:
+        """
+        Registers a batch of applications, each with its first version, roles and
+        system types, in one transaction. Applications whose name is in use by
+        their vendor, or taken by an earlier application of the batch, are reported
+        as a conflict, and applications with an unknown vendor, role or system type
+        as not found.
+        """
+        vendor_ids = application_repository.existing_ids(
+            Vendor, {application.vendor_id for application in applications}
+        )
+        roles = {
+            role.name: role.id
+            for role in self.role_service.resolve_names(
+                list({name for app in applications for name in app.roles}),
+                missing_ok=True,
+            )
+        }
+        system_types = {
+            system_type.name: system_type.id
+            for system_type in self.system_type_service.resolve_names(
+                list({name for app in applications for name in app.system_types}),
+                missing_ok=True,
+            )
+        }
+        taken_names = application_repository.taken_names(
+            [(application.vendor_id, application.name) for application in applications]
+        )
+        results: dict[int, BulkItemResult] = {}
+        new_applications: dict[int, ApplicationCreateDto] = {}
+        for index, application in enumerate(applications):
+            name = (application.vendor_id, application.name)
+            if application.vendor_id not in vendor_ids:
+                results[index] = BulkItemResult.failed(index, VendorNotFoundException())
+            elif not roles.keys() >= set(application.roles):
+                results[index] = BulkItemResult.failed(index, RoleNotFoundException())
+            elif not system_types.keys() >= set(application.system_types):
+                results[index] = BulkItemResult.failed(
+                    index, SystemTypeNotFoundException()
+                )
+            elif name in taken_names:
+                results[index] = BulkItemResult.failed(
+                    index, ApplicationAlreadyExistsException()
+                )
+            else:
+                taken_names.add(name)
+                new_applications[index] = application
+
+        application_ids = application_repository.insert_many(
+            Application,
+            [
+                {"name": application.name, "vendor_id": application.vendor_id}
+                for application in new_applications.values()
+            ],
+        )
+        created = list(zip(application_ids, new_applications.values()))
+        if created:
+            # Only the vendors gain nested rows, the children are all new
+            touch(
+                application_repository.session,
+                Vendor,
+                Vendor.id.in_({application.vendor_id for _, application in created}),
+            )
+        application_repository.insert_many(
+            ApplicationVersion,
+            [
+                {"application_id": application_id, "version": application.version}
+                for application_id, application in created
+            ],
+        )
+        application_repository.insert_many(
+            ApplicationRole,
+            [
+                {"application_id": application_id, "role_id": roles[name]}
+                for application_id, application in created
+                for name in set(application.roles)
+            ],
+        )
+        application_repository.insert_many(
+            ApplicationType,
+            [
+                {"application_id": application_id, "system_type_id": system_types[name]}
+                for application_id, application in created
+                for name in set(application.system_types)
+            ],
+        )
+        for index, application_id in zip(new_applications, application_ids):
+            results[index] = BulkItemResult(
+                index=index, status=BulkItemStatus.CREATED, id=application_id
+            )
+
+        return [results[index] for index in range(len(applications))]
+
+    @session_manager
+    def remove_many(
+        self,
+        application_ids: Sequence[UUID],
+        *,
+        application_repository: ApplicationRepository = get_repository(),
+    ) -> List[BulkItemResult]:
+        """
+        Deletes a batch of applications, with their versions, roles and system
+        types, in one transaction.
+        """
+        deleted = application_repository.delete_many(Application, application_ids)
+        results = []
+        for index, application_id in enumerate(application_ids):
+            if application_id not in deleted:
+                result = BulkItemResult.failed(
+                    index, ApplicationNotFoundException(), application_id
+                )
+            else:
+                deleted.remove(application_id)
+                result = BulkItemResult(
+                    index=index, status=BulkItemStatus.DELETED, id=application_id
+                )
+            results.append(result)
+
+        return results
+
     @session_manager
     def get_paginated(
         self,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        count_mode: CountMode | None = CountMode.EXACT,
+        expand: Collection[str] | None = None,
+        filters: ApplicationFilterQueryParams | None = None,
         *,
         application_repository: ApplicationRepository = get_repository(),
     ) -> Page[ApplicationDto]:
-        applications = application_repository.get_many(limit=limit, offset=offset)
-        dto = [map_application_entity_to_dto(app) for app in applications]
-        total = application_repository.count()
+        page = application_repository.get_page(
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
+            options=application_repository.loader_options(expand),
+            criteria=application_repository.filter_criteria(filters),
+        )
+        dto = map_application_entities_to_dtos(page.items, expand)
+
+        return Page(
+            items=dto,
+            limit=limit,
+            offset=offset,
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
+
+    @session_manager
+    def get_paginated_json(
+        self,
+        limit: int,
+        offset: int,
+        cursor: str | None = None,
+        count_mode: CountMode | None = CountMode.EXACT,
+        fields: Collection[str] | None = None,
+        filters: ApplicationFilterQueryParams | None = None,
+        *,
+        application_repository: ApplicationRepository = get_repository(),
+    ) -> bytes:
+        """
+        Returns the page of `get_paginated` serialized as JSON. The database renders
+        every application with its vendor, versions, roles and system types, so no
+        entities are loaded. Only the DTO fields in `fields` are included.
+        """
+        page = application_repository.get_json_page(
+            application_repository.json_item(fields),
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
+            criteria=application_repository.filter_criteria(filters),
+        )
+        return json_page(
+            page.items,
+            limit=limit,
+            offset=offset,
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
 
-        return Page(items=dto, limit=limit, offset=offset, total=total)
+    def export(self, batch_size: int = 500) -> Iterator[ApplicationDto]:
+        """
+        Yields every application, read in batches from a server-side cursor. The
+        session stays open until the iterator is exhausted or closed.
+        """
+        with streaming_session() as session:
+            application_repository = ApplicationRepository(session)
+            for application in application_repository.stream(
+                batch_size=batch_size, options=application_repository.loader_options()
+            ):
+                yield map_application_entity_to_dto(application)
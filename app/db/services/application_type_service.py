@@ -1,9 +1,6 @@
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
-    get_repository,
-)
+from app.db.session_manager import get_repository, session_manager
 
 from app.db.entities import Application
 from app.db.repository import ApplicationRepository, SystemTypeRepository
@@ -26,7 +23,7 @@ class ApplicationTypeService:
         application_repository: ApplicationRepository = get_repository(),
         system_type_repository: SystemTypeRepository = get_repository(),
     ) -> Application:
-        application = application_repository.get(id=application_id)
+        application = application_repository.get_expanded(id=application_id)
         if application is None:
             raise ApplicationNotFoundException()
 
@@ -41,10 +38,9 @@ class ApplicationTypeService:
             ):
                 raise SystemTypeExistInApplicationException()
 
-        new_application_type = ApplicationTypeFactory.create_instance(
+        ApplicationTypeFactory.create_instance(
             application=application, system_type=system_type
         )
-        application.system_types.append(new_application_type)
 
         return application
 
@@ -57,7 +53,7 @@ class ApplicationTypeService:
         application_repository: ApplicationRepository = get_repository(),
         system_type_repository: SystemTypeRepository = get_repository(),
     ) -> Application:
-        application = application_repository.get(id=application_id)
+        application = application_repository.get_expanded(id=application_id)
         if application is None:
             raise ApplicationNotFoundException()
 
@@ -1,12 +1,11 @@
 from typing import Sequence
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
-    get_repository,
-)
+from sqlalchemy.orm import selectinload
+
+from app.db.session_manager import get_repository, session_manager
 
-from app.db.entities import ApplicationVersion
+from app.db.entities import Application, ApplicationVersion
 from app.db.repository import ApplicationVersionRepository, ApplicationRepository
 from app.exceptions.app_exceptions import (
     ApplicationVersionDeleteException,
@@ -33,10 +32,13 @@ class ApplicationVersionService:
         *,
         application_respository: ApplicationRepository = get_repository(),
     ) -> Sequence[ApplicationVersion]:
-        application = application_respository.get_or_fail(id=application_id)
+        application = application_respository.get_loaded(
+            [selectinload(Application.versions)], id=application_id
+        )
+        if application is None:
+            raise ApplicationNotFoundException()
 
         new_version = ApplicationVersionFactory.create_instance(version=version)
-        new_version.application = application
         application.versions.append(new_version)
 
         return application.versions
@@ -50,7 +52,9 @@ class ApplicationVersionService:
         application_repository: ApplicationRepository = get_repository(),
         application_version_repository: ApplicationVersionRepository = get_repository(),
     ) -> Sequence[ApplicationVersion]:
-        application = application_repository.get(id=application_id)
+        application = application_repository.get_loaded(
+            [selectinload(Application.versions)], id=application_id
+        )
         if application is None:
             raise ApplicationNotFoundException()
 
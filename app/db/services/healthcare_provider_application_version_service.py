@@ -1,9 +1,6 @@
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
-    get_repository,
-)
+from app.db.session_manager import get_repository, session_manager
 
 from app.db.entities import HealthcareProvider
 from app.db.repository import ApplicationVersionRepository, HealthcareProviderRepository
@@ -33,7 +30,9 @@ class HealthcareProviderApplicationVersionService:
         healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
         application_version_repository: ApplicationVersionRepository = get_repository(),
     ) -> HealthcareProvider:
-        healthcare_provider = healthcare_provider_repository.get(id=provider_id)
+        healthcare_provider = healthcare_provider_repository.get_expanded(
+            id=provider_id
+        )
         if healthcare_provider is None:
             raise HealthcareProviderNotFoundException()
 
@@ -47,15 +46,9 @@ class HealthcareProviderApplicationVersionService:
             if app_version.application_version_id == application_version.id:
                 raise AppVersionExistsInHealthcareProviderException()
 
-        new_healthcare_provider_app_version = (
-            HealthcareProviderApplicationVersionFactory.create_instance(
-                healthcare_provider=healthcare_provider,
-                application_version=application_version,
-            )
-        )
-
-        healthcare_provider.application_versions.append(
-            new_healthcare_provider_app_version
+        HealthcareProviderApplicationVersionFactory.create_instance(
+            healthcare_provider=healthcare_provider,
+            application_version=application_version,
         )
 
         return healthcare_provider
@@ -69,7 +62,7 @@ class HealthcareProviderApplicationVersionService:
         healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
         application_version_repository: ApplicationVersionRepository = get_repository(),
     ) -> HealthcareProvider:
-        healthcare_provider = healthcare_provider_repository.get(
+        healthcare_provider = healthcare_provider_repository.get_expanded(
             id=healthcare_provider_id
         )
         if healthcare_provider is None:
@@ -1,12 +1,14 @@
 from uuid import UUID
 from datetime import date, datetime
+from typing import List, Sequence
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
-    get_repository,
-)
+from app.db.session_manager import get_repository, session_manager
 
-from app.db.entities import HealthcareProvider
+from app.db.entities import (
+    HealthcareProvider,
+    HealthcareProviderQualification,
+    ProtocolVersion,
+)
 from app.db.repository import HealthcareProviderRepository, ProtocolVersionRepository
 from app.exceptions.app_exceptions import (
     HealthcareProviderNotFoundException,
@@ -15,7 +17,8 @@ from app.exceptions.app_exceptions import (
     HealthcareProviderQualificationAlreadyArchivedException,
     HealthcareProviderNotQualifiedForProtocolException,
 )
-from app.factory import HealthcareProviderQualificationFactory
+from app.schemas.enums.bulk_item_status import BulkItemStatus
+from app.schemas.meta.schema import BulkItemResult
 
 
 class HealthcareProviderQualificationService:
@@ -29,36 +32,39 @@ class HealthcareProviderQualificationService:
         healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
         protocol_version_repository: ProtocolVersionRepository = get_repository(),
     ) -> HealthcareProvider:
-        healthcare_provider = healthcare_provider_repository.get(
-            id=healthcare_provider_id
-        )
-        if healthcare_provider is None:
+        if not healthcare_provider_repository.existing_ids(
+            HealthcareProvider, [healthcare_provider_id]
+        ):
             raise HealthcareProviderNotFoundException()
 
-        protocol_version = protocol_version_repository.get(id=protocol_version_id)
-        if protocol_version is None:
+        if not protocol_version_repository.existing_ids(
+            ProtocolVersion, [protocol_version_id]
+        ):
             raise ProtocolVersionNotFoundException()
 
-        for qualified_protocols in healthcare_provider.qualified_protocols:
-            if (
-                qualified_protocols.protocol_version_id == protocol_version_id
-                and qualified_protocols.healthcare_provider_id == healthcare_provider.id
+        if not protocol_version_repository.qualify(
+            HealthcareProviderQualification,
+            "healthcare_provider_id",
+            protocol_version_id,
+            [healthcare_provider_id],
+            qualification_date,
+        ):
+            if protocol_version_repository.archived(
+                HealthcareProviderQualification,
+                "healthcare_provider_id",
+                protocol_version_id,
+                [healthcare_provider_id],
             ):
-                if qualified_protocols.archived_date is not None:
-                    raise HealthcareProviderQualificationAlreadyArchivedException()
+                raise HealthcareProviderQualificationAlreadyArchivedException()
 
-                raise HealthcareProviderAlreadyQualifiedException()
+            raise HealthcareProviderAlreadyQualifiedException()
 
-        new_healthcare_provider_qualification = (
-            HealthcareProviderQualificationFactory.create_instance(
-                healthcare_provider=healthcare_provider,
-                protocol_version=protocol_version,
-                qualification_date=qualification_date,
-            )
-        )
-        healthcare_provider.qualified_protocols.append(
-            new_healthcare_provider_qualification
+        # Loaded after the insert, so its qualifications include the new one
+        healthcare_provider = healthcare_provider_repository.get_expanded(
+            id=healthcare_provider_id
         )
+        if healthcare_provider is None:
+            raise HealthcareProviderNotFoundException()
 
         return healthcare_provider
 
@@ -71,7 +77,7 @@ class HealthcareProviderQualificationService:
         healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
         protocol_version_repository: ProtocolVersionRepository = get_repository(),
     ) -> HealthcareProvider:
-        healthcare_provider = healthcare_provider_repository.get(
+        healthcare_provider = healthcare_provider_repository.get_expanded(
             id=healthcare_provider_id
         )
         if healthcare_provider is None:
@@ -93,3 +99,124 @@ class HealthcareProviderQualificationService:
                 return healthcare_provider
 
         raise HealthcareProviderNotQualifiedForProtocolException()
+
+    @session_manager
+    def qualify_healthcare_providers(
+        self,
+        protocol_version_id: UUID,
+        healthcare_provider_ids: Sequence[UUID],
+        qualification_date: date,
+        *,
+        protocol_version_repository: ProtocolVersionRepository = get_repository(),
+    ) -> List[BulkItemResult]:
+        """
+        Qualifies a batch of healthcare providers for the protocol version with one
+        INSERT ... ON CONFLICT DO NOTHING. Providers that are qualified already, or
+        were archived, are reported as a conflict.
+        """
+        if not protocol_version_repository.existing_ids(
+            ProtocolVersion, [protocol_version_id]
+        ):
+            raise ProtocolVersionNotFoundException()
+
+        existing = protocol_version_repository.existing_ids(
+            HealthcareProvider, set(healthcare_provider_ids)
+        )
+        qualified = protocol_version_repository.qualify(
+            HealthcareProviderQualification,
+            "healthcare_provider_id",
+            protocol_version_id,
+            existing,
+            qualification_date,
+        )
+        archived = protocol_version_repository.archived(
+            HealthcareProviderQualification,
+            "healthcare_provider_id",
+            protocol_version_id,
+            existing - qualified,
+        )
+        results = []
+        for index, provider_id in enumerate(healthcare_provider_ids):
+            if provider_id in qualified:
+                # A provider listed twice is reported as qualified the second time
+                qualified.remove(provider_id)
+                result = BulkItemResult(
+                    index=index, status=BulkItemStatus.CREATED, id=provider_id
+                )
+            elif provider_id not in existing:
+                result = BulkItemResult.failed(
+                    index, HealthcareProviderNotFoundException(), provider_id
+                )
+            elif provider_id in archived:
+                result = BulkItemResult.failed(
+                    index,
+                    HealthcareProviderQualificationAlreadyArchivedException(),
+                    provider_id,
+                )
+            else:
+                result = BulkItemResult.failed(
+                    index, HealthcareProviderAlreadyQualifiedException(), provider_id
+                )
+            results.append(result)
+
+        return results
+
+    @session_manager
+    def archive_healthcare_providers(
+        self,
+        protocol_version_id: UUID,
+        healthcare_provider_ids: Sequence[UUID] | None = None,
+        *,
+        protocol_version_repository: ProtocolVersionRepository = get_repository(),
+    ) -> List[BulkItemResult]:
+        """
+        Archives the qualifications of a batch of healthcare providers for the
+        protocol version, or all of them when no providers are given, with one
+        UPDATE ... WHERE.
+        """
+        if not protocol_version_repository.existing_ids(
+            ProtocolVersion, [protocol_version_id]
+        ):
+            raise ProtocolVersionNotFoundException()
+
+        archived = protocol_version_repository.archive(
+            HealthcareProviderQualification,
+            "healthcare_provider_id",
+            protocol_version_id,
+            healthcare_provider_ids,
+        )
+        if healthcare_provider_ids is None:
+            return [
+                BulkItemResult(index=index, status=BulkItemStatus.ARCHIVED, id=id)
+                for index, id in enumerate(archived)
+            ]
+
+        newly_archived = set(archived)
+        already_archived = newly_archived | protocol_version_repository.archived(
+            HealthcareProviderQualification,
+            "healthcare_provider_id",
+            protocol_version_id,
+            set(healthcare_provider_ids) - newly_archived,
+        )
+        results = []
+        for index, provider_id in enumerate(healthcare_provider_ids):
+            if provider_id in newly_archived:
+                newly_archived.remove(provider_id)
+                result = BulkItemResult(
+                    index=index, status=BulkItemStatus.ARCHIVED, id=provider_id
+                )
+            elif provider_id in already_archived:
+                result = BulkItemResult.failed(
+                    index,
+                    HealthcareProviderQualificationAlreadyArchivedException(),
+                    provider_id,
+                )
+            else:
+                result = BulkItemResult.failed(
+                    index,
+                    HealthcareProviderNotQualifiedForProtocolException(),
+                    provider_id,
+                )
+            results.append(result)
+
+        return results
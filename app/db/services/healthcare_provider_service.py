@@ -1,11 +1,17 @@
+from datetime import date, datetime
+from typing import Iterator, List, Sequence
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
+from app.db.entities import (
+    HealthcareProvider,
+    HealthcareProviderQualification,
+    ProtocolVersion,
+)
+from app.db.session_manager import (
     get_repository,
+    session_manager,
+    streaming_session,
 )
-
-from app.db.entities import HealthcareProvider
 from app.db.repository import (
     HealthcareProviderRepository,
     ProtocolVersionRepository,
@@ -16,10 +22,21 @@ from app.exceptions.app_exceptions import (
     AGBCodeAlreadyExists,
     ProtocolVersionNotFoundException,
 )
-from app.factory import HealthcareProviderFactory
-from app.schemas.healthcare_provider.mapper import map_healthcare_provider_entity_to_dto
-from app.schemas.healthcare_provider.schema import HealthcareProviderDto
-from app.schemas.meta.schema import Page
+from app.factory import HealthcareProviderQualificationFactory
+from app.schemas.healthcare_provider.mapper import (
+    map_healthcare_provider_entities_to_dtos,
+    map_healthcare_provider_entity_to_dto,
+)
+from app.schemas.healthcare_provider.schema import (
+    HealthcareProviderCreateDto,
+    HealthcareProviderDto,
+)
+from app.schemas.enums.bulk_item_status import BulkItemStatus
+from app.schemas.enums.count_mode import CountMode
+from app.schemas.filter_query_params.schema import (
+    HealthcareProviderFilterQueryParams,
+)
+from app.schemas.meta.schema import BulkItemResult, Page
 
 
 class HealthcareProviderService:
@@ -27,33 +44,60 @@ class HealthcareProviderService:
     def get_one(
         self,
         provider_id: UUID,
+        lock: bool = False,
         *,
         healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
     ) -> HealthcareProvider:
-        healthcare_provider = healthcare_provider_repository.get(id=provider_id)
+        healthcare_provider = healthcare_provider_repository.get_expanded(
+            lock=lock, id=provider_id
+        )
         if healthcare_provider is None:
             raise HealthcareProviderNotFoundException()
 
         return healthcare_provider
 
+    @session_manager
+    def get_modified_at(
+        self,
+        provider_id: UUID,
+        lock: bool = False,
+        *,
+        healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
+    ) -> datetime:
+        modified_at = healthcare_provider_repository.get_modified_at(lock, id=provider_id)
+        if modified_at is None:
+            raise HealthcareProviderNotFoundException()
+
+        return modified_at
+
     @session_manager
     def get_paginated(
         self,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        count_mode: CountMode | None = CountMode.EXACT,
+        filters: HealthcareProviderFilterQueryParams | None = None,
         *,
         healthcare_providers_repository: HealthcareProviderRepository = get_repository(),
     ) -> Page[HealthcareProviderDto]:
-        healthcare_providers = healthcare_providers_repository.get_many(
-            limit=limit, offset=offset
+        page = healthcare_providers_repository.get_page(
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
+            options=healthcare_providers_repository.loader_options(),
+            criteria=healthcare_providers_repository.filter_criteria(filters),
         )
-        dto = [
-            map_healthcare_provider_entity_to_dto(provider)
-            for provider in healthcare_providers
-        ]
-        total = healthcare_providers_repository.count()
+        dto = map_healthcare_provider_entities_to_dtos(page.items)
 
-        return Page(items=dto, total=total, limit=limit, offset=offset)
+        return Page(
+            items=dto,
+            total=page.total,
+            limit=limit,
+            offset=offset,
+            next_cursor=page.next_cursor,
+        )
 
     @session_manager
     def add_one(
@@ -67,30 +111,31 @@ class HealthcareProviderService:
         healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
         protocol_version_repository: ProtocolVersionRepository = get_repository(),
     ) -> HealthcareProvider:
-        ura_code_exists = healthcare_provider_repository.ura_code_exists(
-            ura_code=ura_code
-        )
-        if ura_code_exists:
-            raise URACodeAlreadyExists()
-
-        agb_code_exists = healthcare_provider_repository.agb_code_exists(
-            agb_code=agb_code
-        )
-        if agb_code_exists:
-            raise AGBCodeAlreadyExists()
-
         protocol_version = protocol_version_repository.get(id=protocol_version_id)
         if protocol_version is None:
             raise ProtocolVersionNotFoundException()
 
-        new_healthcare_provider = HealthcareProviderFactory.create_instance(
-            ura_code=ura_code,
-            agb_code=agb_code,
-            trade_name=trade_name,
-            statutory_name=statutory_name,
+        new_healthcare_provider = healthcare_provider_repository.insert_unique(
+            HealthcareProvider,
+            {
+                "ura_code": ura_code,
+                "agb_code": agb_code,
+                "trade_name": trade_name,
+                "statutory_name": statutory_name,
+            },
+        )
+        if new_healthcare_provider is None:
+            # Only a conflicting insert needs to find out which code is taken
+            if healthcare_provider_repository.ura_code_exists(ura_code=ura_code):
+                raise URACodeAlreadyExists()
+
+            raise AGBCodeAlreadyExists()
+
+        HealthcareProviderQualificationFactory.create_instance(
+            healthcare_provider=new_healthcare_provider,
             protocol_version=protocol_version,
+            qualification_date=date.today(),
         )
-        healthcare_provider_repository.create(new_healthcare_provider)
 
         return new_healthcare_provider
 
@@ -101,10 +146,113 @@ class HealthcareProviderService:
         *,
         healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
     ) -> HealthcareProvider:
-        healthcare_provider = healthcare_provider_repository.get(id=provider_id)
-        if healthcare_provider is None:
+        deleted = healthcare_provider_repository.delete_returning(
+            HealthcareProvider, HealthcareProvider.id == provider_id
+        )
+        if not deleted:
             raise HealthcareProviderNotFoundException()
 
-        healthcare_provider_repository.delete(healthcare_provider)
+        return deleted[0]
 
-        return healthcare_provider
+    @session_manager
+    def add_many(
+        self,
+        healthcare_providers: Sequence[HealthcareProviderCreateDto],
+        *,
+        healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
+    ) -> List[BulkItemResult]:
+        """
+        Registers a batch of healthcare providers in one transaction, each qualified
+        for its protocol version as of today. Providers whose URA or AGB code is in
+        use, or taken by an earlier provider of the batch, are reported as a
+        conflict, and providers with an unknown protocol version as not found.
+        """
+        taken_ura_codes, taken_agb_codes = healthcare_provider_repository.taken_codes(
+            [provider.ura_code for provider in healthcare_providers],
+            [provider.agb_code for provider in healthcare_providers],
+        )
+        protocol_version_ids = healthcare_provider_repository.existing_ids(
+            ProtocolVersion,
+            {provider.protocol_version_id for provider in healthcare_providers},
+        )
+        results: dict[int, BulkItemResult] = {}
+        new_providers: dict[int, HealthcareProviderCreateDto] = {}
+        for index, provider in enumerate(healthcare_providers):
+            if provider.ura_code in taken_ura_codes:
+                results[index] = BulkItemResult.failed(index, URACodeAlreadyExists())
+            elif provider.agb_code in taken_agb_codes:
+                results[index] = BulkItemResult.failed(index, AGBCodeAlreadyExists())
+            elif provider.protocol_version_id not in protocol_version_ids:
+                results[index] = BulkItemResult.failed(
+                    index, ProtocolVersionNotFoundException()
+                )
+            else:
+                taken_ura_codes.add(provider.ura_code)
+                taken_agb_codes.add(provider.agb_code)
+                new_providers[index] = provider
+
+        provider_ids = healthcare_provider_repository.insert_many(
+            HealthcareProvider,
+            [
+                provider.model_dump(exclude={"protocol_version_id"})
+                for provider in new_providers.values()
+            ],
+        )
+        healthcare_provider_repository.insert_many(
+            HealthcareProviderQualification,
+            [
+                {
+                    "healthcare_provider_id": provider_id,
+                    "protocol_version_id": provider.protocol_version_id,
+                    "qualification_date": date.today(),
+                }
+                for provider_id, provider in zip(provider_ids, new_providers.values())
+            ],
+        )
+        for index, provider_id in zip(new_providers, provider_ids):
+            results[index] = BulkItemResult(
+                index=index, status=BulkItemStatus.CREATED, id=provider_id
+            )
+
+        return [results[index] for index in range(len(healthcare_providers))]
+
+    @session_manager
+    def remove_many(
+        self,
+        provider_ids: Sequence[UUID],
+        *,
+        healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
+    ) -> List[BulkItemResult]:
+        """
+        Deletes a batch of healthcare providers in one transaction.
+        """
+        deleted = healthcare_provider_repository.delete_many(
+            HealthcareProvider, provider_ids
+        )
+        results = []
+        for index, provider_id in enumerate(provider_ids):
+            if provider_id not in deleted:
+                result = BulkItemResult.failed(
+                    index, HealthcareProviderNotFoundException(), provider_id
+                )
+            else:
+                deleted.remove(provider_id)
+                result = BulkItemResult(
+                    index=index, status=BulkItemStatus.DELETED, id=provider_id
+                )
+            results.append(result)
+
+        return results
+
+    def export(self, batch_size: int = 500) -> Iterator[HealthcareProviderDto]:
+        """
+        Yields every healthcare provider, read in batches from a server-side cursor. The
+        session stays open until the iterator is exhausted or closed.
+        """
+        with streaming_session() as session:
+            healthcare_provider_repository = HealthcareProviderRepository(session)
+            for provider in healthcare_provider_repository.stream(
+                batch_size=batch_size,
+                options=healthcare_provider_repository.loader_options(),
+            ):
+                yield map_healthcare_provider_entity_to_dto(provider)
@@ -1,12 +1,14 @@
 from datetime import date, datetime
+from typing import List, Sequence
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
-    get_repository,
-)
+from app.db.session_manager import get_repository, session_manager
 
-from app.db.entities import ProtocolVersion
+from app.db.entities import (
+    ApplicationVersion,
+    ProtocolApplicationQualification,
+    ProtocolVersion,
+)
 from app.db.repository import ApplicationVersionRepository, ProtocolVersionRepository
 from app.exceptions.app_exceptions import (
     ProtocolVersionNotFoundException,
@@ -15,7 +17,8 @@ from app.exceptions.app_exceptions import (
     AppVersionAlreadyArchivedException,
     AppVersionNotQualifiedForProtocolException,
 )
-from app.factory import ProtocolApplicationQualificationFactory
+from app.schemas.enums.bulk_item_status import BulkItemStatus
+from app.schemas.meta.schema import BulkItemResult
 
 
 class ProtocolApplicationQualificationService:
@@ -26,36 +29,41 @@ class ProtocolApplicationQualificationService:
         application_version_id: UUID,
         qualification_date: date,
         *,
-        application_version_repository: ApplicationVersionRepository = get_repository(),
         protocol_version_repository: ProtocolVersionRepository = get_repository(),
     ) -> ProtocolVersion:
-        protocol_version = protocol_version_repository.get(id=protocol_version_id)
-        if protocol_version is None:
+        if not protocol_version_repository.existing_ids(
+            ProtocolVersion, [protocol_version_id]
+        ):
             raise ProtocolVersionNotFoundException()
 
-        application_version = application_version_repository.get(
-            id=application_version_id
-        )
-        if application_version is None:
+        if not protocol_version_repository.existing_ids(
+            ApplicationVersion, [application_version_id]
+        ):
             raise ApplicationVersionNotFoundException()
 
-        for qualified_apps in protocol_version.qualified_application_versions:
-            if (
-                qualified_apps.application_version_id == application_version.id
-                and qualified_apps.protocol_version_id == protocol_version.id
+        if not protocol_version_repository.qualify(
+            ProtocolApplicationQualification,
+            "application_version_id",
+            protocol_version_id,
+            [application_version_id],
+            qualification_date,
+        ):
+            if protocol_version_repository.archived(
+                ProtocolApplicationQualification,
+                "application_version_id",
+                protocol_version_id,
+                [application_version_id],
             ):
-                if qualified_apps.archived_date is not None:
-                    raise AppVersionAlreadyArchivedException()
+                raise AppVersionAlreadyArchivedException()
 
-                raise AppVersionAlreadyQualifiedException()
+            raise AppVersionAlreadyQualifiedException()
 
-        new_qualification = ProtocolApplicationQualificationFactory.create_instance(
-            protocol_version=protocol_version,
-            application_version=application_version,
-            qualification_date=qualification_date,
+        # Loaded after the insert, so its qualifications include the new one
+        protocol_version = protocol_version_repository.get_expanded(
+            id=protocol_version_id
         )
-
-        protocol_version.qualified_application_versions.append(new_qualification)
+        if protocol_version is None:
+            raise ProtocolVersionNotFoundException()
 
         return protocol_version
 
@@ -68,7 +76,9 @@ class ProtocolApplicationQualificationService:
         application_version_repository: ApplicationVersionRepository = get_repository(),
         protocol_version_repository: ProtocolVersionRepository = get_repository(),
     ) -> ProtocolVersion:
-        protocol_version = protocol_version_repository.get(id=protocol_version_id)
+        protocol_version = protocol_version_repository.get_expanded(
+            id=protocol_version_id
+        )
         if protocol_version is None:
             raise ProtocolVersionNotFoundException()
 
@@ -90,3 +100,118 @@ class ProtocolApplicationQualificationService:
                 return protocol_version
 
         raise AppVersionNotQualifiedForProtocolException()
+
+    @session_manager
+    def qualify_application_versions(
+        self,
+        protocol_version_id: UUID,
+        application_version_ids: Sequence[UUID],
+        qualification_date: date,
+        *,
+        protocol_version_repository: ProtocolVersionRepository = get_repository(),
+    ) -> List[BulkItemResult]:
+        """
+        Qualifies a batch of application versions for the protocol version with one
+        INSERT ... ON CONFLICT DO NOTHING. Versions that are qualified already, or
+        were archived, are reported as a conflict.
+        """
+        if not protocol_version_repository.existing_ids(
+            ProtocolVersion, [protocol_version_id]
+        ):
+            raise ProtocolVersionNotFoundException()
+
+        existing = protocol_version_repository.existing_ids(
+            ApplicationVersion, set(application_version_ids)
+        )
+        qualified = protocol_version_repository.qualify(
+            ProtocolApplicationQualification,
+            "application_version_id",
+            protocol_version_id,
+            existing,
+            qualification_date,
+        )
+        archived = protocol_version_repository.archived(
+            ProtocolApplicationQualification,
+            "application_version_id",
+            protocol_version_id,
+            existing - qualified,
+        )
+        results = []
+        for index, version_id in enumerate(application_version_ids):
+            if version_id in qualified:
+                # A version listed twice is reported as qualified the second time
+                qualified.remove(version_id)
+                result = BulkItemResult(
+                    index=index, status=BulkItemStatus.CREATED, id=version_id
+                )
+            elif version_id not in existing:
+                result = BulkItemResult.failed(
+                    index, ApplicationVersionNotFoundException(), version_id
+                )
+            elif version_id in archived:
+                result = BulkItemResult.failed(
+                    index, AppVersionAlreadyArchivedException(), version_id
+                )
+            else:
+                result = BulkItemResult.failed(
+                    index, AppVersionAlreadyQualifiedException(), version_id
+                )
+            results.append(result)
+
+        return results
+
+    @session_manager
+    def archive_application_versions(
+        self,
+        protocol_version_id: UUID,
+        application_version_ids: Sequence[UUID] | None = None,
+        *,
+        protocol_version_repository: ProtocolVersionRepository = get_repository(),
+    ) -> List[BulkItemResult]:
+        """
+        Archives the qualifications of a batch of application versions for the
+        protocol version, or all of them when no versions are given, with one
+        UPDATE ... WHERE.
+        """
+        if not protocol_version_repository.existing_ids(
+            ProtocolVersion, [protocol_version_id]
+        ):
+            raise ProtocolVersionNotFoundException()
+
+        archived = protocol_version_repository.archive(
+            ProtocolApplicationQualification,
+            "application_version_id",
+            protocol_version_id,
+            application_version_ids,
+        )
+        if application_version_ids is None:
+            return [
+                BulkItemResult(index=index, status=BulkItemStatus.ARCHIVED, id=id)
+                for index, id in enumerate(archived)
+            ]
+
+        newly_archived = set(archived)
+        already_archived = newly_archived | protocol_version_repository.archived(
+            ProtocolApplicationQualification,
+            "application_version_id",
+            protocol_version_id,
+            set(application_version_ids) - newly_archived,
+        )
+        results = []
+        for index, version_id in enumerate(application_version_ids):
+            if version_id in newly_archived:
+                newly_archived.remove(version_id)
+                result = BulkItemResult(
+                    index=index, status=BulkItemStatus.ARCHIVED, id=version_id
+                )
+            elif version_id in already_archived:
+                result = BulkItemResult.failed(
+                    index, AppVersionAlreadyArchivedException(), version_id
+                )
+            else:
+                result = BulkItemResult.failed(
+                    index, AppVersionNotQualifiedForProtocolException(), version_id
+                )
+            results.append(result)
+
+        return results
@@ -1,20 +1,25 @@
+from typing import Any
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    get_repository,
-    session_manager,
-)
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.cache.ttl_cache import TTLCache
+from app.db.session_manager import after_commit, get_repository, session_manager
 
 from app.db.entities import Protocol
 from app.db.repository import ProtocolRepository
 from app.exceptions.app_exceptions import ProtocolNotFoundException
 from app.factory import ProtocolFactory
+from app.schemas.enums.count_mode import CountMode
 from app.schemas.meta.schema import Page
 from app.schemas.protocol.mapper import map_protocol_entity_to_dto
 from app.schemas.protocol.schema import ProtocolDto
 
 
 class ProtocolService:
+    def __init__(self, cache: TTLCache[tuple[Any, ...], Any] | None = None) -> None:
+        self.cache = cache if cache is not None else TTLCache("protocols")
+
     @session_manager
     def get_one(
         self,
@@ -22,7 +27,7 @@ class ProtocolService:
         *,
         protocol_repository: ProtocolRepository = get_repository(),
     ) -> Protocol:
-        protocol = protocol_repository.get(id=protocol_id)
+        protocol = protocol_repository.get_expanded(id=protocol_id)
         if protocol is None:
             raise ProtocolNotFoundException()
 
@@ -41,6 +46,9 @@ class ProtocolService:
             name=name, description=description, protocol_type=protocol_type
         )
         protocol_repository.create(new_protocol)
+        # A new protocol has no versions, so they are not loaded when it is mapped
+        set_committed_value(new_protocol, "versions", [])
+        after_commit(protocol_repository.session, self.cache.invalidate)
 
         return new_protocol
 
@@ -51,24 +59,51 @@ class ProtocolService:
         *,
         protocol_repository: ProtocolRepository = get_repository(),
     ) -> Protocol:
-        protocol = protocol_repository.get(id=protocol_id)
-        if protocol is None:
+        deleted = protocol_repository.delete_returning(
+            Protocol, Protocol.id == protocol_id
+        )
+        if not deleted:
             raise ProtocolNotFoundException()
 
-        protocol_repository.delete(protocol)
+        after_commit(protocol_repository.session, self.cache.invalidate)
 
-        return protocol
+        return deleted[0]
 
-    @session_manager
     def get_paginated(
         self,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        count_mode: CountMode | None = CountMode.EXACT,
+    ) -> Page[ProtocolDto]:
+        return self.cache.get_or_load(
+            ("page", limit, offset, cursor, count_mode),
+            lambda: self._get_paginated(limit, offset, cursor, count_mode),
+        )
+
+    @session_manager
+    def _get_paginated(
+        self,
+        limit: int,
+        offset: int,
+        cursor: str | None,
+        count_mode: CountMode | None,
         *,
         protocol_repository: ProtocolRepository = get_repository(),
     ) -> Page[ProtocolDto]:
-        protocols = protocol_repository.get_many(limit=limit, offset=offset)
-        dto = [map_protocol_entity_to_dto(protocol) for protocol in protocols]
-        total = protocol_repository.count()
+        page = protocol_repository.get_page(
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
+            options=protocol_repository.loader_options(),
+        )
+        dto = [map_protocol_entity_to_dto(protocol) for protocol in page.items]
 
-        return Page(items=dto, limit=limit, offset=offset, total=total)
+        return Page(
+            items=dto,
+            limit=limit,
+            offset=offset,
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
@@ -1,10 +1,7 @@
 from typing import Sequence
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
-    get_repository,
-)
+from app.db.session_manager import after_commit, get_repository, session_manager
 
 from app.db.entities import ProtocolVersion
 from app.db.repository import ProtocolRepository, ProtocolVersionRepository
@@ -31,7 +28,7 @@ class ProtocolVersionService:
         *,
         protocol_version_repository: ProtocolVersionRepository = get_repository(),
     ) -> ProtocolVersion:
-        protocol_version = protocol_version_repository.get(
+        protocol_version = protocol_version_repository.get_expanded(
             id=version_id, protocol_id=protocol_id
         )
         if protocol_version is None:
@@ -48,7 +45,7 @@ class ProtocolVersionService:
         *,
         protocol_repository: ProtocolRepository = get_repository(),
     ) -> ProtocolVersion:
-        protocol = protocol_repository.get(id=protocol_id)
+        protocol = protocol_repository.get_expanded(id=protocol_id)
         if protocol is None:
             raise ProtocolNotFoundException()
 
@@ -56,6 +53,10 @@ class ProtocolVersionService:
             version=version, description=description
         )
         protocol.versions.append(new_protocol_version)
+        # Cached protocols list their versions
+        after_commit(
+            protocol_repository.session, self.protocol_service.cache.invalidate
+        )
 
         return new_protocol_version
 
@@ -68,7 +69,7 @@ class ProtocolVersionService:
         protocol_repository: ProtocolRepository = get_repository(),
         protocol_version_repository: ProtocolVersionRepository = get_repository(),
     ) -> Sequence[ProtocolVersion]:
-        protocol = protocol_repository.get(id=protocol_id)
+        protocol = protocol_repository.get_expanded(id=protocol_id)
         if protocol is None:
             raise ProtocolNotFoundException()
 
@@ -77,5 +78,8 @@ class ProtocolVersionService:
             raise ProtocolVersionNotFoundException()
 
         protocol.versions.remove(protocol_version)
+        after_commit(
+            protocol_repository.session, self.protocol_service.cache.invalidate
+        )
 
         return protocol.versions
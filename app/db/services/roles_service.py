@@ -1,24 +1,27 @@
-from typing import Sequence, List
+from typing import Any, Sequence, List
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
-    get_repository,
-)
+from app.cache.ttl_cache import TTLCache
+from app.db.session_manager import after_commit, get_repository, session_manager
 
-from app.db.entities import Role
+from app.db.entities import ApplicationRole, Role
 from app.db.repository import RoleRepository
+from app.db.repository.modification import touch_containers
 from app.exceptions.app_exceptions import (
     RoleAlreadyExistsException,
     RoleNotFoundException,
 )
 from app.helpers.validators import validate_sets_equal
+from app.schemas.enums.count_mode import CountMode
 from app.schemas.meta.schema import Page
 from app.schemas.roles.mapper import map_role_model_to_dto
 from app.schemas.roles.schema import RoleDto
 
 
 class RoleService:
+    def __init__(self, cache: TTLCache[tuple[Any, ...], Any] | None = None) -> None:
+        self.cache = cache if cache is not None else TTLCache("roles")
+
     @session_manager
     def get_one(
         self, role_id: UUID, *, role_repository: RoleRepository = get_repository()
@@ -29,19 +32,40 @@ class RoleService:
 
         return role
 
-    @session_manager
     def get_paginated(
         self,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        count_mode: CountMode | None = CountMode.EXACT,
+    ) -> Page[RoleDto]:
+        return self.cache.get_or_load(
+            ("page", limit, offset, cursor, count_mode),
+            lambda: self._get_paginated(limit, offset, cursor, count_mode),
+        )
+
+    @session_manager
+    def _get_paginated(
+        self,
+        limit: int,
+        offset: int,
+        cursor: str | None,
+        count_mode: CountMode | None,
         *,
         role_repository: RoleRepository = get_repository(),
     ) -> Page[RoleDto]:
-        roles = role_repository.get_many(limit=limit, offset=offset)
-        dto = [map_role_model_to_dto(role) for role in roles]
-        total = role_repository.count()
-
-        return Page(items=dto, limit=limit, offset=offset, total=total)
+        page = role_repository.get_page(
+            limit=limit, offset=offset, cursor=cursor, count_mode=count_mode
+        )
+        dto = [map_role_model_to_dto(role) for role in page.items]
+
+        return Page(
+            items=dto,
+            limit=limit,
+            offset=offset,
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
 
     @session_manager
     def add_one(
@@ -51,12 +75,13 @@ class RoleService:
         *,
         role_repository: RoleRepository = get_repository(),
     ) -> Role:
-        role = role_repository.get(name=name)
-        if role is not None:
+        new_role = role_repository.insert_unique(
+            Role, {"name": name, "description": description}
+        )
+        if new_role is None:
             raise RoleAlreadyExistsException()
 
-        new_role = Role(name=name, description=description)
-        role_repository.create(new_role)
+        after_commit(role_repository.session, self.cache.invalidate)
 
         return new_role
 
@@ -73,6 +98,11 @@ class RoleService:
             raise RoleNotFoundException()
 
         role.description = description
+        # The roles of an application are represented with their description
+        touch_containers(
+            role_repository.session, ApplicationRole, ApplicationRole.role_id == role_id
+        )
+        after_commit(role_repository.session, self.cache.invalidate)
 
         return role
 
@@ -80,13 +110,13 @@ class RoleService:
     def remove_one(
         self, role_id: UUID, *, role_repository: RoleRepository = get_repository()
     ) -> Role:
-        role = role_repository.get(id=role_id)
-        if role is None:
+        deleted = role_repository.delete_returning(Role, Role.id == role_id)
+        if not deleted:
             raise RoleNotFoundException()
 
-        role_repository.delete(role)
+        after_commit(role_repository.session, self.cache.invalidate)
 
-        return role
+        return deleted[0]
 
     @session_manager
     def get_many_by_names(
@@ -101,3 +131,35 @@ class RoleService:
             raise RoleNotFoundException()
 
         return roles
+
+    def resolve_names(
+        self, role_names: Sequence[str], missing_ok: bool = False
+    ) -> List[RoleDto]:
+        """
+        Returns the roles with the given names. Names are resolved from the cache,
+        only the ones that are not cached yet are looked up in the database. Unknown
+        names are left out when `missing_ok` is set.
+        """
+        roles = {name: self.cache.get(("name", name)) for name in role_names}
+        missing = [name for name, role in roles.items() if role is None]
+        if missing:
+            for role in self._get_dtos_by_names(missing, missing_ok):
+                self.cache.set(("name", role.name), role)
+                roles[role.name] = role
+
+        return [role for role in roles.values() if role is not None]
+
+    @session_manager
+    def _get_dtos_by_names(
+        self,
+        role_names: List[str],
+        missing_ok: bool,
+        *,
+        role_repository: RoleRepository = get_repository(),
+    ) -> List[RoleDto]:
+        roles = role_repository.get_by_property("name", role_names)
+        valid_roles = validate_sets_equal(role_names, [role.name for role in roles])
+        if not valid_roles and not missing_ok:
+            raise RoleNotFoundException()
+
+        return [map_role_model_to_dto(role) for role in roles]
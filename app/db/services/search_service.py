@@ -0,0 +1,44 @@
+from app.db.repository import (
+    ApplicationRepository,
+    HealthcareProviderRepository,
+    VendorRepository,
+)
+from app.db.repository.search import search_page
+from app.db.session_manager import get_repository, session_manager
+from app.schemas.meta.schema import Page
+from app.schemas.search.mapper import map_search_hit_to_dto
+from app.schemas.search.schema import SearchHitDto
+
+
+class SearchService:
+    @session_manager
+    def search(
+        self,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+        *,
+        vendor_repository: VendorRepository = get_repository(),
+        application_repository: ApplicationRepository = get_repository(),
+        healthcare_provider_repository: HealthcareProviderRepository = get_repository(),
+    ) -> Page[SearchHitDto]:
+        """
+        Returns a page of the vendors, applications and healthcare providers whose
+        names or codes contain `query`, ranked in one query.
+        """
+        page = search_page(
+            vendor_repository.session,
+            [
+                vendor_repository.search_statement(query),
+                application_repository.search_statement(query),
+                healthcare_provider_repository.search_statement(query),
+            ],
+            limit=limit,
+            cursor=cursor,
+        )
+        return Page(
+            items=[map_search_hit_to_dto(hit) for hit in page.items],
+            limit=limit,
+            offset=0,
+            next_cursor=page.next_cursor,
+        )
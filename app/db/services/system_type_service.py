@@ -1,10 +1,8 @@
-from typing import Sequence, List
+from typing import Any, Sequence, List
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
-    get_repository,
-)
+from app.cache.ttl_cache import TTLCache
+from app.db.session_manager import after_commit, get_repository, session_manager
 
 from app.db.entities import SystemType
 from app.db.repository import SystemTypeRepository
@@ -12,29 +10,51 @@ from app.exceptions.app_exceptions import (
     SystemTypeNotFoundException,
     SystemTypeAlreadyExistsException,
 )
-from app.factory import SystemTypeFactory
 from app.helpers.validators import validate_sets_equal
+from app.schemas.enums.count_mode import CountMode
 from app.schemas.meta.schema import Page
 from app.schemas.system_type.mapper import map_system_type_entity_to_dto
 from app.schemas.system_type.schema import SystemTypeDto
 
 
 class SystemTypeService:
-    @session_manager
+    def __init__(self, cache: TTLCache[tuple[Any, ...], Any] | None = None) -> None:
+        self.cache = cache if cache is not None else TTLCache("system_types")
+
     def get_paginated(
         self,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        count_mode: CountMode | None = CountMode.EXACT,
+    ) -> Page[SystemTypeDto]:
+        return self.cache.get_or_load(
+            ("page", limit, offset, cursor, count_mode),
+            lambda: self._get_paginated(limit, offset, cursor, count_mode),
+        )
+
+    @session_manager
+    def _get_paginated(
+        self,
+        limit: int,
+        offset: int,
+        cursor: str | None,
+        count_mode: CountMode | None,
         *,
         system_type_repository: SystemTypeRepository = get_repository(),
     ) -> Page[SystemTypeDto]:
-        system_types = system_type_repository.get_many(limit=limit, offset=offset)
-        dto = [
-            map_system_type_entity_to_dto(system_type) for system_type in system_types
-        ]
-        total = system_type_repository.count()
-
-        return Page(items=dto, limit=limit, offset=offset, total=total)
+        page = system_type_repository.get_page(
+            limit=limit, offset=offset, cursor=cursor, count_mode=count_mode
+        )
+        dto = [map_system_type_entity_to_dto(system_type) for system_type in page.items]
+
+        return Page(
+            items=dto,
+            limit=limit,
+            offset=offset,
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
 
     @session_manager
     def get_one(
@@ -57,14 +77,13 @@ class SystemTypeService:
         *,
         system_type_repository: SystemTypeRepository = get_repository(),
     ) -> SystemType:
-        system_type = system_type_repository.get(name=name)
-        if system_type is not None:
+        new_system_type = system_type_repository.insert_unique(
+            SystemType, {"name": name, "description": description}
+        )
+        if new_system_type is None:
             raise SystemTypeAlreadyExistsException()
 
-        new_system_type = SystemTypeFactory.create_instance(
-            name=name, description=description
-        )
-        system_type_repository.create(new_system_type)
+        after_commit(system_type_repository.session, self.cache.invalidate)
 
         return new_system_type
 
@@ -75,13 +94,15 @@ class SystemTypeService:
         *,
         system_type_repository: SystemTypeRepository = get_repository(),
     ) -> SystemType:
-        system_type = system_type_repository.get(id=system_type_id)
-        if system_type is None:
+        deleted = system_type_repository.delete_returning(
+            SystemType, SystemType.id == system_type_id
+        )
+        if not deleted:
             raise SystemTypeNotFoundException()
 
-        system_type_repository.delete(system_type)
+        after_commit(system_type_repository.session, self.cache.invalidate)
 
-        return system_type
+        return deleted[0]
 
     @session_manager
     def get_many_by_names(
@@ -103,3 +124,49 @@ class SystemTypeService:
             raise SystemTypeNotFoundException()
 
         return system_types
+
+    def resolve_names(
+        self, system_type_names: Sequence[str], missing_ok: bool = False
+    ) -> List[SystemTypeDto]:
+        """
+        Returns the system types with the given names. Names are resolved from the
+        cache, only the ones that are not cached yet are looked up in the database.
+        Unknown names are left out when `missing_ok` is set.
+        """
+        system_types = {
+            name: self.cache.get(("name", name)) for name in system_type_names
+        }
+        missing = [
+            name for name, system_type in system_types.items() if system_type is None
+        ]
+        if missing:
+            for system_type in self._get_dtos_by_names(missing, missing_ok):
+                self.cache.set(("name", system_type.name), system_type)
+                system_types[system_type.name] = system_type
+
+        return [
+            system_type
+            for system_type in system_types.values()
+            if system_type is not None
+        ]
+
+    @session_manager
+    def _get_dtos_by_names(
+        self,
+        system_type_names: List[str],
+        missing_ok: bool,
+        *,
+        system_type_repository: SystemTypeRepository = get_repository(),
+    ) -> List[SystemTypeDto]:
+        system_types = system_type_repository.get_by_property(
+            attribute="name", values=system_type_names
+        )
+        valid_system_types = validate_sets_equal(
+            system_type_names, [system_type.name for system_type in system_types]
+        )
+        if not valid_system_types and not missing_ok:
+            raise SystemTypeNotFoundException()
+
+        return [
+            map_system_type_entity_to_dto(system_type) for system_type in system_types
+        ]
@@ -1,29 +1,41 @@
+from datetime import datetime
+from typing import Collection, Iterator, List, Sequence
 from uuid import UUID
 
-from gfmodules_python_shared.session.session_manager import (
-    session_manager,
+from app.db.session_manager import (
     get_repository,
+    session_manager,
+    streaming_session,
 )
-
 from app.db.repository import VendorRepository
-from app.factory import VendorFactory
 from app.db.entities import Vendor
 from app.exceptions.app_exceptions import (
     VendorNotFoundException,
     VendorAlreadyExistsException,
     VendorCannotBeDeletedException,
 )
-from app.schemas.meta.schema import Page
-from app.schemas.vendor.mapper import map_vendor_entity_to_dto
-from app.schemas.vendor.schema import VendorDto
+from app.schemas.enums.bulk_item_status import BulkItemStatus
+from app.schemas.enums.count_mode import CountMode
+from app.schemas.filter_query_params.schema import TimestampFilterQueryParams
+from app.schemas.mapping import json_page
+from app.schemas.meta.schema import BulkItemResult, Page
+from app.schemas.vendor.mapper import (
+    map_vendor_entities_to_dtos,
+    map_vendor_entity_to_dto,
+)
+from app.schemas.vendor.schema import VendorCreateDto, VendorDto
 
 
 class VendorService:
+    def __init__(self, json_pages: bool = False) -> None:
+        # Serve list pages from get_paginated_json instead of get_paginated
+        self.json_pages = json_pages
+
     @session_manager
     def get_one_by_kvk_number(
         self, kvk_number: str, *, vendor_repository: VendorRepository = get_repository()
     ) -> Vendor:
-        vendor = vendor_repository.get(kvk_number=kvk_number)
+        vendor = vendor_repository.get_expanded(kvk_number=kvk_number)
         if vendor is None:
             raise VendorNotFoundException()
 
@@ -31,14 +43,33 @@ class VendorService:
 
     @session_manager
     def get_one(
-        self, vendor_id: UUID, *, vendor_repository: VendorRepository = get_repository()
+        self,
+        vendor_id: UUID,
+        expand: Collection[str] | None = None,
+        lock: bool = False,
+        *,
+        vendor_repository: VendorRepository = get_repository(),
     ) -> Vendor:
-        vendor = vendor_repository.get(id=vendor_id)
+        vendor = vendor_repository.get_expanded(expand, lock, id=vendor_id)
         if vendor is None:
             raise VendorNotFoundException()
 
         return vendor
 
+    @session_manager
+    def get_modified_at(
+        self,
+        vendor_id: UUID,
+        lock: bool = False,
+        *,
+        vendor_repository: VendorRepository = get_repository(),
+    ) -> datetime:
+        modified_at = vendor_repository.get_modified_at(lock, id=vendor_id)
+        if modified_at is None:
+            raise VendorNotFoundException()
+
+        return modified_at
+
     @session_manager
     def add_one(
         self,
@@ -48,16 +79,16 @@ class VendorService:
         *,
         vendor_repository: VendorRepository = get_repository(),
     ) -> Vendor:
-        vendor = vendor_repository.get(kvk_number=kvk_number)
-        if vendor is not None:
-            raise VendorAlreadyExistsException()
-
-        new_vendor = VendorFactory.create_instance(
-            trade_name=trade_name,
-            statutory_name=statutory_name,
-            kvk_number=kvk_number,
+        new_vendor = vendor_repository.insert_unique(
+            Vendor,
+            {
+                "kvk_number": kvk_number,
+                "trade_name": trade_name,
+                "statutory_name": statutory_name,
+            },
         )
-        vendor_repository.create(new_vendor)
+        if new_vendor is None:
+            raise VendorAlreadyExistsException()
 
         return new_vendor
 
@@ -65,32 +96,167 @@ class VendorService:
     def remove_one(
         self, vendor_id: UUID, *, vendor_repository: VendorRepository = get_repository()
     ) -> Vendor:
-        vendor = vendor_repository.get(id=vendor_id)
-        if vendor is None:
+        # Checked first, so the applications of a vendor in use are not loaded
+        if vendor_repository.in_use([vendor_id]):
+            raise VendorCannotBeDeletedException()
+
+        # Guarded again in the delete, as the cascade would take along applications
+        # that were added in the meantime
+        deleted = vendor_repository.delete_returning(
+            Vendor, Vendor.id == vendor_id, ~Vendor.applications.any()
+        )
+        if not deleted:
             raise VendorNotFoundException()
 
-        vendor_has_applications = self._vendor_has_applications(vendor)
-        if vendor_has_applications:
-            raise VendorCannotBeDeletedException()
+        return deleted[0]
 
-        vendor_repository.delete(vendor)
+    @session_manager
+    def add_many(
+        self,
+        vendors: Sequence[VendorCreateDto],
+        *,
+        vendor_repository: VendorRepository = get_repository(),
+    ) -> List[BulkItemResult]:
+        """
+        Registers a batch of vendors in one transaction. Vendors whose KVK number or
+        trade name is in use, or taken by an earlier vendor of the batch, are
+        reported as a conflict; the others are created.
+        """
+        taken_kvk_numbers, taken_trade_names = vendor_repository.taken_names(
+            [vendor.kvk_number for vendor in vendors],
+            [vendor.trade_name for vendor in vendors],
+        )
+        results: dict[int, BulkItemResult] = {}
+        new_vendors: dict[int, VendorCreateDto] = {}
+        for index, vendor in enumerate(vendors):
+            if (
+                vendor.kvk_number in taken_kvk_numbers
+                or vendor.trade_name in taken_trade_names
+            ):
+                results[index] = BulkItemResult.failed(
+                    index, VendorAlreadyExistsException()
+                )
+                continue
 
-        return vendor
+            taken_kvk_numbers.add(vendor.kvk_number)
+            taken_trade_names.add(vendor.trade_name)
+            new_vendors[index] = vendor
+
+        vendor_ids = vendor_repository.insert_many(
+            Vendor, [vendor.model_dump() for vendor in new_vendors.values()]
+        )
+        for index, vendor_id in zip(new_vendors, vendor_ids):
+            results[index] = BulkItemResult(
+                index=index, status=BulkItemStatus.CREATED, id=vendor_id
+            )
+
+        return [results[index] for index in range(len(vendors))]
+
+    @session_manager
+    def remove_many(
+        self,
+        vendor_ids: Sequence[UUID],
+        *,
+        vendor_repository: VendorRepository = get_repository(),
+    ) -> List[BulkItemResult]:
+        """
+        Deletes a batch of vendors in one transaction. Vendors that still have
+        applications are reported as a conflict and kept.
+        """
+        in_use = vendor_repository.in_use(vendor_ids)
+        deleted = vendor_repository.delete_many(
+            Vendor, set(vendor_ids) - in_use, ~Vendor.applications.any()
+        )
+        results = []
+        for index, vendor_id in enumerate(vendor_ids):
+            if vendor_id in in_use:
+                result = BulkItemResult.failed(
+                    index, VendorCannotBeDeletedException(), vendor_id
+                )
+            elif vendor_id not in deleted:
+                result = BulkItemResult.failed(
+                    index, VendorNotFoundException(), vendor_id
+                )
+            else:
+                deleted.remove(vendor_id)
+                result = BulkItemResult(
+                    index=index, status=BulkItemStatus.DELETED, id=vendor_id
+                )
+            results.append(result)
+
+        return results
 
     @session_manager
     def get_paginated(
         self,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        count_mode: CountMode | None = CountMode.EXACT,
+        expand: Collection[str] | None = None,
+        filters: TimestampFilterQueryParams | None = None,
         *,
         vendor_repository: VendorRepository = get_repository(),
     ) -> Page[VendorDto]:
-        vendors = vendor_repository.get_many(limit=limit, offset=offset)
-        total = vendor_repository.count()
+        page = vendor_repository.get_page(
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
+            options=vendor_repository.loader_options(expand),
+            criteria=vendor_repository.timestamp_criteria(filters),
+        )
+
+        vendors_dto = map_vendor_entities_to_dtos(page.items, expand)
+        return Page(
+            items=vendors_dto,
+            total=page.total,
+            offset=offset,
+            limit=limit,
+            next_cursor=page.next_cursor,
+        )
 
-        vendors_dto = [map_vendor_entity_to_dto(vendor) for vendor in vendors]
-        return Page(items=vendors_dto, total=total, offset=offset, limit=limit)
+    @session_manager
+    def get_paginated_json(
+        self,
+        limit: int,
+        offset: int,
+        cursor: str | None = None,
+        count_mode: CountMode | None = CountMode.EXACT,
+        fields: Collection[str] | None = None,
+        filters: TimestampFilterQueryParams | None = None,
+        *,
+        vendor_repository: VendorRepository = get_repository(),
+    ) -> bytes:
+        """
+        Returns the page of `get_paginated` serialized as JSON. The database renders
+        every vendor with its applications, so no entities are loaded. Only the DTO
+        fields in `fields` are included.
+        """
+        page = vendor_repository.get_json_page(
+            vendor_repository.json_item(fields),
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
+            criteria=vendor_repository.timestamp_criteria(filters),
+        )
+        return json_page(
+            page.items,
+            limit=limit,
+            offset=offset,
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
 
-    @staticmethod
-    def _vendor_has_applications(vendor: Vendor) -> bool:
-        return len(vendor.applications) > 0
+    def export(self, batch_size: int = 500) -> Iterator[VendorDto]:
+        """
+        Yields every vendor, read in batches from a server-side cursor. The
+        session stays open until the iterator is exhausted or closed.
+        """
+        with streaming_session() as session:
+            vendor_repository = VendorRepository(session)
+            for vendor in vendor_repository.stream(
+                batch_size=batch_size, options=vendor_repository.loader_options()
+            ):
+                yield map_vendor_entity_to_dto(vendor)
@@ -0,0 +1,297 @@
+import functools
+import logging
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from inspect import Parameter, signature
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    ParamSpec,
+    Type,
+    TypeVar,
+    get_type_hints,
+)
+
+import inject
+from gfmodules_python_shared.repository.base import RepositoryBase
+from gfmodules_python_shared.session.session_manager import (
+    get_repository,
+    session_manager as shared_session_manager,
+)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.metrics.database import track_queries
+
+__all__ = [
+    "ReadReplica",
+    "UnitOfWork",
+    "after_commit",
+    "get_repository",
+    "mapped",
+    "reading_from_replica",
+    "run_in_session",
+    "session_manager",
+    "streaming_session",
+    "unit_of_work",
+    "use_primary",
+    "use_replica",
+    "use_session",
+]
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+R = TypeVar("R")
+
+_active_session: ContextVar[Session | None] = ContextVar("active_session", default=None)
+
+
+class ReadReplica:
+    """
+    Session factories on a read replica of the database. Its engines are expected
+    to open READ ONLY transactions.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        async_session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        self.session_factory = session_factory
+        self.async_session_factory = async_session_factory
+
+
+_active_replica: ContextVar[ReadReplica | None] = ContextVar(
+    "active_replica", default=None
+)
+
+
+@contextmanager
+def use_replica(replica: ReadReplica) -> Iterator[ReadReplica]:
+    """
+    Makes run_in_session() and streaming_session() inside the block open their
+    sessions on `replica` instead of the primary. Only for code that does not
+    write, e.g. while handling a GET request.
+    """
+    token = _active_replica.set(replica)
+    try:
+        yield replica
+    finally:
+        _active_replica.reset(token)
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """
+    Makes run_in_session() and streaming_session() inside the block open their
+    sessions on the primary again, inside a block of use_replica().
+    """
+    token = _active_replica.set(None)
+    try:
+        yield
+    finally:
+        _active_replica.reset(token)
+
+
+def reading_from_replica() -> bool:
+    """
+    Returns whether sessions opened here run on a replica, see use_replica().
+    """
+    return _active_replica.get() is not None
+
+
+@contextmanager
+def use_session(session: Session) -> Iterator[Session]:
+    """
+    Makes every @session_manager service method called inside the block use
+    `session` instead of opening its own. Committing is left to the owner of the
+    session.
+    """
+    token = _active_session.set(session)
+    try:
+        yield session
+    finally:
+        _active_session.reset(token)
+
+
+def session_manager(func: Callable[P, T]) -> Callable[P, T]:
+    """
+    Same as the shared @session_manager, except that the repositories are created
+    on the active session when the method is called inside use_session(). The
+    number of SQL statements each call executes is logged at debug level.
+    """
+    managed = shared_session_manager(func)
+    repositories = _repository_parameters(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        with track_queries() as stats:
+            try:
+                session = _active_session.get()
+                if session is None:
+                    return managed(*args, **kwargs)  # type: ignore
+
+                for name, repository in repositories.items():
+                    kwargs.setdefault(name, repository(session))
+                return func(*args, **kwargs)
+            finally:
+                logger.debug(
+                    "%s executed %d SQL statements in %.1f ms",
+                    func.__qualname__,
+                    stats.statements,
+                    stats.duration * 1000,
+                )
+
+    return wrapper
+
+
+def _repository_parameters(func: Callable[..., Any]) -> dict[str, Type[Any]]:
+    hints = get_type_hints(func)
+    repositories = {}
+    for name, parameter in signature(func).parameters.items():
+        hint = hints.get(name)
+        if (
+            parameter.kind is Parameter.KEYWORD_ONLY
+            and isinstance(hint, type)
+            and issubclass(hint, RepositoryBase)
+        ):
+            repositories[name] = hint
+
+    return repositories
+
+
+class UnitOfWork:
+    """
+    The session that the service calls of one request share. It is opened by the
+    first call, so requests that do not reach the database do not check out a
+    connection, and committed once by the owner of the unit of work.
+    """
+
+    def __init__(self) -> None:
+        self.session: AsyncSession | None = None
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        if self.session is None:
+            self.session = _async_session_factory()()
+
+        try:
+            return await self.session.run_sync(_call_in_session, func, *args, **kwargs)
+        except Exception:
+            # The request fails, nothing it wrote may be committed by a later call
+            await self.session.rollback()
+            raise
+
+    async def commit(self) -> None:
+        if self.session is not None:
+            await self.session.commit()
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+_active_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar(
+    "active_unit_of_work", default=None
+)
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """
+    Makes every run_in_session() inside the block use one session. The caller
+    commits it; whatever is not committed when the block ends is rolled back.
+    """
+    work = UnitOfWork()
+    token = _active_unit_of_work.set(work)
+    try:
+        yield work
+    finally:
+        _active_unit_of_work.reset(token)
+        await work.close()
+
+
+async def run_in_session(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Runs a service call on a connection of the async engine and commits once it
+    returns. The call runs on the event loop through AsyncSession.run_sync rather
+    than on a worker thread, so the number of concurrent requests is bounded by
+    the connection pool instead of the threadpool. Service methods that call each
+    other share the session.
+
+    Inside unit_of_work() the call runs in the session of the unit of work, and
+    committing is left to its owner.
+    """
+    work = _active_unit_of_work.get()
+    if work is not None:
+        return await work.run(func, *args, **kwargs)
+
+    async with _async_session_factory()() as session:
+        result = await session.run_sync(_call_in_session, func, *args, **kwargs)
+        await session.commit()
+        return result
+
+
+def _async_session_factory() -> async_sessionmaker[AsyncSession]:
+    replica = _active_replica.get()
+    if replica is not None:
+        return replica.async_session_factory
+
+    return inject.instance(async_sessionmaker[AsyncSession])
+
+
+def mapped(mapper: Callable[[T], R], func: Callable[P, T]) -> Callable[P, R]:
+    """
+    Returns `func` with `mapper` applied to its result, so a service call passed
+    to run_in_session() builds its DTO in the session that loaded the entities.
+    The session is flushed first, so the rows the call created have their ids and
+    column defaults, as they have when the DTO is built after the commit.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        result = func(*args, **kwargs)
+        session = _active_session.get()
+        if session is not None:
+            session.flush()
+        return mapper(result)
+
+    return wrapper
+
+
+def _call_in_session(
+    session: Session, func: Callable[..., T], /, *args: Any, **kwargs: Any
+) -> T:
+    with use_session(session):
+        return func(*args, **kwargs)
+
+
+def after_commit(session: Session, callback: Callable[[], Any]) -> None:
+    """
+    Calls `callback` once the current transaction of `session` commits, e.g. to
+    drop cached data it changed. Waiting for the commit keeps readers from caching
+    the old data again while the transaction is still open.
+    """
+    event.listen(session, "after_commit", lambda _: callback(), once=True)
+
+
+@contextmanager
+def streaming_session() -> Iterator[Session]:
+    """
+    Opens a session for results that are consumed lazily, such as exports that are
+    streamed to the client. Unlike @session_manager, the session stays open until
+    the caller is done iterating, instead of closing when the service call returns.
+    """
+    replica = _active_replica.get()
+    session_factory = (
+        replica.session_factory
+        if replica is not None
+        else inject.instance(sessionmaker[Session])
+    )
+    with session_factory() as session:
+        yield session
@@ -1,8 +1,10 @@
 from app.exceptions.http_base_exceptions import (
+    BadRequestException,
     NotFoundException,
     ConflictException,
     ServiceUnavailableException,
     MethodNotAllowedException,
+    PreconditionFailedException,
 )
 
 
@@ -162,3 +164,23 @@ class HealthcareProviderQualificationAlreadyArchivedException(ConflictException)
 class HealthcareProviderNotQualifiedForProtocolException(NotFoundException):
     def __init__(self) -> None:
         super().__init__("Healthcare provider is not qualified for the protocol")
+
+
+class InvalidCursorException(BadRequestException):
+    def __init__(self) -> None:
+        super().__init__("Invalid pagination cursor")
+
+
+class InvalidFieldSelectionException(BadRequestException):
+    def __init__(self) -> None:
+        super().__init__("Unknown field in fields or expand")
+
+
+class ResourceModifiedException(PreconditionFailedException):
+    def __init__(self) -> None:
+        super().__init__("Resource was modified, If-Match does not match its ETag")
+
+
+class SnapshotUnavailableException(ServiceUnavailableException):
+    def __init__(self) -> None:
+        super().__init__("The register snapshot has not been loaded yet")
@@ -3,6 +3,11 @@ from fastapi.exceptions import HTTPException
 # Reference can be found https://www.rfc-editor.org/rfc/rfc9110.html#status.409
 
 
+class BadRequestException(HTTPException):
+    def __init__(self, detail: str = "Bad Request"):
+        super().__init__(status_code=400, detail=detail)
+
+
 class NotFoundException(HTTPException):
     def __init__(self, detail: str = "Not found"):
         super().__init__(status_code=404, detail=detail)
@@ -21,3 +26,8 @@ class ConflictException(HTTPException):
 class ServiceUnavailableException(HTTPException):
     def __init__(self, detail: str = "Service Unavailable"):
         super().__init__(status_code=503, detail=detail)
+
+
+class PreconditionFailedException(HTTPException):
+    def __init__(self, detail: str = "Precondition Failed"):
+        super().__init__(status_code=412, detail=detail)
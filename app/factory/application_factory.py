@@ -23,21 +23,31 @@ class ApplicationFactory:
         Creates a new Application instance with populated children properties.
         """
         new_application = Application(name=application_name)
-        version = ApplicationVersion(version=application_version)
-        new_application.versions.append(version)
         new_application.vendor = vendor
+        ApplicationFactory.add_children(
+            new_application, application_version, application_types, application_roles
+        )
+
+        return new_application
+
+    @staticmethod
+    def add_children(
+        application: Application,
+        application_version: str,
+        application_types: Sequence[SystemType],
+        application_roles: Sequence[Role],
+    ) -> None:
+        """
+        Adds the first version, roles and system types to a new application.
+        """
+        version = ApplicationVersion(version=application_version)
+        application.versions.append(version)
 
         for role in application_roles:
-            new_application_role = ApplicationRolesFactory.create_instance(
-                application=new_application, role=role
-            )
-            new_application.roles.append(new_application_role)
+            ApplicationRolesFactory.create_instance(application=application, role=role)
 
         for system_type in application_types:
-            new_application_type = ApplicationTypeFactory.create_instance(
-                application=new_application,
+            ApplicationTypeFactory.create_instance(
+                application=application,
                 system_type=system_type,
             )
-            new_application.system_types.append(new_application_type)
-
-        return new_application
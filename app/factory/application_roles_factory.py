@@ -9,9 +9,10 @@ class ApplicationRolesFactory:
     def create_instance(application: Application, role: Role) -> ApplicationRole:
         """
         Creates a new instance of Application Role with parent Application and child Role
-        assigned
+        assigned. It is added to the roles of the application, which adds it to the
+        session of the application as well.
         """
         new_instance = ApplicationRole()
-        new_instance.application = application
+        application.roles.append(new_instance)
         new_instance.role = role
         return new_instance
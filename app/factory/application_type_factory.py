@@ -11,9 +11,10 @@ class ApplicationTypeFactory:
     ) -> ApplicationType:
         """
         Creates a new rich instance of ApplicationType with parent Application and child
-        System type assigned
+        System type assigned. It is added to the system types of the application,
+        which adds it to the session of the application as well.
         """
         new_instance = ApplicationType()
-        new_instance.application = application
+        application.system_types.append(new_instance)
         new_instance.system_type = system_type
         return new_instance
@@ -12,10 +12,11 @@ class HealthcareProviderApplicationVersionFactory:
     ) -> HealthcareProviderApplicationVersion:
         """
         Create a new rich instance of a HealthcareProviderApplicationVersion with parent HealthcareProvider and
-         ApplicationVersion child assigned
+         ApplicationVersion child assigned. It is added to the application versions of the
+         healthcare provider, which adds it to the session of the provider as well.
         """
         new_instance = HealthcareProviderApplicationVersion()
-        new_instance.healthcare_provider = healthcare_provider
+        healthcare_provider.application_versions.append(new_instance)
         new_instance.application_version = application_version
 
         return new_instance
@@ -21,12 +21,9 @@ class HealthcareProviderFactory:
             trade_name=trade_name,
             statutory_name=statutory_name,
         )
-        qualified_protocol_version = (
-            HealthcareProviderQualificationFactory.create_instance(
-                healthcare_provider=new_healthcare_provider,
-                protocol_version=protocol_version,
-                qualification_date=date.today(),
-            )
+        HealthcareProviderQualificationFactory.create_instance(
+            healthcare_provider=new_healthcare_provider,
+            protocol_version=protocol_version,
+            qualification_date=date.today(),
         )
-        new_healthcare_provider.qualified_protocols.append(qualified_protocol_version)
         return new_healthcare_provider
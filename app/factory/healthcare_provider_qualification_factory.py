@@ -10,7 +10,8 @@ from app.db.entities.protocol_version import ProtocolVersion
 class HealthcareProviderQualificationFactory:
     """
     Factory class to create an instance of the HealthcareProviderQualification association between
-    parent HealthcareProvider and child ProtocolVersion
+    parent HealthcareProvider and child ProtocolVersion. The instance is added to the qualified
+    protocols of the healthcare provider.
     """
 
     @staticmethod
@@ -23,5 +24,5 @@ class HealthcareProviderQualificationFactory:
             qualification_date=qualification_date
         )
         new_instance.protocol_version = protocol_version
-        new_instance.healthcare_provider = healthcare_provider
+        healthcare_provider.qualified_protocols.append(new_instance)
         return new_instance
@@ -18,6 +18,7 @@ def setup_default_middleware_and_routers(
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag"],
     )
 
     for router in routers:
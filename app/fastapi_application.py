@@ -1,6 +1,7 @@
 import logging
+from contextlib import asynccontextmanager
 
-from typing import Any
+from typing import Any, AsyncIterator
 
 from fastapi import FastAPI
 import uvicorn
@@ -13,15 +14,60 @@ from app.routers.v1.healthcare_provider_router import (
     router as healthcare_provider_router,
 )
 from app.routers.v1.roles_router import router as roles_router
+from app.routers.v1.search_router import router as search_router
 from app.routers.v1.protocol_router import router as protocol_router
 from app.routers.v1.qualification_router import (
     router as qualification_router,
 )
+from app.routers.v1.snapshot_router import router as snapshot_router
 
 from app.fastapi.setup import fastapi_mount_api, setup_default_middleware_and_routers
 from app.routers.default import router as default_router
-from app.routers.health import router as health_router
-from app.config import get_config
+from app.routers.health import (
+    router as health_router,
+    snapshot_router as snapshot_health_router,
+)
+from app.routers.metrics import router as metrics_router
+from app.middleware.conditional_request import ConditionalRequestMiddleware
+from app.middleware.response_cache import ResponseCacheMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.query_count import QueryCountHeaderMiddleware
+from app.middleware.read_replica import ReadReplicaMiddleware
+from app.middleware.unit_of_work import UnitOfWorkMiddleware
+from app.config import ResponseCacheBackendType, get_config
+from app.container import (
+    get_read_replica,
+    get_response_cache,
+    get_snapshot_refresher,
+)
+
+APPLICATION_TABLES = (
+    "applications",
+    "application_versions",
+    "applications_roles",
+    "roles",
+    "applications_types",
+    "system_types",
+    "vendors",
+)
+
+# The list pages of the v1 api that are cached, with the tables their DTOs and filters
+# are built from
+CACHED_LIST_PAGES = {
+    "/vendors": APPLICATION_TABLES,
+    "/applications": (*APPLICATION_TABLES, "protocol_application_qualifications"),
+    "/roles": ("roles",),
+    "/system-types": ("system_types",),
+    "/protocols": ("protocols", "protocol_versions"),
+    "/healthcare-provider": (
+        "healthcare_providers",
+        "healthcare_providers_application_versions",
+        "application_versions",
+        "healthcare_providers_qualifications",
+        "protocol_versions",
+    ),
+    "/search": ("vendors", "applications", "healthcare_providers"),
+}
 
 
 def get_uvicorn_params() -> dict[str, Any]:
@@ -77,8 +123,13 @@ def create_fastapi_app() -> FastAPI:
         routers=[
             default_router,
             health_router,
+            metrics_router,
         ],
     )
+    # Added to the root app only, so requests to the mounted APIs are measured once
+    fastapi.add_middleware(MetricsMiddleware)
+    if config.app.debug_queries:
+        fastapi.add_middleware(QueryCountHeaderMiddleware)
 
     # v1 api
 
@@ -109,8 +160,21 @@ def create_fastapi_app() -> FastAPI:
             {
                 "name": "Qualification",
             },
+            {
+                "name": "Search",
+            },
         ]
     )
+    # Added before the default middleware, so it runs inside the CORS and api-version
+    # middleware and responses served from the cache carry their headers as well. It
+    # also runs inside the middleware that picks the replica, and builds the pages it
+    # stores on the primary
+    if config.cache.response_backend != ResponseCacheBackendType.none:
+        fastapi_v1.add_middleware(
+            ResponseCacheMiddleware,
+            backend=get_response_cache(),
+            pages=CACHED_LIST_PAGES,
+        )
     setup_default_middleware_and_routers(
         fastapi=fastapi_v1,
         routers=[
@@ -121,9 +185,87 @@ def create_fastapi_app() -> FastAPI:
             protocol_router,
             healthcare_provider_router,
             qualification_router,
+            search_router,
         ],
         api_version="1.0.0",
     )
+    # Added first, so it runs inside the middleware that picks the replica
+    fastapi_v1.add_middleware(UnitOfWorkMiddleware)
+    if config.database_replica is not None:
+        fastapi_v1.add_middleware(
+            ReadReplicaMiddleware,
+            replica=get_read_replica(),
+            sticky_seconds=config.database_replica.sticky_seconds,
+        )
+    fastapi_v1.add_middleware(ConditionalRequestMiddleware)
+    fastapi_mount_api(root_fastapi=fastapi, mount_path="/v1", api=fastapi_v1)
+
+    return fastapi
+
+
+def create_snapshot_app() -> FastAPI:
+    """
+    The public, read-only API. It has the GET endpoints of the v1 api and serves
+    them from an in-memory snapshot of the register, so it does not query the
+    database per request. It connects with the dsn of the [snapshot] section,
+    which should be the qualification_api user that can only SELECT.
+    """
+    application_init()
+
+    config = get_config()
+    if config.snapshot is None:
+        raise ValueError("The read-only API needs a [snapshot] section in app.conf")
+
+    title = "Qualification Register API"
+    docs_url = None
+    redoc_url = None
+
+    if config.uvicorn.swagger_enabled:
+        docs_url = config.uvicorn.docs_url
+        redoc_url = config.uvicorn.redoc_url
+
+    refresher = get_snapshot_refresher()
+
+    # Mounted apps do not run a lifespan of their own, so it is on the root app
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        await refresher.start()
+        yield
+        await refresher.stop()
+
+    fastapi = FastAPI(
+        title=title,
+        description="This is the documentation of the root endpoints. "
+                    "For the rest of the API documentation see the [/v1/docs](/v1/docs).",
+        docs_url=docs_url,
+        redoc_url=redoc_url,
+        lifespan=lifespan,
+    )
+
+    setup_default_middleware_and_routers(
+        fastapi=fastapi,
+        routers=[
+            default_router,
+            snapshot_health_router,
+            metrics_router,
+        ],
+    )
+    fastapi.add_middleware(MetricsMiddleware)
+
+    # v1 api
+
+    fastapi_v1 = CustomFastAPI(
+        title=title,
+        description="This is the documentation of the read-only /v1 endpoints.",
+        docs_url=docs_url,
+        redoc_url=redoc_url,
+    )
+    setup_default_middleware_and_routers(
+        fastapi=fastapi_v1,
+        routers=[snapshot_router],
+        api_version="1.0.0",
+    )
+    fastapi_v1.add_middleware(ConditionalRequestMiddleware)
     fastapi_mount_api(root_fastapi=fastapi, mount_path="/v1", api=fastapi_v1)
 
     return fastapi
@@ -0,0 +1,132 @@
+import functools
+import hashlib
+from datetime import datetime
+from typing import Callable, Collection, ParamSpec, TypeVar
+from uuid import UUID
+
+from fastapi.responses import Response
+
+from app.db.session_manager import run_in_session
+from app.exceptions.app_exceptions import ResourceModifiedException
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Strong ETag of a response body, for responses that are not a single resource,
+    such as collection pages.
+    """
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def resource_etag(
+    resource_id: UUID, modified_at: datetime, fields: Collection[str] | None = None
+) -> str:
+    """
+    Strong ETag of a resource, derived from its `modified_at` instead of its body,
+    so it is known before the resource is loaded. `modified_at` is bumped whenever
+    the resource or a row nested in its representation changes. The selected
+    `fields` are a different representation of the same resource, so they are
+    part of the tag.
+    """
+    variant = "*" if fields is None else ",".join(sorted(fields))
+    key = f"{resource_id}:{modified_at.isoformat()}:{variant}"
+    return compute_etag(key.encode())
+
+
+def etag_matches(header: str, etag: str, weak: bool = False) -> bool:
+    """
+    Checks a comma separated If-Match or If-None-Match header against `etag`.
+    If-None-Match uses the weak comparison, which ignores the W/ prefix; If-Match
+    uses the strong comparison, which a weak tag never matches.
+    """
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            if not weak:
+                continue
+            tag = tag[2:]
+        if tag == etag:
+            return True
+
+    return False
+
+
+async def run_if_match(
+    if_match: str | None,
+    current: Callable[[], str],
+    func: Callable[P, T],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> T:
+    """
+    Runs a mutation with run_in_session, after checking that the resource still
+    has the ETag the client sent in If-Match. `current` returns the ETag of the
+    resource in the same transaction as the mutation, and must lock the row of the
+    resource (e.g. `get_modified_at(..., lock=True)`). Concurrent mutations with
+    the same tag then run one after the other, and the later one fails the check
+    because it sees the `modified_at` the earlier one committed.
+    """
+    return await run_in_session(
+        _call_if_match, if_match, current, functools.partial(func, *args, **kwargs)
+    )
+
+
+def _call_if_match(
+    if_match: str | None,
+    current: Callable[[], str],
+    mutation: Callable[[], T],
+) -> T:
+    if if_match is not None and not etag_matches(if_match, current()):
+        raise ResourceModifiedException()
+
+    return mutation()
+
+
+async def run_if_none_match(
+    if_none_match: str | None,
+    current: Callable[[], str],
+    func: Callable[P, T],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> tuple[str, T | None]:
+    """
+    Runs a read of a single resource with run_in_session, unless the client's copy
+    still has the ETag of the resource. `current` returns that tag with a lookup
+    of the row of the resource, in the same transaction as the read. Returns the
+    tag and the result of the read, or None when the read was skipped.
+    """
+    return await run_in_session(
+        _call_if_none_match,
+        if_none_match,
+        current,
+        functools.partial(func, *args, **kwargs),
+    )
+
+
+def _call_if_none_match(
+    if_none_match: str | None,
+    current: Callable[[], str],
+    read: Callable[[], T],
+) -> tuple[str, T | None]:
+    etag = current()
+    if if_none_match is not None and etag_matches(if_none_match, etag, weak=True):
+        return etag, None
+
+    return etag, read()
+
+
+def conditional_response(etag: str, response: Response | None) -> Response:
+    """
+    Returns `response` with its ETag, or 304 Not Modified when the read of
+    `run_if_none_match` was skipped.
+    """
+    if response is None:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return response
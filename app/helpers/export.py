@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.schemas.enums.export_format import ExportFormat
+
+CHUNK_SIZE = 64 * 1024
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def to_ndjson(items: Iterable[BaseModel]) -> Iterator[str]:
+    for item in items:
+        yield item.model_dump_json(by_alias=True) + "\n"
+
+
+def to_csv(items: Iterable[BaseModel], model: Type[BaseModel]) -> Iterator[str]:
+    """
+    Writes one row per item. Nested objects and lists are written as JSON in a
+    single cell.
+    """
+    buffer = io.StringIO()
+    fieldnames = [field.alias or name for name, field in model.model_fields.items()]
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+
+    writer.writeheader()
+    for item in items:
+        row = item.model_dump(mode="json", by_alias=True)
+        writer.writerow(
+            {
+                key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                for key, value in row.items()
+            }
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def chunked(lines: Iterable[str], size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Groups small lines into chunks of roughly `size` characters, so every row does
+    not become a separate write to the client.
+    """
+    chunk: list[str] = []
+    length = 0
+    for line in lines:
+        chunk.append(line)
+        length += len(line)
+        if length >= size:
+            yield "".join(chunk)
+            chunk = []
+            length = 0
+
+    if chunk:
+        yield "".join(chunk)
+
+
+def export_response(
+    items: Iterable[BaseModel],
+    model: Type[BaseModel],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    lines = (
+        to_csv(items, model) if export_format == ExportFormat.CSV else to_ndjson(items)
+    )
+
+    return StreamingResponse(
+        chunked(lines),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'
+        },
+    )
@@ -0,0 +1,93 @@
+from typing import Any, Collection, NamedTuple, Type, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.exceptions.app_exceptions import InvalidFieldSelectionException
+from app.helpers.responses import MEDIA_TYPE, dto_response
+from app.schemas.field_selection_query_params.schema import FieldSelectionQueryParams
+from app.schemas.meta.schema import Page
+
+TModel = TypeVar("TModel", bound=BaseModel)
+
+
+class FieldSelection(NamedTuple):
+    """
+    Fields of a DTO to return and relationships to load. None means all of them.
+    """
+
+    include: set[str] | None
+    expand: set[str] | None
+
+
+def parse_field_names(value: str | None, model: Type[BaseModel]) -> set[str] | None:
+    """
+    Parses a comma separated list of field names. Both the camelCase names used in
+    the API and the snake_case field names are accepted.
+    """
+    if value is None:
+        return None
+
+    aliases = {field.alias or name: name for name, field in model.model_fields.items()}
+    names = set()
+    for raw_name in value.split(","):
+        raw_name = raw_name.strip()
+        if not raw_name:
+            continue
+
+        name = aliases.get(raw_name, raw_name)
+        if name not in model.model_fields:
+            raise InvalidFieldSelectionException()
+
+        names.add(name)
+
+    return names
+
+
+def select_fields(
+    query: FieldSelectionQueryParams,
+    model: Type[BaseModel],
+    expandable: Collection[str],
+) -> FieldSelection:
+    """
+    Relationships are loaded when they are listed in `expand` or in `fields`. When
+    only `expand` is given, all plain fields are returned next to the expanded
+    relationships.
+    """
+    fields = parse_field_names(query.fields, model)
+    expand = parse_field_names(query.expand, model)
+    if fields is None and expand is None:
+        return FieldSelection(include=None, expand=None)
+
+    if expand is not None and not expand.issubset(expandable):
+        raise InvalidFieldSelectionException()
+
+    loaded = (expand or set()) | (fields or set()).intersection(expandable)
+    plain_fields = set(model.model_fields).difference(expandable)
+    include = (fields if fields is not None else plain_fields) | loaded
+
+    return FieldSelection(include=include, expand=loaded)
+
+
+def sparse_response(dto: BaseModel, selection: FieldSelection) -> Response:
+    if selection.include is None:
+        return dto_response(dto)
+
+    return _json_response(dto, selection.include)
+
+
+def sparse_page_response(page: Page[TModel], selection: FieldSelection) -> Response:
+    if selection.include is None:
+        return dto_response(page)
+
+    include: dict[str, Any] = {name: True for name in page.model_fields}
+    include["items"] = {"__all__": selection.include}
+    return _json_response(page, include)
+
+
+def _json_response(model: BaseModel, include: Any) -> Response:
+    # DTOs built for a sparse response only have the selected fields set
+    return Response(
+        model.model_dump_json(by_alias=True, exclude_unset=True, include=include),
+        media_type=MEDIA_TYPE,
+    )
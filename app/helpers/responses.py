@@ -0,0 +1,33 @@
+from typing import Sequence, Type
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.schemas.mapping import TModel, dto_list_adapter
+
+MEDIA_TYPE = "application/json"
+
+
+def dto_response(dto: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serializes `dto` straight to JSON. A DTO returned from a route is validated
+    against the response model once more, dumped to a dict and then encoded,
+    which costs more than building it. Routes return this instead and keep their
+    `response_model` for the API documentation.
+    """
+    return Response(
+        dto.model_dump_json(by_alias=True),
+        status_code=status_code,
+        media_type=MEDIA_TYPE,
+    )
+
+
+def json_response(body: bytes) -> Response:
+    return Response(body, media_type=MEDIA_TYPE)
+
+
+def dto_list_response(dtos: Sequence[TModel], model: Type[TModel]) -> Response:
+    return Response(
+        dto_list_adapter(model).dump_json(list(dtos), by_alias=True),
+        media_type=MEDIA_TYPE,
+    )
@@ -0,0 +1,155 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections import Counter
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Iterator, Type, TypeVar
+
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+from app.metrics.registry import Gauge, Histogram, LabelValues
+
+TPool = TypeVar("TPool", bound=QueuePool)
+
+_engines: dict[str, Engine] = {}
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    duration: float = 0.0
+    executed: Counter[str] = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """
+        Returns the statements executed at least `threshold` times. The same
+        statement running once per row of an earlier result is the usual sign of
+        an N+1 query.
+        """
+        return {
+            statement: count
+            for statement, count in self.executed.items()
+            if count >= threshold
+        }
+
+
+_active_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    "active_query_stats", default=()
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Counts the statements executed by instrumented engines inside the block, and
+    the time spent executing them. Blocks can be nested; a statement counts for
+    every block it runs in.
+    """
+    stats = QueryStats()
+    token = _active_stats.set((*_active_stats.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Registers the engine for the pool gauges under `name` and times every
+    statement it executes. For an AsyncEngine pass its sync_engine.
+    """
+    _engines[name] = engine
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    context.query_start_time = perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    active = _active_stats.get()
+    if not active:
+        return
+
+    elapsed = perf_counter() - context.query_start_time
+    for stats in active:
+        stats.statements += 1
+        stats.duration += elapsed
+        stats.executed[statement] += 1
+
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    labels=["pool"],
+)
+
+
+def timed_pool(pool_class: Type[TPool], name: str) -> Type[TPool]:
+    """
+    Returns a subclass of `pool_class` that records how long each checkout waits
+    for a connection. Pass it to create_engine() as `poolclass`. It is a class
+    rather than an event listener because the pool has no event before checkout.
+    """
+
+    def _do_get(self: QueuePool) -> ConnectionPoolEntry:
+        start = perf_counter()
+        try:
+            return pool_class._do_get(self)
+        finally:
+            POOL_CHECKOUT_WAIT.observe(perf_counter() - start, name)
+
+    return type(f"Timed{pool_class.__name__}", (pool_class,), {"_do_get": _do_get})
+
+
+def _pool_stat(stat: str) -> dict[LabelValues, float]:
+    values: dict[LabelValues, float] = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            continue
+
+        if stat == "checked_out":
+            values[(name,)] = pool.checkedout()
+        elif stat == "overflow":
+            values[(name,)] = max(pool.overflow(), 0)
+        elif stat == "size":
+            values[(name,)] = pool.size()
+
+    return values
+
+
+Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    labels=["pool"],
+    collect=lambda: _pool_stat("checked_out"),
+)
+Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size",
+    labels=["pool"],
+    collect=lambda: _pool_stat("overflow"),
+)
+Gauge(
+    "db_pool_size",
+    "Configured number of connections kept in the pool",
+    labels=["pool"],
+    collect=lambda: _pool_stat("size"),
+)
@@ -0,0 +1,49 @@
+from typing import Callable, Awaitable
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.helpers.etag import compute_etag, etag_matches
+
+# A 304 has no body, so it does not describe one, see RFC 9110 section 15.4.5
+BODY_HEADERS = ("content-length", "content-type")
+
+
+class ConditionalRequestMiddleware(BaseHTTPMiddleware):
+    """
+    Adds a strong ETag to successful JSON responses of GET requests and answers
+    with 304 Not Modified when the request sends a matching If-None-Match. The tag
+    is a hash of the body, so it covers the items and total of collection pages.
+    Single resources are tagged by their route from their `modified_at`, which
+    answers 304 without loading them, and are passed through like streamed
+    exports.
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        response = await call_next(request)
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or response.headers.get("content-type") != "application/json"
+            or "etag" in response.headers
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[attr-defined]
+        etag = compute_etag(body)
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and etag_matches(if_none_match, etag, weak=True):
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name not in BODY_HEADERS
+            }
+            headers["ETag"] = etag
+            return Response(status_code=304, headers=headers)
+
+        headers = dict(response.headers)
+        headers["ETag"] = etag
+        return Response(content=body, status_code=200, headers=headers)
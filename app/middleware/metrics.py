@@ -0,0 +1,65 @@
+from time import perf_counter
+from typing import Callable, Awaitable
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.metrics.database import track_queries
+from app.metrics.registry import Counter, Histogram
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling a request",
+    labels=["method", "route"],
+)
+RESPONSES = Counter(
+    "http_responses_total",
+    "Responses sent, by status code",
+    labels=["method", "route", "status"],
+)
+REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "SQL statements executed while handling a request",
+    labels=["method", "route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent executing SQL statements while handling a request",
+    labels=["method", "route"],
+)
+
+
+def route_template(request: Request) -> str:
+    """
+    Returns the path template of the matched route, e.g. /v1/vendors/{vendor_id},
+    so the metrics are not split per id. The routers of mounted apps fill in the
+    route on the shared scope while the request is handled.
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return "unmatched"
+
+    return str(request.scope.get("root_path", "")) + path
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        start = perf_counter()
+        status_code = 500
+        with track_queries() as stats:
+            try:
+                response = await call_next(request)
+                status_code = response.status_code
+            finally:
+                route = route_template(request)
+                REQUEST_DURATION.observe(perf_counter() - start, request.method, route)
+                RESPONSES.inc(request.method, route, str(status_code))
+                REQUEST_DB_STATEMENTS.observe(stats.statements, request.method, route)
+                REQUEST_DB_DURATION.observe(stats.duration, request.method, route)
+
+        return response
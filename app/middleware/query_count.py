@@ -0,0 +1,42 @@
+import logging
+from typing import Callable, Awaitable
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from app.metrics.database import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCountHeaderMiddleware(BaseHTTPMiddleware):
+    """
+    Adds the number of SQL statements and the time spent on them to the response
+    headers, and logs statements that were executed `repeat_threshold` times or
+    more while handling the request.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 5):
+        super().__init__(app)
+        self.repeat_threshold = repeat_threshold
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        with track_queries() as stats:
+            response = await call_next(request)
+
+        response.headers["X-Query-Count"] = str(stats.statements)
+        response.headers["X-Query-Time"] = f"{stats.duration * 1000:.1f}ms"
+        for statement, count in stats.repeated(self.repeat_threshold).items():
+            logger.warning(
+                "Possible N+1 query: %s %s executed the same statement %d times: %s",
+                request.method,
+                request.url.path,
+                count,
+                statement,
+            )
+
+        return response
@@ -0,0 +1,57 @@
+import math
+import time
+from typing import Callable, Awaitable
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from app.db.session_manager import ReadReplica, use_replica
+
+# Time of the last successful write of the client, in seconds since the epoch
+LAST_WRITE_COOKIE = "last_write"
+READ_METHODS = ("GET", "HEAD")
+
+
+class ReadReplicaMiddleware(BaseHTTPMiddleware):
+    """
+    Runs GET and HEAD requests on `replica`. A successful request with any other
+    method marks the client with a cookie, and the client reads from the primary
+    for `sticky_seconds` after it, so it sees its own writes while the replica is
+    catching up.
+    """
+
+    def __init__(self, app: ASGIApp, replica: ReadReplica, sticky_seconds: float):
+        super().__init__(app)
+        self.replica = replica
+        self.sticky_seconds = sticky_seconds
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        if request.method not in READ_METHODS:
+            response = await call_next(request)
+            if response.status_code < 400 and self.sticky_seconds > 0:
+                response.set_cookie(
+                    LAST_WRITE_COOKIE,
+                    str(time.time()),
+                    max_age=math.ceil(self.sticky_seconds),
+                    httponly=True,
+                    samesite="strict",
+                )
+            return response
+
+        if self._wrote_recently(request):
+            return await call_next(request)
+
+        with use_replica(self.replica):
+            return await call_next(request)
+
+    def _wrote_recently(self, request: Request) -> bool:
+        try:
+            last_write = float(request.cookies.get(LAST_WRITE_COOKIE, ""))
+        except ValueError:
+            return False
+
+        return time.time() - last_write < self.sticky_seconds
@@ -0,0 +1,67 @@
+from typing import Callable, Awaitable, Collection, Mapping
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from app.cache.response_cache import ResponseCacheBackend
+from app.db.session_manager import reading_from_replica, use_primary
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """
+    Serves GET requests of the list pages in `pages` from `backend`. `pages` maps
+    the path of a page to the entity types its response is built from. Responses
+    are keyed by path, query string and the generations of those entity types, so
+    a committed change to any of them is never served from the cache. Pages that
+    are not in the cache are built on the primary, also for requests that would
+    read from a replica.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: ResponseCacheBackend,
+        pages: Mapping[str, Collection[str]],
+    ):
+        super().__init__(app)
+        self.backend = backend
+        self.pages = pages
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        path = request.scope["path"].removeprefix(request.scope.get("root_path", ""))
+        entity_types = self.pages.get(path)
+        if request.method != "GET" or entity_types is None:
+            return await call_next(request)
+
+        # The version is read before the page is built, so a page that is built
+        # while a change commits is stored under the version that is outdated
+        version = await self.backend.version(entity_types)
+        query = "&".join(sorted(request.url.query.split("&")))
+        key = f"{path}?{query}#{version}"
+        body = await self.backend.get(key)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+
+        # The generations are bumped on the primary, while a lagging replica can
+        # still build the page from before the change. Such a page would be stored
+        # under the new generations, so pages that are stored are built on the primary
+        if reading_from_replica():
+            with use_primary():
+                response = await call_next(request)
+        else:
+            response = await call_next(request)
+        if (
+            response.status_code != 200
+            or response.headers.get("content-type") != "application/json"
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[attr-defined]
+        await self.backend.set(key, body)
+        return Response(
+            content=body, status_code=200, headers=dict(response.headers)
+        )
@@ -0,0 +1,25 @@
+from typing import Awaitable, Callable
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.db.session_manager import unit_of_work
+
+
+class UnitOfWorkMiddleware(BaseHTTPMiddleware):
+    """
+    Runs the service calls of a request in one session and transaction. It is
+    committed before the response is sent when the request succeeded, and rolled
+    back when it failed, so a request checks out one connection and commits once.
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        async with unit_of_work() as work:
+            response = await call_next(request)
+            if response.status_code < 400:
+                await work.commit()
+
+        return response
@@ -95,3 +95,30 @@ def api_conflict_response() -> dict[int | str, dict[str, Any]]:
             }
         }
     }
+
+
+def api_precondition_failed_response() -> dict[int | str, dict[str, Any]]:
+    return {
+        412: {
+            "description": "The resource was modified since the ETag in If-Match",
+            "headers": {
+                **api_version_header()
+            },
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "detail": {
+                                "type": "string"
+                            }
+                        },
+                        "required": ["detail"]
+                    },
+                    "example": {
+                        "detail": "Resource was modified, If-Match does not match its ETag"
+                    }
+                }
+            }
+        }
+    }
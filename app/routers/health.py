@@ -1,9 +1,12 @@
 import logging
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from gfmodules_python_shared.session.healthy import is_healthy_database
 
+from app.container import get_snapshot_refresher
+from app.snapshot.refresher import SnapshotRefresher
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -24,3 +27,24 @@ def health() -> dict[str, Any]:
         "status": ok_or_error(all(value == "ok" for value in components.values())),
         "components": components,
     }
+
+
+snapshot_router = APIRouter()
+
+
+@snapshot_router.get("/health")
+def snapshot_health(
+    refresher: SnapshotRefresher = Depends(get_snapshot_refresher),
+) -> dict[str, Any]:
+    """
+    The read-only API is healthy while its last snapshot load succeeded, it does
+    not need the database to answer requests.
+    """
+    components = {
+        "snapshot": ok_or_error(refresher.last_error is None),
+    }
+
+    return {
+        "status": ok_or_error(all(value == "ok" for value in components.values())),
+        "components": components,
+    }
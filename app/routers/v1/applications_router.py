@@ -1,7 +1,8 @@
-from typing import List, Annotated
+from typing import Callable, List, Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Header, Query, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.exc import NoResultFound
 
 from app.container import (
@@ -10,18 +11,43 @@ from app.container import (
     get_application_version_service,
     get_application_type_service,
 )
+from app.db.session_manager import mapped, run_in_session
 from app.db.services.application_type_service import ApplicationTypeService
 from app.exceptions.http_base_exceptions import NotFoundException
 from app.schemas.application.mapper import (
+    map_application_entities_to_dtos,
     map_application_entity_to_dto,
     map_application_version_entity_to_dto,
 )
 from app.schemas.application.schema import (
+    APPLICATION_EXPANDABLE_FIELDS,
+    ApplicationCreateDto,
     ApplicationDto,
     ApplicationVersionCreateDto,
     ApplicationVersionDto,
 )
-from app.schemas.meta.schema import Page
+from app.helpers.etag import (
+    conditional_response,
+    resource_etag,
+    run_if_match,
+    run_if_none_match,
+)
+from app.helpers.export import export_response
+from app.helpers.responses import dto_list_response, json_response
+from app.helpers.field_selection import (
+    select_fields,
+    sparse_page_response,
+    sparse_response,
+)
+from app.schemas.enums.export_format import ExportFormat
+from app.schemas.field_selection_query_params.schema import FieldSelectionQueryParams
+from app.schemas.filter_query_params.schema import ApplicationFilterQueryParams
+from app.schemas.meta.schema import (
+    BULK_LIMIT,
+    BulkDeleteDto,
+    BulkItemResult,
+    Page,
+)
 from app.schemas.pagination_query_params.schema import PaginationQueryParams
 from app.schemas.vendor.schema import VendorApplicationCreateDto
 from app.db.services.application_roles_service import ApplicationRolesService
@@ -31,113 +57,255 @@ from app.db.services.application_version_service import ApplicationVersionServic
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
 
-@router.get("")
-def get_applications(
+def current_application(
+    service: ApplicationService, application_id: UUID
+) -> Callable[[], str]:
+    """
+    Returns the ETag an If-Match header of a mutation is checked against, and locks
+    the application until the mutation is committed.
+    """
+    return lambda: resource_etag(
+        application_id, service.get_modified_at(application_id, lock=True)
+    )
+
+
+@router.get("", response_model=Page[ApplicationDto])
+async def get_applications(
     query: Annotated[PaginationQueryParams, Depends()],
+    field_selection: Annotated[FieldSelectionQueryParams, Depends()],
+    filters: Annotated[ApplicationFilterQueryParams, Depends()],
     service: ApplicationService = Depends(get_application_service),
-) -> Page[ApplicationDto]:
-    return service.get_paginated(limit=query.limit, offset=query.offset)
+) -> Response:
+    selection = select_fields(
+        field_selection, ApplicationDto, APPLICATION_EXPANDABLE_FIELDS
+    )
+    if service.json_pages:
+        body = await run_in_session(
+            service.get_paginated_json,
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            count_mode=query.total_count_mode,
+            fields=selection.include,
+            filters=filters,
+        )
+        return json_response(body)
 
+    page = await run_in_session(
+        service.get_paginated,
+        limit=query.limit,
+        offset=query.offset,
+        cursor=query.cursor,
+        count_mode=query.total_count_mode,
+        expand=selection.expand,
+        filters=filters,
+    )
+    return sparse_page_response(page, selection)
 
-@router.get("/{application_id}")
-def get_application_by_id(
-    application_id: UUID, service: ApplicationService = Depends(get_application_service)
-) -> ApplicationDto:
-    application = service.get_one(application_id=application_id)
-    return map_application_entity_to_dto(application)
+
+@router.get("/export", response_class=StreamingResponse)
+def export_applications(
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    service: ApplicationService = Depends(get_application_service),
+) -> StreamingResponse:
+    return export_response(
+        service.export(), ApplicationDto, export_format, filename="applications"
+    )
+
+
+@router.post("/bulk")
+async def register_many_applications(
+    data: Annotated[
+        List[ApplicationCreateDto], Body(min_length=1, max_length=BULK_LIMIT)
+    ],
+    service: ApplicationService = Depends(get_application_service),
+) -> List[BulkItemResult]:
+    return await run_in_session(service.add_many, data)
+
+
+@router.delete("/bulk")
+async def delete_many_applications(
+    data: BulkDeleteDto, service: ApplicationService = Depends(get_application_service)
+) -> List[BulkItemResult]:
+    return await run_in_session(service.remove_many, data.ids)
+
+
+@router.get("/{application_id}", response_model=ApplicationDto)
+async def get_application_by_id(
+    application_id: UUID,
+    field_selection: Annotated[FieldSelectionQueryParams, Depends()],
+    if_none_match: Annotated[str | None, Header()] = None,
+    service: ApplicationService = Depends(get_application_service),
+) -> Response:
+    selection = select_fields(
+        field_selection, ApplicationDto, APPLICATION_EXPANDABLE_FIELDS
+    )
+    etag, application = await run_if_none_match(
+        if_none_match,
+        lambda: resource_etag(
+            application_id, service.get_modified_at(application_id), selection.include
+        ),
+        mapped(
+            lambda entity: map_application_entity_to_dto(entity, selection.expand),
+            service.get_one,
+        ),
+        application_id=application_id,
+        expand=selection.expand,
+    )
+    return conditional_response(
+        etag, None if application is None else sparse_response(application, selection)
+    )
 
 
 @router.delete("/{application_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_application_by_id(
-    application_id: UUID, service: ApplicationService = Depends(get_application_service)
+async def delete_application_by_id(
+    application_id: UUID,
+    if_match: Annotated[str | None, Header()] = None,
+    service: ApplicationService = Depends(get_application_service),
 ) -> None:
-    service.remove_one(application_id=application_id)
+    await run_if_match(
+        if_match,
+        current_application(service, application_id),
+        service.remove_one,
+        application_id=application_id,
+    )
 
 
 @router.post("/{application_id}/versions")
-def add_application_version(
+async def add_application_version(
     application_id: UUID,
     data: ApplicationVersionCreateDto,
+    if_match: Annotated[str | None, Header()] = None,
     service: ApplicationVersionService = Depends(get_application_version_service),
+    application_service: ApplicationService = Depends(get_application_service),
 ) -> List[ApplicationVersionDto]:
-    versions = service.add_one(application_id=application_id, version=data.version)
-    return [map_application_version_entity_to_dto(version) for version in versions]
+    return await run_if_match(
+        if_match,
+        current_application(application_service, application_id),
+        mapped(
+            lambda versions: [
+                map_application_version_entity_to_dto(version) for version in versions
+            ],
+            service.add_one,
+        ),
+        application_id=application_id,
+        version=data.version,
+    )
 
 
 @router.delete("/{application_id}/versions/{version_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_application_version(
+async def delete_application_version(
     application_id: UUID,
     version_id: UUID,
+    if_match: Annotated[str | None, Header()] = None,
     service: ApplicationVersionService = Depends(get_application_version_service),
+    application_service: ApplicationService = Depends(get_application_service),
 ) -> None:
-    service.remove_one(application_id=application_id, version_id=version_id)
+    await run_if_match(
+        if_match,
+        current_application(application_service, application_id),
+        service.remove_one,
+        application_id=application_id,
+        version_id=version_id,
+    )
 
 
-@router.get("/vendors/{vendor_id}")
-def get_all_vendor_applications(
+@router.get("/vendors/{vendor_id}", response_model=List[ApplicationDto])
+async def get_all_vendor_applications(
     vendor_id: UUID,
     application_service: ApplicationService = Depends(get_application_service),
-) -> list[ApplicationDto]:
-    results = application_service.get_by_vendor_id(vendor_id)
-    return [map_application_entity_to_dto(result) for result in results]
+) -> Response:
+    results = await run_in_session(
+        mapped(map_application_entities_to_dtos, application_service.get_by_vendor_id),
+        vendor_id,
+    )
+    return dto_list_response(results, ApplicationDto)
 
 
 @router.post("/vendors/{vendor_id}")
-def register_one_vendor_application(
+async def register_one_vendor_application(
     vendor_id: UUID,
     data: VendorApplicationCreateDto,
     service: ApplicationService = Depends(get_application_service),
 ) -> ApplicationDto:
     try:
-        result = service.add_one(
+        return await run_in_session(
+            mapped(map_application_entity_to_dto, service.add_one),
             vendor_id=vendor_id,
             application_name=data.name,
             version=data.version,
             system_type_names=data.system_types,
             role_names=data.roles,
         )
-        return map_application_entity_to_dto(result)
     except NoResultFound as e:
         raise NotFoundException(str(e))
 
 
 @router.patch("/{application_id}/roles/{role_id}")
-def assign_one_application_role(
+async def assign_one_application_role(
     application_id: UUID,
     role_id: UUID,
+    if_match: Annotated[str | None, Header()] = None,
     service: ApplicationRolesService = Depends(get_application_roles_service),
+    application_service: ApplicationService = Depends(get_application_service),
 ) -> ApplicationDto:
-    results = service.assign_role_to_application(application_id, role_id)
-    return map_application_entity_to_dto(results)
+    return await run_if_match(
+        if_match,
+        current_application(application_service, application_id),
+        mapped(map_application_entity_to_dto, service.assign_role_to_application),
+        application_id,
+        role_id,
+    )
 
 
 @router.delete("/{application_id}/roles/{role_id}", status_code=status.HTTP_204_NO_CONTENT)
-def unassign_one_application_role(
+async def unassign_one_application_role(
     application_id: UUID,
     role_id: UUID,
+    if_match: Annotated[str | None, Header()] = None,
     service: ApplicationRolesService = Depends(get_application_roles_service),
+    application_service: ApplicationService = Depends(get_application_service),
 ) -> None:
-    service.unassign_role_from_application(application_id, role_id)
+    await run_if_match(
+        if_match,
+        current_application(application_service, application_id),
+        service.unassign_role_from_application,
+        application_id,
+        role_id,
+    )
 
 
 @router.post("/{application_id}/system-types/{system_type_id}")
-def assign_system_type_to_application(
+async def assign_system_type_to_application(
     application_id: UUID,
     system_type_id: UUID,
+    if_match: Annotated[str | None, Header()] = None,
     service: ApplicationTypeService = Depends(get_application_type_service),
+    application_service: ApplicationService = Depends(get_application_service),
 ) -> ApplicationDto:
-    application = service.assign_system_type_to_application(
-        application_id, system_type_id
+    return await run_if_match(
+        if_match,
+        current_application(application_service, application_id),
+        mapped(
+            map_application_entity_to_dto, service.assign_system_type_to_application
+        ),
+        application_id,
+        system_type_id,
     )
-    return map_application_entity_to_dto(application)
 
 
 @router.delete("/{application_id}/system-types/{system_type_id}", status_code=status.HTTP_204_NO_CONTENT)
-def unassing_system_type_from_application(
+async def unassing_system_type_from_application(
     application_id: UUID,
     system_type_id: UUID,
+    if_match: Annotated[str | None, Header()] = None,
     service: ApplicationTypeService = Depends(get_application_type_service),
+    application_service: ApplicationService = Depends(get_application_service),
 ) -> None:
-    service.unassign_system_type_to_application(
-        application_id, system_type_id
+    await run_if_match(
+        if_match,
+        current_application(application_service, application_id),
+        service.unassign_system_type_to_application,
+        application_id,
+        system_type_id,
     )
@@ -1,12 +1,14 @@
-from typing import Annotated
+from typing import Annotated, Callable, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Header, Query, status
+from fastapi.responses import Response, StreamingResponse
 
 from app.container import (
     get_healthcare_provider_service,
     get_healthcare_provider_application_version_service,
 )
+from app.db.session_manager import mapped, run_in_session
 from app.db.services.healthcare_provider_application_version_service import (
     HealthcareProviderApplicationVersionService,
 )
@@ -18,68 +20,169 @@ from app.schemas.healthcare_provider.schema import (
     HealthcareProviderCreateDto,
     HealthcareProviderDto,
 )
-from app.schemas.meta.schema import Page
+from app.helpers.etag import (
+    conditional_response,
+    resource_etag,
+    run_if_match,
+    run_if_none_match,
+)
+from app.helpers.export import export_response
+from app.helpers.responses import dto_response
+from app.schemas.enums.export_format import ExportFormat
+from app.schemas.meta.schema import (
+    BULK_LIMIT,
+    BulkDeleteDto,
+    BulkItemResult,
+    Page,
+)
+from app.schemas.filter_query_params.schema import HealthcareProviderFilterQueryParams
 from app.schemas.pagination_query_params.schema import PaginationQueryParams
 
 router = APIRouter(prefix="/healthcare-provider", tags=["Healthcare  Provider"])
 
 
-@router.get("")
-def get_healthcare_providers(
+def current_healthcare_provider(
+    service: HealthcareProviderService, healthcare_provider_id: UUID
+) -> Callable[[], str]:
+    """
+    Returns the ETag an If-Match header of a mutation is checked against, and locks
+    the healthcare provider until the mutation is committed.
+    """
+    return lambda: resource_etag(
+        healthcare_provider_id,
+        service.get_modified_at(healthcare_provider_id, lock=True),
+    )
+
+
+@router.get("", response_model=Page[HealthcareProviderDto])
+async def get_healthcare_providers(
     query: Annotated[PaginationQueryParams, Depends()],
+    filters: Annotated[HealthcareProviderFilterQueryParams, Depends()],
+    service: HealthcareProviderService = Depends(get_healthcare_provider_service),
+) -> Response:
+    page = await run_in_session(
+        service.get_paginated,
+        limit=query.limit,
+        offset=query.offset,
+        cursor=query.cursor,
+        count_mode=query.total_count_mode,
+        filters=filters,
+    )
+    return dto_response(page)
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_healthcare_providers(
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
     service: HealthcareProviderService = Depends(get_healthcare_provider_service),
-) -> Page[HealthcareProviderDto]:
-    return service.get_paginated(limit=query.limit, offset=query.offset)
+) -> StreamingResponse:
+    return export_response(
+        service.export(), HealthcareProviderDto, export_format, filename="healthcare-providers"
+    )
+
 
+@router.post("/bulk")
+async def register_many_healthcare_providers(
+    data: Annotated[
+        List[HealthcareProviderCreateDto], Body(min_length=1, max_length=BULK_LIMIT)
+    ],
+    service: HealthcareProviderService = Depends(get_healthcare_provider_service),
+) -> List[BulkItemResult]:
+    return await run_in_session(service.add_many, data)
 
-@router.get("/{healthcare_provider_id}")
-def get_healthcare_provider_by_id(
+
+@router.delete("/bulk")
+async def deregister_many_healthcare_providers(
+    data: BulkDeleteDto,
+    service: HealthcareProviderService = Depends(get_healthcare_provider_service),
+) -> List[BulkItemResult]:
+    return await run_in_session(service.remove_many, data.ids)
+
+
+@router.get("/{healthcare_provider_id}", response_model=HealthcareProviderDto)
+async def get_healthcare_provider_by_id(
     healthcare_provider_id: UUID,
+    if_none_match: Annotated[str | None, Header()] = None,
     service: HealthcareProviderService = Depends(get_healthcare_provider_service),
-) -> HealthcareProviderDto:
-    healthcare_provider = service.get_one(healthcare_provider_id)
-    return map_healthcare_provider_entity_to_dto(healthcare_provider)
+) -> Response:
+    etag, healthcare_provider = await run_if_none_match(
+        if_none_match,
+        lambda: resource_etag(
+            healthcare_provider_id, service.get_modified_at(healthcare_provider_id)
+        ),
+        mapped(map_healthcare_provider_entity_to_dto, service.get_one),
+        healthcare_provider_id,
+    )
+    return conditional_response(
+        etag, None if healthcare_provider is None else dto_response(healthcare_provider)
+    )
 
 
 @router.post("")
-def register_one_healthcare_provider(
+async def register_one_healthcare_provider(
     data: HealthcareProviderCreateDto,
     service: HealthcareProviderService = Depends(get_healthcare_provider_service),
 ) -> HealthcareProviderDto:
-    new_healthcare_provider = service.add_one(**data.model_dump())
-    return map_healthcare_provider_entity_to_dto(new_healthcare_provider)
+    return await run_in_session(
+        mapped(map_healthcare_provider_entity_to_dto, service.add_one),
+        **data.model_dump(),
+    )
 
 
 @router.delete("/{healthcare_provider_id}", status_code=status.HTTP_204_NO_CONTENT)
-def deregister_one_healthcare_provider(
+async def deregister_one_healthcare_provider(
     healthcare_provider_id: UUID,
+    if_match: Annotated[str | None, Header()] = None,
     service: HealthcareProviderService = Depends(get_healthcare_provider_service),
 ) -> None:
-    service.remove_one(healthcare_provider_id)
+    await run_if_match(
+        if_match,
+        current_healthcare_provider(service, healthcare_provider_id),
+        service.remove_one,
+        healthcare_provider_id,
+    )
 
 
 @router.post("/{healthcare_provider_id}/application-versions/{version_id}")
-def register_application_version_to_healthcare_provider(
+async def register_application_version_to_healthcare_provider(
     healthcare_provider_id: UUID,
     version_id: UUID,
+    if_match: Annotated[str | None, Header()] = None,
     service: HealthcareProviderApplicationVersionService = Depends(
         get_healthcare_provider_application_version_service
     ),
+    provider_service: HealthcareProviderService = Depends(
+        get_healthcare_provider_service
+    ),
 ) -> HealthcareProviderDto:
-    healthcare_provider = service.assign_application_version_to_healthcare_provider(
-        healthcare_provider_id, version_id
+    return await run_if_match(
+        if_match,
+        current_healthcare_provider(provider_service, healthcare_provider_id),
+        mapped(
+            map_healthcare_provider_entity_to_dto,
+            service.assign_application_version_to_healthcare_provider,
+        ),
+        healthcare_provider_id,
+        version_id,
     )
-    return map_healthcare_provider_entity_to_dto(healthcare_provider)
 
 
 @router.delete("/{healthcare_provider_id}/application-versions/{version_id}", status_code=status.HTTP_204_NO_CONTENT)
-def deregister_application_version_to_healthcare_provider(
+async def deregister_application_version_to_healthcare_provider(
     healthcare_provider_id: UUID,
     version_id: UUID,
+    if_match: Annotated[str | None, Header()] = None,
     service: HealthcareProviderApplicationVersionService = Depends(
         get_healthcare_provider_application_version_service
     ),
+    provider_service: HealthcareProviderService = Depends(
+        get_healthcare_provider_service
+    ),
 ) -> None:
-    service.unassing_application_version_to_healthcare_provider(
-        healthcare_provider_id, version_id
+    await run_if_match(
+        if_match,
+        current_healthcare_provider(provider_service, healthcare_provider_id),
+        service.unassing_application_version_to_healthcare_provider,
+        healthcare_provider_id,
+        version_id,
     )
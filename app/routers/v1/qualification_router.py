@@ -1,11 +1,14 @@
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from app.container import (
     get_protocol_application_qualification_service,
     get_healthcare_provider_qualification_service,
 )
+from app.db.session_manager import mapped, run_in_session
+from app.helpers.responses import dto_response
 from app.db.services.healthcare_provider_qualification_service import (
     HealthcareProviderQualificationService,
 )
@@ -15,12 +18,15 @@ from app.db.services.protocol_application_qualification_service import (
 from app.schemas.healthcare_provider.mapper import map_healthcare_provider_entity_to_dto
 from app.schemas.healthcare_provider.schema import (
     HealthcareProviderDto,
+    HealthcareProviderQualificationBulkCreateDto,
     HealthcareProviderQualificationCreateDto,
 )
+from app.schemas.meta.schema import BulkDeleteDto, BulkItemResult
 from app.schemas.protocol_application_qualification.mapper import (
     map_protocol_qualification_entity_to_dto,
 )
 from app.schemas.protocol_application_qualification.schema import (
+    ApplicationQualificationBulkCreateDto,
     ApplicationQualificationCreateDto,
     ProtocolApplicationQualificationDto,
 )
@@ -28,64 +34,143 @@ from app.schemas.protocol_application_qualification.schema import (
 router = APIRouter(prefix="/qualifications", tags=["Qualification"])
 
 
-@router.post("/{protocol_version_id}/application-versions/{version_id}")
-def qualify_application_version_for_a_protocol(
+@router.post("/{protocol_version_id}/application-versions/{version_id}", response_model=ProtocolApplicationQualificationDto)
+async def qualify_application_version_for_a_protocol(
     protocol_version_id: UUID,
     application_version_id: UUID,
     data: ApplicationQualificationCreateDto,
     service: ProtocolApplicationQualificationService = Depends(
         get_protocol_application_qualification_service
     ),
-) -> ProtocolApplicationQualificationDto:
-    protocol_version = service.qualify_protocol_version_to_application_version(
+) -> Response:
+    protocol_version = await run_in_session(
+        mapped(
+            map_protocol_qualification_entity_to_dto,
+            service.qualify_protocol_version_to_application_version,
+        ),
         protocol_version_id=protocol_version_id,
         application_version_id=application_version_id,
         qualification_date=data.qualification_date,
     )
 
-    return map_protocol_qualification_entity_to_dto(protocol_version)
+    return dto_response(protocol_version)
 
 
 @router.delete("/{protocol_version_id}/application-versions/{application_version_id}", status_code=status.HTTP_204_NO_CONTENT)
-def archive_application_version_qualification(
+async def archive_application_version_qualification(
     protocol_version_id: UUID,
     application_version_id: UUID,
     service: ProtocolApplicationQualificationService = Depends(
         get_protocol_application_qualification_service
     ),
 ) -> None:
-    service.archive_protocol_application_qualification(
+    await run_in_session(
+        service.archive_protocol_application_qualification,
         protocol_version_id=protocol_version_id,
         application_version_id=application_version_id,
     )
 
 
-@router.post("/{healthcare_provider_id}/protocol-versions/{protocol_version_id}")
-def qualify_healthcare_provider(
+@router.post("/{healthcare_provider_id}/protocol-versions/{protocol_version_id}", response_model=HealthcareProviderDto)
+async def qualify_healthcare_provider(
     healthcare_provider_id: UUID,
     protocol_version_id: UUID,
     data: HealthcareProviderQualificationCreateDto,
     service: HealthcareProviderQualificationService = Depends(
         get_healthcare_provider_qualification_service
     ),
-) -> HealthcareProviderDto:
-    healthcare_provider = service.qualify_healthcare_provider(
+) -> Response:
+    healthcare_provider = await run_in_session(
+        mapped(
+            map_healthcare_provider_entity_to_dto, service.qualify_healthcare_provider
+        ),
         healthcare_provider_id=healthcare_provider_id,
         protocol_version_id=protocol_version_id,
         qualification_date=data.qualification_date,
     )
-    return map_healthcare_provider_entity_to_dto(healthcare_provider)
+    return dto_response(healthcare_provider)
 
 
 @router.delete("/{healthcare_provider_id}/protocol-versions/{protocol_version_id}", status_code=status.HTTP_204_NO_CONTENT)
-def archive_healthcare_provider_qualification(
+async def archive_healthcare_provider_qualification(
     healthcare_provider_id: UUID,
     protocol_version_id: UUID,
     service: HealthcareProviderQualificationService = Depends(
         get_healthcare_provider_qualification_service
     ),
 ) -> None:
-    service.archive_healthcare_provider_qualification(
+    await run_in_session(
+        service.archive_healthcare_provider_qualification,
         healthcare_provider_id=healthcare_provider_id,
         protocol_version_id=protocol_version_id,
     )
+
+
+@router.post("/{protocol_version_id}/application-versions")
+async def qualify_application_versions_for_a_protocol(
+    protocol_version_id: UUID,
+    data: ApplicationQualificationBulkCreateDto,
+    service: ProtocolApplicationQualificationService = Depends(
+        get_protocol_application_qualification_service
+    ),
+) -> List[BulkItemResult]:
+    return await run_in_session(
+        service.qualify_application_versions,
+        protocol_version_id=protocol_version_id,
+        application_version_ids=data.application_version_ids,
+        qualification_date=data.qualification_date,
+    )
+
+
+@router.delete("/{protocol_version_id}/application-versions")
+async def archive_application_version_qualifications(
+    protocol_version_id: UUID,
+    data: BulkDeleteDto | None = None,
+    service: ProtocolApplicationQualificationService = Depends(
+        get_protocol_application_qualification_service
+    ),
+) -> List[BulkItemResult]:
+    """
+    Archives the qualifications of the given application versions, or every
+    qualification of the protocol version when no body is sent.
+    """
+    return await run_in_session(
+        service.archive_application_versions,
+        protocol_version_id=protocol_version_id,
+        application_version_ids=data.ids if data is not None else None,
+    )
+
+
+@router.post("/{protocol_version_id}/healthcare-providers")
+async def qualify_healthcare_providers(
+    protocol_version_id: UUID,
+    data: HealthcareProviderQualificationBulkCreateDto,
+    service: HealthcareProviderQualificationService = Depends(
+        get_healthcare_provider_qualification_service
+    ),
+) -> List[BulkItemResult]:
+    return await run_in_session(
+        service.qualify_healthcare_providers,
+        protocol_version_id=protocol_version_id,
+        healthcare_provider_ids=data.healthcare_provider_ids,
+        qualification_date=data.qualification_date,
+    )
+
+
+@router.delete("/{protocol_version_id}/healthcare-providers")
+async def archive_healthcare_provider_qualifications(
+    protocol_version_id: UUID,
+    data: BulkDeleteDto | None = None,
+    service: HealthcareProviderQualificationService = Depends(
+        get_healthcare_provider_qualification_service
+    ),
+) -> List[BulkItemResult]:
+    """
+    Archives the qualifications of the given healthcare providers, or every
+    qualification of the protocol version when no body is sent.
+    """
+    return await run_in_session(
+        service.archive_healthcare_providers,
+        protocol_version_id=protocol_version_id,
+        healthcare_provider_ids=data.ids if data is not None else None,
+    )
@@ -1,9 +1,11 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from app.container import get_roles_service
+from app.db.session_manager import mapped, run_in_session
+from app.helpers.responses import dto_response
 from app.schemas.meta.schema import Page
 from app.schemas.pagination_query_params.schema import PaginationQueryParams
 from app.schemas.roles.mapper import map_role_model_to_dto
@@ -12,44 +14,52 @@ from app.db.services.roles_service import RoleService
 
 router = APIRouter(prefix="/roles", tags=["Roles"])
 
-@router.get("")
-def get_roles(
+@router.get("", response_model=Page[RoleDto])
+async def get_roles(
     query: Annotated[PaginationQueryParams, Depends()],
     service: RoleService = Depends(get_roles_service),
-) -> Page[RoleDto]:
-    return service.get_paginated(limit=query.limit, offset=query.offset)
+) -> Response:
+    page = await run_in_session(
+        service.get_paginated,
+        limit=query.limit,
+        offset=query.offset,
+        cursor=query.cursor,
+        count_mode=query.total_count_mode,
+    )
+    return dto_response(page)
 
 
-@router.get("/{role_id}")
-def get_one_role(
+@router.get("/{role_id}", response_model=RoleDto)
+async def get_one_role(
     role_id: UUID, service: RoleService = Depends(get_roles_service)
-) -> RoleDto:
-    role = service.get_one(role_id)
-    return map_role_model_to_dto(role)
+) -> Response:
+    role = await run_in_session(mapped(map_role_model_to_dto, service.get_one), role_id)
+    return dto_response(role)
 
 
 @router.post("", response_model=RoleDto, status_code=status.HTTP_201_CREATED)
-def create_role(
+async def create_role(
     data: RoleCreateDto, service: RoleService = Depends(get_roles_service)
 ) -> RoleDto:
-    new_role = service.add_one(**data.model_dump())
-    return map_role_model_to_dto(new_role)
+    return await run_in_session(
+        mapped(map_role_model_to_dto, service.add_one), **data.model_dump()
+    )
 
 
 @router.put("/{role_id}", response_model=RoleDto)
-def update_role_description(
+async def update_role_description(
     role_id: UUID,
     data: RoleUpdateDto,
     service: RoleService = Depends(get_roles_service),
 ) -> RoleDto:
-    role = service.update_role_description(
+    return await run_in_session(
+        mapped(map_role_model_to_dto, service.update_role_description),
         role_id=role_id, description=data.description
     )
-    return map_role_model_to_dto(role)
 
 
 @router.delete("/{role_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_role(
+async def delete_role(
     role_id: UUID, service: RoleService = Depends(get_roles_service)
 ) -> None:
-    service.remove_one(role_id)
+    await run_in_session(service.remove_one, role_id)
@@ -0,0 +1,23 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+
+from app.container import get_search_service
+from app.db.services.search_service import SearchService
+from app.db.session_manager import run_in_session
+from app.helpers.responses import dto_response
+from app.schemas.meta.schema import Page
+from app.schemas.search.schema import SearchHitDto, SearchQueryParams
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get("", response_model=Page[SearchHitDto])
+async def search(
+    query: Annotated[SearchQueryParams, Depends()],
+    service: SearchService = Depends(get_search_service),
+) -> Response:
+    page = await run_in_session(
+        service.search, query.q, limit=query.limit, cursor=query.cursor
+    )
+    return dto_response(page)
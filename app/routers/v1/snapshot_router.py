@@ -0,0 +1,289 @@
+from typing import Annotated, List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response, StreamingResponse
+
+from app.exceptions.app_exceptions import (
+    ApplicationNotFoundException,
+    HealthcareProviderNotFoundException,
+    ProtocolNotFoundException,
+    ProtocolVersionNotFoundException,
+    RoleNotFoundException,
+    SystemTypeNotFoundException,
+    VendorNotFoundException,
+)
+from app.helpers.export import export_response
+from app.helpers.field_selection import (
+    select_fields,
+    sparse_page_response,
+    sparse_response,
+)
+from app.helpers.responses import dto_list_response, dto_response
+from app.schemas.application.schema import APPLICATION_EXPANDABLE_FIELDS, ApplicationDto
+from app.schemas.enums.export_format import ExportFormat
+from app.schemas.field_selection_query_params.schema import FieldSelectionQueryParams
+from app.schemas.healthcare_provider.schema import HealthcareProviderDto
+from app.schemas.meta.schema import Page
+from app.schemas.pagination_query_params.schema import PaginationQueryParams
+from app.schemas.protocol.schema import ProtocolDto, ProtocolVersionDto
+from app.schemas.roles.schema import RoleDto
+from app.schemas.system_type.schema import SystemTypeDto
+from app.schemas.vendor.schema import VENDOR_EXPANDABLE_FIELDS, VendorDto
+from app.snapshot.refresher import get_register_snapshot
+from app.snapshot.register import RegisterSnapshot
+
+# The GET endpoints of the v1 api, served from the register snapshot. Paths and
+# responses are the same, the count mode is ignored as every total is exact.
+router = APIRouter()
+
+Snapshot = Annotated[RegisterSnapshot, Depends(get_register_snapshot)]
+Pagination = Annotated[PaginationQueryParams, Depends()]
+FieldSelection = Annotated[FieldSelectionQueryParams, Depends()]
+Format = Annotated[ExportFormat, Query(alias="format")]
+
+
+@router.get("/vendors", response_model=Page[VendorDto], tags=["Vendors"])
+async def get_vendors(
+    query: Pagination, field_selection: FieldSelection, snapshot: Snapshot
+) -> Response:
+    selection = select_fields(field_selection, VendorDto, VENDOR_EXPANDABLE_FIELDS)
+    page = snapshot.vendors.page(
+        query.limit, query.offset, query.cursor, query.include_total
+    )
+    return sparse_page_response(page, selection)
+
+
+@router.get("/vendors/export", response_class=StreamingResponse, tags=["Vendors"])
+async def export_vendors(
+    snapshot: Snapshot, export_format: Format = ExportFormat.NDJSON
+) -> StreamingResponse:
+    return export_response(
+        snapshot.vendors.items, VendorDto, export_format, filename="vendors"
+    )
+
+
+@router.get("/vendors/{vendor_id}", response_model=VendorDto, tags=["Vendors"])
+async def get_vendor_by_id(
+    vendor_id: UUID, field_selection: FieldSelection, snapshot: Snapshot
+) -> Response:
+    selection = select_fields(field_selection, VendorDto, VENDOR_EXPANDABLE_FIELDS)
+    vendor = snapshot.vendors.get(vendor_id)
+    if vendor is None:
+        raise VendorNotFoundException()
+
+    return sparse_response(vendor, selection)
+
+
+@router.get(
+    "/vendors/kvk_number/{kvk_number}", response_model=VendorDto, tags=["Vendors"]
+)
+async def get_one_vendor_by_kvk_number(kvk_number: str, snapshot: Snapshot) -> Response:
+    vendor = snapshot.vendors_by_kvk_number.get(kvk_number)
+    if vendor is None:
+        raise VendorNotFoundException()
+
+    return dto_response(vendor)
+
+
+@router.get("/roles", response_model=Page[RoleDto], tags=["Roles"])
+async def get_roles(query: Pagination, snapshot: Snapshot) -> Response:
+    return dto_response(
+        snapshot.roles.page(
+            query.limit, query.offset, query.cursor, query.include_total
+        )
+    )
+
+
+@router.get("/roles/{role_id}", response_model=RoleDto, tags=["Roles"])
+async def get_one_role(role_id: UUID, snapshot: Snapshot) -> Response:
+    role = snapshot.roles.get(role_id)
+    if role is None:
+        raise RoleNotFoundException()
+
+    return dto_response(role)
+
+
+@router.get("/system-types", response_model=Page[SystemTypeDto], tags=["System Types"])
+async def get_system_types(query: Pagination, snapshot: Snapshot) -> Response:
+    return dto_response(
+        snapshot.system_types.page(
+            query.limit, query.offset, query.cursor, query.include_total
+        )
+    )
+
+
+@router.get(
+    "/system-types/{system_type_id}",
+    response_model=SystemTypeDto,
+    tags=["System Types"],
+)
+async def get_system_type_by_id(system_type_id: UUID, snapshot: Snapshot) -> Response:
+    system_type = snapshot.system_types.get(system_type_id)
+    if system_type is None:
+        raise SystemTypeNotFoundException()
+
+    return dto_response(system_type)
+
+
+@router.get("/applications", response_model=Page[ApplicationDto], tags=["Applications"])
+async def get_applications(
+    query: Pagination, field_selection: FieldSelection, snapshot: Snapshot
+) -> Response:
+    selection = select_fields(
+        field_selection, ApplicationDto, APPLICATION_EXPANDABLE_FIELDS
+    )
+    page = snapshot.applications.page(
+        query.limit, query.offset, query.cursor, query.include_total
+    )
+    return sparse_page_response(page, selection)
+
+
+@router.get(
+    "/applications/export", response_class=StreamingResponse, tags=["Applications"]
+)
+async def export_applications(
+    snapshot: Snapshot, export_format: Format = ExportFormat.NDJSON
+) -> StreamingResponse:
+    return export_response(
+        snapshot.applications.items,
+        ApplicationDto,
+        export_format,
+        filename="applications",
+    )
+
+
+@router.get(
+    "/applications/{application_id}",
+    response_model=ApplicationDto,
+    tags=["Applications"],
+)
+async def get_application_by_id(
+    application_id: UUID, field_selection: FieldSelection, snapshot: Snapshot
+) -> Response:
+    selection = select_fields(
+        field_selection, ApplicationDto, APPLICATION_EXPANDABLE_FIELDS
+    )
+    application = snapshot.applications.get(application_id)
+    if application is None:
+        raise ApplicationNotFoundException()
+
+    return sparse_response(application, selection)
+
+
+@router.get(
+    "/applications/vendors/{vendor_id}",
+    response_model=List[ApplicationDto],
+    tags=["Applications"],
+)
+async def get_all_vendor_applications(vendor_id: UUID, snapshot: Snapshot) -> Response:
+    return dto_list_response(
+        snapshot.applications_by_vendor.get(vendor_id, ()), ApplicationDto
+    )
+
+
+@router.get("/protocols", response_model=Page[ProtocolDto], tags=["Protocols"])
+async def get_protocols(query: Pagination, snapshot: Snapshot) -> Response:
+    return dto_response(
+        snapshot.protocols.page(
+            query.limit, query.offset, query.cursor, query.include_total
+        )
+    )
+
+
+@router.get("/protocols/{protocol_id}", response_model=ProtocolDto, tags=["Protocols"])
+async def get_one_protocol_by_id(protocol_id: UUID, snapshot: Snapshot) -> Response:
+    protocol = snapshot.protocols.get(protocol_id)
+    if protocol is None:
+        raise ProtocolNotFoundException()
+
+    return dto_response(protocol)
+
+
+@router.get(
+    "/protocols/{protocol_id}/versions/{version_id}",
+    response_model=ProtocolVersionDto,
+    tags=["Protocols"],
+)
+async def get_protocol_version(
+    protocol_id: UUID, version_id: UUID, snapshot: Snapshot
+) -> Response:
+    protocol_version = snapshot.protocol_versions.get((protocol_id, version_id))
+    if protocol_version is None:
+        raise ProtocolVersionNotFoundException()
+
+    return dto_response(protocol_version)
+
+
+@router.get(
+    "/healthcare-provider",
+    response_model=Page[HealthcareProviderDto],
+    tags=["Healthcare  Provider"],
+)
+async def get_healthcare_providers(query: Pagination, snapshot: Snapshot) -> Response:
+    return dto_response(
+        snapshot.healthcare_providers.page(
+            query.limit, query.offset, query.cursor, query.include_total
+        )
+    )
+
+
+@router.get(
+    "/healthcare-provider/export",
+    response_class=StreamingResponse,
+    tags=["Healthcare  Provider"],
+)
+async def export_healthcare_providers(
+    snapshot: Snapshot, export_format: Format = ExportFormat.NDJSON
+) -> StreamingResponse:
+    return export_response(
+        snapshot.healthcare_providers.items,
+        HealthcareProviderDto,
+        export_format,
+        filename="healthcare-providers",
+    )
+
+
+@router.get(
+    "/healthcare-provider/ura_code/{ura_code}",
+    response_model=HealthcareProviderDto,
+    tags=["Healthcare  Provider"],
+)
+async def get_healthcare_provider_by_ura_code(
+    ura_code: str, snapshot: Snapshot
+) -> Response:
+    healthcare_provider = snapshot.healthcare_providers_by_ura_code.get(ura_code)
+    if healthcare_provider is None:
+        raise HealthcareProviderNotFoundException()
+
+    return dto_response(healthcare_provider)
+
+
+@router.get(
+    "/healthcare-provider/agb_code/{agb_code}",
+    response_model=HealthcareProviderDto,
+    tags=["Healthcare  Provider"],
+)
+async def get_healthcare_provider_by_agb_code(
+    agb_code: str, snapshot: Snapshot
+) -> Response:
+    healthcare_provider = snapshot.healthcare_providers_by_agb_code.get(agb_code)
+    if healthcare_provider is None:
+        raise HealthcareProviderNotFoundException()
+
+    return dto_response(healthcare_provider)
+
+
+@router.get(
+    "/healthcare-provider/{healthcare_provider_id}",
+    response_model=HealthcareProviderDto,
+    tags=["Healthcare  Provider"],
+)
+async def get_healthcare_provider_by_id(
+    healthcare_provider_id: UUID, snapshot: Snapshot
+) -> Response:
+    healthcare_provider = snapshot.healthcare_providers.get(healthcare_provider_id)
+    if healthcare_provider is None:
+        raise HealthcareProviderNotFoundException()
+
+    return dto_response(healthcare_provider)
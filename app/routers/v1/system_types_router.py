@@ -1,9 +1,11 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from app.container import get_system_type_service
+from app.db.session_manager import mapped, run_in_session
+from app.helpers.responses import dto_response
 from app.schemas.meta.schema import Page
 from app.schemas.pagination_query_params.schema import PaginationQueryParams
 from app.schemas.system_type.mapper import map_system_type_entity_to_dto
@@ -13,36 +15,46 @@ from app.db.services.system_type_service import SystemTypeService
 router = APIRouter(prefix="/system-types", tags=["System Types"])
 
 
-@router.get("")
-def get_system_types(
+@router.get("", response_model=Page[SystemTypeDto])
+async def get_system_types(
     query: Annotated[PaginationQueryParams, Depends()],
     service: SystemTypeService = Depends(get_system_type_service),
-) -> Page[SystemTypeDto]:
-    return service.get_paginated(limit=query.limit, offset=query.offset)
+) -> Response:
+    page = await run_in_session(
+        service.get_paginated,
+        limit=query.limit,
+        offset=query.offset,
+        cursor=query.cursor,
+        count_mode=query.total_count_mode,
+    )
+    return dto_response(page)
 
 
-@router.get("/{system_type_id}")
-def get_system_type_by_id(
+@router.get("/{system_type_id}", response_model=SystemTypeDto)
+async def get_system_type_by_id(
     system_type_id: UUID, service: SystemTypeService = Depends(get_system_type_service)
-) -> SystemTypeDto:
-    system_type = service.get_one(system_type_id=system_type_id)
-    return map_system_type_entity_to_dto(system_type)
+) -> Response:
+    system_type = await run_in_session(
+        mapped(map_system_type_entity_to_dto, service.get_one),
+        system_type_id=system_type_id,
+    )
+    return dto_response(system_type)
 
 
 @router.post("", response_model=SystemTypeDto, status_code=status.HTTP_201_CREATED)
-def create_new_system_type(
+async def create_new_system_type(
     data: SystemTypeCreateDto,
     service: SystemTypeService = Depends(get_system_type_service),
 ) -> SystemTypeDto:
-    new_system_type = service.add_one(
+    return await run_in_session(
+        mapped(map_system_type_entity_to_dto, service.add_one),
         name=data.name,
         description=data.description,
     )
-    return map_system_type_entity_to_dto(new_system_type)
 
 
 @router.delete("/{system_type_id}", status_code=status.HTTP_204_NO_CONTENT)
-def remove_system_type(
+async def remove_system_type(
     system_type_id: UUID, service: SystemTypeService = Depends(get_system_type_service)
 ) -> None:
-    service.delete_one(system_type_id=system_type_id)
+    await run_in_session(service.delete_one, system_type_id=system_type_id)
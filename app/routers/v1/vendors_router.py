@@ -1,59 +1,167 @@
-from typing import Annotated
+from typing import Annotated, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Header, Query, status
+from fastapi.responses import Response, StreamingResponse
 
-from app.openapi.responses import api_validation_error_response, api_conflict_response, api_not_found_response
-from app.schemas.meta.schema import Page
+from app.openapi.responses import (
+    api_conflict_response,
+    api_not_found_response,
+    api_precondition_failed_response,
+    api_validation_error_response,
+)
+from app.helpers.etag import (
+    conditional_response,
+    resource_etag,
+    run_if_match,
+    run_if_none_match,
+)
+from app.helpers.export import export_response
+from app.helpers.responses import dto_response, json_response
+from app.helpers.field_selection import (
+    select_fields,
+    sparse_page_response,
+    sparse_response,
+)
+from app.schemas.enums.export_format import ExportFormat
+from app.schemas.field_selection_query_params.schema import FieldSelectionQueryParams
+from app.schemas.filter_query_params.schema import TimestampFilterQueryParams
+from app.schemas.meta.schema import (
+    BULK_LIMIT,
+    BulkDeleteDto,
+    BulkItemResult,
+    Page,
+)
 from app.schemas.pagination_query_params.schema import PaginationQueryParams
 from app.schemas.vendor.mapper import map_vendor_entity_to_dto
-from app.schemas.vendor.schema import VendorDto, VendorCreateDto
+from app.schemas.vendor.schema import (
+    VENDOR_EXPANDABLE_FIELDS,
+    VendorDto,
+    VendorCreateDto,
+)
 from app.db.services.vendors_service import VendorService
 from app.container import (
     get_vendors_service,
 )
+from app.db.session_manager import mapped, run_in_session
 
 router = APIRouter(prefix="/vendors", tags=["Vendors"])
 
 
-@router.get("", responses={**api_validation_error_response()})
-def get_vendors(
+@router.get("", response_model=Page[VendorDto], responses={**api_validation_error_response()})
+async def get_vendors(
     query: Annotated[PaginationQueryParams, Depends()],
+    field_selection: Annotated[FieldSelectionQueryParams, Depends()],
+    filters: Annotated[TimestampFilterQueryParams, Depends()],
+    vendor_service: VendorService = Depends(get_vendors_service),
+) -> Response:
+    selection = select_fields(field_selection, VendorDto, VENDOR_EXPANDABLE_FIELDS)
+    if vendor_service.json_pages:
+        body = await run_in_session(
+            vendor_service.get_paginated_json,
+            limit=query.limit,
+            offset=query.offset,
+            cursor=query.cursor,
+            count_mode=query.total_count_mode,
+            fields=selection.include,
+            filters=filters,
+        )
+        return json_response(body)
+
+    page = await run_in_session(
+        vendor_service.get_paginated,
+        limit=query.limit,
+        offset=query.offset,
+        cursor=query.cursor,
+        count_mode=query.total_count_mode,
+        expand=selection.expand,
+        filters=filters,
+    )
+    return sparse_page_response(page, selection)
+
+
+@router.get("/export", response_class=StreamingResponse, responses={**api_validation_error_response()})
+def export_vendors(
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
     vendor_service: VendorService = Depends(get_vendors_service),
-) -> Page[VendorDto]:
-    return vendor_service.get_paginated(limit=query.limit, offset=query.offset)
+) -> StreamingResponse:
+    return export_response(
+        vendor_service.export(), VendorDto, export_format, filename="vendors"
+    )
 
 
 @router.post("", response_model=VendorDto, status_code=status.HTTP_201_CREATED, responses={**api_validation_error_response(), **api_not_found_response(), **api_conflict_response()})
-def add_one_vendor(
+async def add_one_vendor(
     data: VendorCreateDto, vendor_service: VendorService = Depends(get_vendors_service)
 ) -> VendorDto:
-    results = vendor_service.add_one(
+    return await run_in_session(
+        mapped(map_vendor_entity_to_dto, vendor_service.add_one),
         kvk_number=data.kvk_number,
         trade_name=data.trade_name,
         statutory_name=data.statutory_name,
     )
-    return map_vendor_entity_to_dto(results)
+
+
+@router.post("/bulk", responses={**api_validation_error_response()})
+async def add_many_vendors(
+    data: Annotated[List[VendorCreateDto], Body(min_length=1, max_length=BULK_LIMIT)],
+    vendor_service: VendorService = Depends(get_vendors_service),
+) -> List[BulkItemResult]:
+    return await run_in_session(vendor_service.add_many, data)
+
+
+@router.delete("/bulk", responses={**api_validation_error_response()})
+async def delete_many_vendors(
+    data: BulkDeleteDto, vendor_service: VendorService = Depends(get_vendors_service)
+) -> List[BulkItemResult]:
+    return await run_in_session(vendor_service.remove_many, data.ids)
 
 
 @router.get("/{vendor_id}", response_model=VendorDto, responses={**api_validation_error_response(), **api_not_found_response()})
-def get_vendor_by_id(
-    vendor_id: UUID, vendor_service: VendorService = Depends(get_vendors_service)
-) -> VendorDto:
-    vendor = vendor_service.get_one(vendor_id=vendor_id)
-    return map_vendor_entity_to_dto(vendor)
+async def get_vendor_by_id(
+    vendor_id: UUID,
+    field_selection: Annotated[FieldSelectionQueryParams, Depends()],
+    if_none_match: Annotated[str | None, Header()] = None,
+    vendor_service: VendorService = Depends(get_vendors_service),
+) -> Response:
+    selection = select_fields(field_selection, VendorDto, VENDOR_EXPANDABLE_FIELDS)
+    etag, vendor = await run_if_none_match(
+        if_none_match,
+        lambda: resource_etag(
+            vendor_id, vendor_service.get_modified_at(vendor_id), selection.include
+        ),
+        mapped(
+            lambda entity: map_vendor_entity_to_dto(entity, selection.expand),
+            vendor_service.get_one,
+        ),
+        vendor_id=vendor_id,
+        expand=selection.expand,
+    )
+    return conditional_response(etag, None if vendor is None else sparse_response(vendor, selection))
 
 
-@router.delete("/{vendor_id}", status_code=status.HTTP_204_NO_CONTENT, responses={**api_validation_error_response(), **api_not_found_response()})
-def delete_vendor_by_id(
-    vendor_id: UUID, vendor_service: VendorService = Depends(get_vendors_service)
+@router.delete("/{vendor_id}", status_code=status.HTTP_204_NO_CONTENT, responses={**api_validation_error_response(), **api_not_found_response(), **api_precondition_failed_response()})
+async def delete_vendor_by_id(
+    vendor_id: UUID,
+    if_match: Annotated[str | None, Header()] = None,
+    vendor_service: VendorService = Depends(get_vendors_service),
 ) -> None:
-    vendor_service.remove_one(vendor_id=vendor_id)
+    await run_if_match(
+        if_match,
+        lambda: resource_etag(
+            vendor_id, vendor_service.get_modified_at(vendor_id, lock=True)
+        ),
+        vendor_service.remove_one,
+        vendor_id=vendor_id,
+    )
 
 
 @router.get("/kvk_number/{kvk_number}", response_model=VendorDto, responses={**api_validation_error_response(), **api_not_found_response()})
-def get_one_vendor_by_kvk_number(
+async def get_one_vendor_by_kvk_number(
     kvk_number: str, vendor_service: VendorService = Depends(get_vendors_service)
-) -> VendorDto:
-    result = vendor_service.get_one_by_kvk_number(kvk_number)
-    return map_vendor_entity_to_dto(result)
+) -> Response:
+    result = await run_in_session(
+        mapped(map_vendor_entity_to_dto, vendor_service.get_one_by_kvk_number),
+        kvk_number,
+    )
+    return dto_response(result)
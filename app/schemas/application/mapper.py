@@ -1,3 +1,5 @@
+from typing import Any, Collection, Iterable, List
+
 from app.db.entities.application import Application
 from app.db.entities.application_version import ApplicationVersion
 from app.db.entities.application_role import ApplicationRole
@@ -37,26 +39,51 @@ def map_application_system_type_entity_to_dto(
     )
 
 
-def map_application_entity_to_dto(application: Application) -> ApplicationDto:
+def map_application_entity_to_dto(
+    application: Application, expand: Collection[str] | None = None
+) -> ApplicationDto:
+    """
+    Maps all relationships when `expand` is None. Otherwise only the relationships
+    in `expand` are read and the DTO is built without them, so relationships that
+    were not loaded are never touched.
+    """
 
-    versions = [
-        map_application_version_entity_to_dto(version)
-        for version in application.versions
-    ]
-    roles = [map_application_roles_entity_to_dto(role) for role in application.roles]
-    system_types = [
-        map_application_system_type_entity_to_dto(system_type)
-        for system_type in application.system_types
+    def expanded(name: str) -> bool:
+        return expand is None or name in expand
+
+    values: dict[str, Any] = {
+        "id": application.id,
+        "name": application.name,
+        "created_at": application.created_at,
+        "modified_at": application.modified_at,
+    }
+    if expanded("vendor"):
+        values["vendor"] = map_vendor_entity_to_summary_dto(application.vendor)
+    if expanded("versions"):
+        values["versions"] = [
+            map_application_version_entity_to_dto(version)
+            for version in application.versions
+        ]
+    if expanded("roles"):
+        values["roles"] = [
+            map_application_roles_entity_to_dto(role) for role in application.roles
+        ]
+    if expanded("system_types"):
+        values["system_types"] = [
+            map_application_system_type_entity_to_dto(system_type)
+            for system_type in application.system_types
+        ]
+
+    if expand is None:
+        return ApplicationDto(**values)
+
+    return ApplicationDto.model_construct(**values)
+
+
+def map_application_entities_to_dtos(
+    applications: Iterable[Application], expand: Collection[str] | None = None
+) -> List[ApplicationDto]:
+    return [
+        map_application_entity_to_dto(application, expand)
+        for application in applications
     ]
-    vendor = map_vendor_entity_to_summary_dto(application.vendor)
-
-    return ApplicationDto(
-        id=application.id,
-        name=application.name,
-        vendor=vendor,
-        versions=versions,
-        roles=roles,
-        system_types=system_types,
-        created_at=application.created_at,
-        modified_at=application.modified_at,
-    )
@@ -3,7 +3,9 @@ from typing import List
 from uuid import UUID, uuid4
 
 from app.schemas.default import BaseModelConfig
-from app.schemas.vendor.schema import VendorSummaryDto
+from app.schemas.vendor.schema import VendorApplicationCreateDto, VendorSummaryDto
+
+APPLICATION_EXPANDABLE_FIELDS = ("vendor", "versions", "roles", "system_types")
 
 
 class ApplicationVersionBase(BaseModelConfig):
@@ -42,3 +44,7 @@ class ApplicationDto(ApplicationBase):
     system_types: List[ApplicationTypeDto] = []
     created_at: datetime
     modified_at: datetime
+
+
+class ApplicationCreateDto(VendorApplicationCreateDto):
+    vendor_id: UUID
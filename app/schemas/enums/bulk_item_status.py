@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class BulkItemStatus(str, Enum):
+    CREATED = "created"
+    DELETED = "deleted"
+    ARCHIVED = "archived"
+    CONFLICT = "conflict"
+    NOT_FOUND = "not_found"
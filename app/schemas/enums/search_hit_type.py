@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class SearchHitType(str, Enum):
+    VENDOR = "vendor"
+    APPLICATION = "application"
+    HEALTHCARE_PROVIDER = "healthcare_provider"
@@ -0,0 +1,11 @@
+from app.schemas.default import BaseModelConfig
+
+
+class FieldSelectionQueryParams(BaseModelConfig):
+    """
+    Comma separated field names to return (`fields`) and relationships to embed
+    (`expand`). Everything is returned when neither is given.
+    """
+
+    fields: str | None = None
+    expand: str | None = None
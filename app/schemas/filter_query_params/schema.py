@@ -0,0 +1,38 @@
+from datetime import datetime
+from uuid import UUID
+
+from app.schemas.default import BaseModelConfig
+
+
+class TimestampFilterQueryParams(BaseModelConfig):
+    """
+    Restricts a list to the entities created or modified within a range. The
+    bounds are exclusive and every bound that is left out is open.
+    """
+
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    modified_after: datetime | None = None
+    modified_before: datetime | None = None
+
+
+class ApplicationFilterQueryParams(TimestampFilterQueryParams):
+    """
+    Restricts the applications to the ones of a vendor, with a role or system type
+    by name, or with a version that is qualified for a protocol version.
+    """
+
+    vendor_id: UUID | None = None
+    role: str | None = None
+    system_type: str | None = None
+    qualified_for: UUID | None = None
+
+
+class HealthcareProviderFilterQueryParams(TimestampFilterQueryParams):
+    """
+    Restricts the healthcare providers to the ones that use an application version
+    or are qualified for a protocol version.
+    """
+
+    application_version_id: UUID | None = None
+    qualified_for: UUID | None = None
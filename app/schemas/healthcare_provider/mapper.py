@@ -1,3 +1,5 @@
+from typing import Iterable, List
+
 from app.db.entities.healthcare_provider import HealthcareProvider
 from app.db.entities.healthcare_provider_application_version import (
     HealthcareProviderApplicationVersion,
@@ -52,3 +54,9 @@ def map_healthcare_provider_entity_to_dto(
             for protocol in entity.qualified_protocols
         ],
     )
+
+
+def map_healthcare_provider_entities_to_dtos(
+    entities: Iterable[HealthcareProvider],
+) -> List[HealthcareProviderDto]:
+    return [map_healthcare_provider_entity_to_dto(entity) for entity in entities]
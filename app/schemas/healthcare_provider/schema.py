@@ -3,7 +3,10 @@ from typing import List
 from uuid import UUID
 
 from app.schemas.application.schema import ApplicationVersionDto
+from pydantic import Field
+
 from app.schemas.default import BaseModelConfig
+from app.schemas.meta.schema import BULK_LIMIT
 
 
 class QualifiedProtocolVersionsDto(BaseModelConfig):
@@ -20,6 +23,12 @@ class HealthcareProviderQualificationCreateDto(BaseModelConfig):
     qualification_date: date
 
 
+class HealthcareProviderQualificationBulkCreateDto(
+    HealthcareProviderQualificationCreateDto
+):
+    healthcare_provider_ids: List[UUID] = Field(min_length=1, max_length=BULK_LIMIT)
+
+
 class HealthcareProviderApplicationVersionDto(ApplicationVersionDto):
     pass
 
@@ -0,0 +1,30 @@
+from functools import cache
+from typing import Any, List, Sequence, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.schemas.meta.schema import Page
+
+TModel = TypeVar("TModel", bound=BaseModel)
+
+
+@cache
+def dto_list_adapter(model: Type[TModel]) -> TypeAdapter[List[TModel]]:
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def json_page(
+    items: Sequence[str],
+    limit: int,
+    offset: int,
+    total: int | None = None,
+    next_cursor: str | None = None,
+) -> bytes:
+    """
+    Serializes a page whose items are JSON already, e.g. rendered by the database,
+    the same way a `Page` of DTOs is serialized.
+    """
+    meta = Page[Any](
+        items=[], limit=limit, offset=offset, total=total, next_cursor=next_cursor
+    ).model_dump_json(by_alias=True, exclude={"items"})
+    return f'{{"items":[{",".join(items)}],{meta[1:]}'.encode()
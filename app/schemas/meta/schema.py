@@ -1,9 +1,17 @@
 from typing import List, TypeVar, Generic
+from uuid import UUID
+
+from fastapi import HTTPException
+from pydantic import Field
 
 from app.schemas.default import BaseModelConfig
+from app.schemas.enums.bulk_item_status import BulkItemStatus
 
 T = TypeVar("T")
 
+# Maximum number of items in one bulk request
+BULK_LIMIT = 10_000
+
 
 class Page(BaseModelConfig, Generic[T]):
     """
@@ -13,4 +21,36 @@ class Page(BaseModelConfig, Generic[T]):
     items: List[T]
     limit: int
     offset: int
-    total: int
+    total: int | None = None
+    next_cursor: str | None = None
+
+
+class BulkItemResult(BaseModelConfig):
+    """
+    Outcome of one item of a bulk request. `index` is the position of the item in
+    the request, `detail` explains why an item was not processed.
+    """
+
+    index: int
+    status: BulkItemStatus
+    id: UUID | None = None
+    detail: str | None = None
+
+    @classmethod
+    def failed(
+        cls, index: int, error: HTTPException, id: UUID | None = None
+    ) -> "BulkItemResult":
+        """
+        Reports an item that failed with the exception the single item endpoint
+        raises for it.
+        """
+        status = (
+            BulkItemStatus.NOT_FOUND
+            if error.status_code == 404
+            else BulkItemStatus.CONFLICT
+        )
+        return cls(index=index, status=status, id=id, detail=error.detail)
+
+
+class BulkDeleteDto(BaseModelConfig):
+    ids: List[UUID] = Field(min_length=1, max_length=BULK_LIMIT)
@@ -1,11 +1,15 @@
 from pydantic import field_validator
 
 from app.schemas.default import BaseModelConfig
+from app.schemas.enums.count_mode import CountMode
 
 
 class PaginationQueryParams(BaseModelConfig):
     limit: int = 10
     offset: int = 0
+    cursor: str | None = None
+    include_total: bool = True
+    count_mode: CountMode = CountMode.EXACT
 
     @field_validator("limit")
     def validate_limit(cls, limit: int) -> int:
@@ -20,3 +24,7 @@ class PaginationQueryParams(BaseModelConfig):
             raise ValueError("offset must be greater than or equal to 0")
 
         return offset
+
+    @property
+    def total_count_mode(self) -> CountMode | None:
+        return self.count_mode if self.include_total else None
@@ -2,13 +2,20 @@ from datetime import date, datetime
 from typing import List
 from uuid import UUID
 
+from pydantic import Field
+
 from app.schemas.default import BaseModelConfig
+from app.schemas.meta.schema import BULK_LIMIT
 
 
 class ApplicationQualificationCreateDto(BaseModelConfig):
     qualification_date: date
 
 
+class ApplicationQualificationBulkCreateDto(ApplicationQualificationCreateDto):
+    application_version_ids: List[UUID] = Field(min_length=1, max_length=BULK_LIMIT)
+
+
 class QualifiedApplicationVersionDto(BaseModelConfig):
     qualification_id: UUID
     application_id: UUID
@@ -0,0 +1,6 @@
+from app.db.repository.search import SearchHit
+from app.schemas.search.schema import SearchHitDto
+
+
+def map_search_hit_to_dto(hit: SearchHit) -> SearchHitDto:
+    return SearchHitDto(type=hit.type, id=hit.id, name=hit.name)
@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from pydantic import Field, field_validator
+
+from app.schemas.default import BaseModelConfig
+from app.schemas.enums.search_hit_type import SearchHitType
+
+
+class SearchQueryParams(BaseModelConfig):
+    """
+    Text to look up in the names and codes of vendors, applications and healthcare
+    providers. Trigram indexes only serve queries of at least three characters.
+    """
+
+    q: str = Field(min_length=3, max_length=150)
+    limit: int = 10
+    cursor: str | None = None
+
+    @field_validator("limit")
+    def validate_limit(cls, limit: int) -> int:
+        if limit <= 0:
+            raise ValueError("limit must be greater than 0")
+
+        return limit
+
+
+class SearchHitDto(BaseModelConfig):
+    type: SearchHitType
+    id: UUID
+    name: str
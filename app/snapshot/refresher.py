@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from typing import Any
+
+import inject
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.exceptions.app_exceptions import SnapshotUnavailableException
+from app.snapshot.register import RegisterSnapshot, load_register_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Notified by the triggers of sql/007-register-change-notifications.sql
+CHANGE_CHANNEL = "register_changed"
+# Seconds to wait before listening again after the connection was lost
+LISTEN_RETRY_SECONDS = 5.0
+
+
+class SnapshotRefresher:
+    """
+    Keeps the current register snapshot. It is rebuilt every `refresh_seconds`,
+    and as soon as a change is notified on `CHANGE_CHANNEL` when `listen_engine`
+    is given. A failed rebuild is logged and the previous snapshot stays in use.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        refresh_seconds: float,
+        listen_engine: AsyncEngine | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.refresh_seconds = refresh_seconds
+        self.listen_engine = listen_engine
+        self.last_error: Exception | None = None
+        self._snapshot: RegisterSnapshot | None = None
+        self._changed = asyncio.Event()
+        self._tasks: list[asyncio.Task[Any]] = []
+
+    @property
+    def snapshot(self) -> RegisterSnapshot:
+        if self._snapshot is None:
+            raise SnapshotUnavailableException()
+
+        return self._snapshot
+
+    def reload(self) -> RegisterSnapshot:
+        with self.session_factory() as session:
+            snapshot = load_register_snapshot(session)
+
+        self._snapshot = snapshot
+        logger.info("Loaded the register snapshot")
+        return snapshot
+
+    def changed(self) -> None:
+        """
+        Rebuilds the snapshot without waiting for the refresh interval.
+        """
+        self._changed.set()
+
+    async def start(self) -> None:
+        await self._reload()
+        self._tasks.append(asyncio.create_task(self._refresh()))
+        if self.listen_engine is not None:
+            self._tasks.append(asyncio.create_task(self._listen(self.listen_engine)))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _reload(self) -> None:
+        try:
+            await asyncio.to_thread(self.reload)
+            self.last_error = None
+        except Exception as e:
+            logger.exception("Loading the register snapshot failed")
+            self.last_error = e
+
+    async def _refresh(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._changed.wait(), self.refresh_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+            # Cleared before loading, so a change committed during the load causes
+            # another one
+            self._changed.clear()
+            await self._reload()
+
+    async def _listen(self, engine: AsyncEngine) -> None:
+        reconnect = False
+        while True:
+            try:
+                async with engine.connect() as connection:
+                    connection = await connection.execution_options(
+                        isolation_level="AUTOCOMMIT"
+                    )
+                    await connection.exec_driver_sql(f"LISTEN {CHANGE_CHANNEL}")
+                    raw_connection = await connection.get_raw_connection()
+                    if reconnect:
+                        # Changes made while not listening were not notified
+                        self.changed()
+
+                    async for _ in raw_connection.driver_connection.notifies():  # type: ignore[union-attr]
+                        self.changed()
+            except Exception:
+                logger.exception("Listening for register changes failed")
+
+            reconnect = True
+            await asyncio.sleep(LISTEN_RETRY_SECONDS)
+
+
+async def get_register_snapshot() -> RegisterSnapshot:
+    """
+    Dependency of the read-only routes. It is not in app.container, so the routes
+    can be used without configuring the admin API.
+    """
+    return inject.instance(SnapshotRefresher).snapshot
@@ -0,0 +1,212 @@
+import bisect
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Generic, Iterable, Mapping, Sequence, TypeVar
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.db.repository import (
+    ApplicationRepository,
+    HealthcareProviderRepository,
+    ProtocolRepository,
+    RoleRepository,
+    SystemTypeRepository,
+    VendorRepository,
+)
+from app.db.repository.pagination import KeysetCursor, decode_cursor, encode_cursor
+from app.schemas.application.mapper import map_application_entity_to_dto
+from app.schemas.application.schema import ApplicationDto
+from app.schemas.healthcare_provider.mapper import map_healthcare_provider_entity_to_dto
+from app.schemas.healthcare_provider.schema import HealthcareProviderDto
+from app.schemas.meta.schema import Page
+from app.schemas.protocol.mapper import map_protocol_entity_to_dto
+from app.schemas.protocol.schema import ProtocolDto, ProtocolVersionDto
+from app.schemas.roles.mapper import map_role_model_to_dto
+from app.schemas.roles.schema import RoleDto
+from app.schemas.system_type.mapper import map_system_type_entity_to_dto
+from app.schemas.system_type.schema import SystemTypeDto
+from app.schemas.vendor.mapper import map_vendor_entity_to_dto
+from app.schemas.vendor.schema import VendorDto
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+class SnapshotTable(Generic[T]):
+    """
+    The DTOs of one entity type, in the same (created_at, id) descending order as
+    the pages of the admin API, so offsets and cursors of both APIs are
+    interchangeable.
+    """
+
+    def __init__(self, rows: Iterable[tuple[KeysetCursor, T]]) -> None:
+        ordered = sorted(rows, key=lambda row: row[0], reverse=True)
+        self.items: tuple[T, ...] = tuple(item for _, item in ordered)
+        # Ascending, so the position of a cursor can be found with bisect
+        self._positions = [position for position, _ in reversed(ordered)]
+        self._by_id: Mapping[UUID, T] = MappingProxyType(
+            {position.id: item for position, item in ordered}
+        )
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, entity_id: UUID) -> T | None:
+        return self._by_id.get(entity_id)
+
+    def page(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> Page[T]:
+        """
+        Returns at most `limit` items. When a cursor is given the page continues
+        after the cursor position and the offset is ignored.
+        """
+        start = offset
+        if cursor is not None:
+            position = decode_cursor(cursor)
+            start = len(self._positions) - bisect.bisect_left(self._positions, position)
+
+        items = list(self.items[start : start + limit])
+        next_cursor = None
+        if start + limit < len(self.items):
+            last = self._positions[len(self._positions) - start - limit]
+            next_cursor = encode_cursor(last)
+
+        return Page(
+            items=items,
+            limit=limit,
+            offset=offset,
+            total=len(self.items) if include_total else None,
+            next_cursor=next_cursor,
+        )
+
+
+def index_by(items: Iterable[T], key: Callable[[T], K]) -> Mapping[K, T]:
+    return MappingProxyType({key(item): item for item in items})
+
+
+def group_by(items: Iterable[T], key: Callable[[T], K]) -> Mapping[K, tuple[T, ...]]:
+    groups: dict[K, list[T]] = {}
+    for item in items:
+        groups.setdefault(key(item), []).append(item)
+
+    return MappingProxyType({name: tuple(group) for name, group in groups.items()})
+
+
+@dataclass(frozen=True)
+class RegisterSnapshot:
+    """
+    The whole register at one point in time, as the DTOs the admin API returns
+    with every relationship expanded. A snapshot is never changed after it is
+    built, a refresh replaces it as a whole, so requests read it without locks.
+    """
+
+    vendors: SnapshotTable[VendorDto]
+    applications: SnapshotTable[ApplicationDto]
+    roles: SnapshotTable[RoleDto]
+    system_types: SnapshotTable[SystemTypeDto]
+    protocols: SnapshotTable[ProtocolDto]
+    healthcare_providers: SnapshotTable[HealthcareProviderDto]
+    loaded_at: datetime = field(default_factory=datetime.now)
+    vendors_by_kvk_number: Mapping[str, VendorDto] = field(init=False)
+    applications_by_vendor: Mapping[UUID, tuple[ApplicationDto, ...]] = field(
+        init=False
+    )
+    protocol_versions: Mapping[tuple[UUID, UUID], ProtocolVersionDto] = field(
+        init=False
+    )
+    healthcare_providers_by_ura_code: Mapping[str, HealthcareProviderDto] = field(
+        init=False
+    )
+    healthcare_providers_by_agb_code: Mapping[str, HealthcareProviderDto] = field(
+        init=False
+    )
+
+    def __post_init__(self) -> None:
+        indexes: dict[str, Any] = {
+            "vendors_by_kvk_number": index_by(
+                self.vendors.items, lambda vendor: vendor.kvk_number
+            ),
+            "applications_by_vendor": group_by(
+                self.applications.items, lambda application: application.vendor.id
+            ),
+            "protocol_versions": MappingProxyType(
+                {
+                    (protocol.id, version.id): version
+                    for protocol in self.protocols.items
+                    for version in protocol.versions
+                }
+            ),
+            "healthcare_providers_by_ura_code": index_by(
+                self.healthcare_providers.items, lambda provider: provider.ura_code
+            ),
+            "healthcare_providers_by_agb_code": index_by(
+                self.healthcare_providers.items, lambda provider: provider.agb_code
+            ),
+        }
+        for name, index in indexes.items():
+            object.__setattr__(self, name, index)
+
+
+def keyed(
+    entities: Iterable[Any], mapper: Callable[[Any], T]
+) -> Sequence[tuple[KeysetCursor, T]]:
+    return [
+        (KeysetCursor(created_at=entity.created_at, id=entity.id), mapper(entity))
+        for entity in entities
+    ]
+
+
+def load_register_snapshot(session: Session, batch_size: int = 500) -> RegisterSnapshot:
+    """
+    Reads the register with `session`. All tables should be read in one
+    transaction with at least REPEATABLE READ isolation, so the snapshot is
+    consistent across them.
+    """
+    vendors = VendorRepository(session)
+    applications = ApplicationRepository(session)
+    protocols = ProtocolRepository(session)
+    healthcare_providers = HealthcareProviderRepository(session)
+    return RegisterSnapshot(
+        vendors=SnapshotTable(
+            keyed(
+                vendors.stream(batch_size, vendors.loader_options()),
+                map_vendor_entity_to_dto,
+            )
+        ),
+        applications=SnapshotTable(
+            keyed(
+                applications.stream(batch_size, applications.loader_options()),
+                map_application_entity_to_dto,
+            )
+        ),
+        roles=SnapshotTable(
+            keyed(RoleRepository(session).stream(batch_size), map_role_model_to_dto)
+        ),
+        system_types=SnapshotTable(
+            keyed(
+                SystemTypeRepository(session).stream(batch_size),
+                map_system_type_entity_to_dto,
+            )
+        ),
+        protocols=SnapshotTable(
+            keyed(
+                protocols.stream(batch_size, protocols.loader_options()),
+                map_protocol_entity_to_dto,
+            )
+        ),
+        healthcare_providers=SnapshotTable(
+            keyed(
+                healthcare_providers.stream(
+                    batch_size, healthcare_providers.loader_options()
+                ),
+                map_healthcare_provider_entity_to_dto,
+            )
+        ),
+    )
@@ -1,9 +1,15 @@
+import hashlib
+import os
 import random
 import uuid
+from datetime import datetime
+from multiprocessing import Pool
 from random import randint
-from typing import Sequence, List
+from time import perf_counter
+from typing import Any, Dict, NamedTuple, Sequence, List, Tuple
 
-from sqlalchemy import create_engine, select
+from psycopg import sql
+from sqlalchemy import Connection, create_engine, exists, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import get_config
@@ -40,9 +46,24 @@ parser.add_argument(
     type=int,
     default=1,
 )
-args = parser.parse_args()
-
-count = args.count
+parser.add_argument(
+    "--bulk",
+    action="store_true",
+    help="Generate rows in parallel worker processes and load them with COPY. "
+    "Meant for an empty register of millions of rows.",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=None,
+    help="Seed for the bulk mode. The same seed and count give the same data.",
+)
+parser.add_argument(
+    "--workers",
+    type=int,
+    default=os.cpu_count(),
+    help="Number of worker processes generating rows in bulk mode.",
+)
 
 config = get_config()
 
@@ -64,68 +85,70 @@ def create_versions(count: int) -> List[str]:
 
 versions = create_versions(9)
 
+ROLE_NAMES = [
+    "Acute Zorg Proces - (Spoed)melding Sturend [AZP-SPS] Systeem",
+    "Acute Zorg Proces - Ambulanceoverdracht Ontvangend [AZP-AOO] Systeem",
+    "Acute Zorg Proces - Ambulanceoverdracht Sturend [AZP-AOS] Systeem",
+    "Acute Zorg Proces - Ambulanceoverdracht Sturend [AZP-AOS] Systeem (naar SEH)",
+    "Acute Zorg Proces - Beschikbaarstellen PS [AZP-PAB]",
+    "Acute Zorg Proces - Beschikbaarstellen PS [AZP-PSB]",
+    "Acute Zorg Proces - Feedbackbericht Ontvangend [AZP-PAO] Systeem",
+    "Acute Zorg Proces - Huisartsverwijzing Sturend [AZP-VES] Systeem",
+    "Acute Zorg Proces - Patiëntidentificatie Sturend [AZP-PAS] Systeem",
+    "Acute Zorg Proces - Raadplegen Professionele samenvatting SEH [AZP-PSR]",
+    "Acute Zorg Proces - Spoedmelding Ontvangend [AZP-SPO] Systeem",
+    "Acute Zorg Proces - Verwijzing ontvangend (AZP-VEO) Systeem",
+    "Acute Zorg Proces - Verwijzing Sturend [AZP-VES] Systeem",
+    "ambulanceoverdracht naar SEH",
+    "Beschikbaarstellen",
+    "Conditie-vaststeller",
+    "Geboortezorg Kernset Sturend Systeem",
+    "JGZ-dossierontvanger",
+    "JGZ-dossieroverdrager",
+    "JGZ-hielprikcoördinator",
+    "JGZ-hielprikuitvoerder",
+    "JGZ-vaccinatiecoördinator",
+    "JGZ-vaccinatieuitvoerder",
+    "Ketenzorg HIS",
+    "Ketenzorg KIS",
+    "Medicatie voorschrift ontvangend systeem (zonder EH)",
+    "Medicatiebewaker",
+    "Medicatiegegevens beschikbaarstellen MA (MP-MGB-MA)",
+    "Medicatiegegevens beschikbaarstellen VV (MP-MGB-VV)",
+    "Medicatieraadpleger",
+    "Medicatieverstrekker",
+    "Medicatievoorschrift ontvangend systeem (zonder EH)",
+    "Medicatievoorschrift sturend systeem (MP-VOS)",
+    "Medicatievoorschrift sturend systeem (zonder EH)",
+    "Opleveren van labgegevens",
+    "Overdrachtsbericht ontvangend systeem - overlap BgZ",
+    "Overdrachtsbericht sturend systeem - overlap BgZ",
+    "Raadplegen",
+    "Raadpleger labgegevens",
+    "Vaste huisarts",
+    "Waarnemend huisarts",
+]
+
+SYSTEM_TYPE_NAMES = [
+    "AIS",
+    "AMBS",
+    "DD JGZ",
+    "EVS",
+    "HIS",
+    "KIS",
+    "Viewer",
+    "ZAIS",
+    "ZBC",
+    "ZIC",
+]
+
 
 def create_roles(session: Session):
-    role_names = [
-        "Acute Zorg Proces - (Spoed)melding Sturend [AZP-SPS] Systeem",
-        "Acute Zorg Proces - Ambulanceoverdracht Ontvangend [AZP-AOO] Systeem",
-        "Acute Zorg Proces - Ambulanceoverdracht Sturend [AZP-AOS] Systeem",
-        "Acute Zorg Proces - Ambulanceoverdracht Sturend [AZP-AOS] Systeem (naar SEH)",
-        "Acute Zorg Proces - Beschikbaarstellen PS [AZP-PAB]",
-        "Acute Zorg Proces - Beschikbaarstellen PS [AZP-PSB]",
-        "Acute Zorg Proces - Feedbackbericht Ontvangend [AZP-PAO] Systeem",
-        "Acute Zorg Proces - Huisartsverwijzing Sturend [AZP-VES] Systeem",
-        "Acute Zorg Proces - Patiëntidentificatie Sturend [AZP-PAS] Systeem",
-        "Acute Zorg Proces - Raadplegen Professionele samenvatting SEH [AZP-PSR]",
-        "Acute Zorg Proces - Spoedmelding Ontvangend [AZP-SPO] Systeem",
-        "Acute Zorg Proces - Verwijzing ontvangend (AZP-VEO) Systeem",
-        "Acute Zorg Proces - Verwijzing Sturend [AZP-VES] Systeem",
-        "ambulanceoverdracht naar SEH",
-        "Beschikbaarstellen",
-        "Conditie-vaststeller",
-        "Geboortezorg Kernset Sturend Systeem",
-        "JGZ-dossierontvanger",
-        "JGZ-dossieroverdrager",
-        "JGZ-hielprikcoördinator",
-        "JGZ-hielprikuitvoerder",
-        "JGZ-vaccinatiecoördinator",
-        "JGZ-vaccinatieuitvoerder",
-        "Ketenzorg HIS",
-        "Ketenzorg KIS",
-        "Medicatie voorschrift ontvangend systeem (zonder EH)",
-        "Medicatiebewaker",
-        "Medicatiegegevens beschikbaarstellen MA (MP-MGB-MA)",
-        "Medicatiegegevens beschikbaarstellen VV (MP-MGB-VV)",
-        "Medicatieraadpleger",
-        "Medicatieverstrekker",
-        "Medicatievoorschrift ontvangend systeem (zonder EH)",
-        "Medicatievoorschrift sturend systeem (MP-VOS)",
-        "Medicatievoorschrift sturend systeem (zonder EH)",
-        "Opleveren van labgegevens",
-        "Overdrachtsbericht ontvangend systeem - overlap BgZ",
-        "Overdrachtsbericht sturend systeem - overlap BgZ",
-        "Raadplegen",
-        "Raadpleger labgegevens",
-        "Vaste huisarts",
-        "Waarnemend huisarts",
-    ]
-    return [create_role(session, name) for name in role_names]
+    return [create_role(session, name) for name in ROLE_NAMES]
 
 
 def create_system_types(session: Session):
-    system_types = [
-        "AIS",
-        "AMBS",
-        "DD JGZ",
-        "EVS",
-        "HIS",
-        "KIS",
-        "Viewer",
-        "ZAIS",
-        "ZBC",
-        "ZIC",
-    ]
-    return [create_system_type(session, name) for name in system_types]
+    return [create_system_type(session, name) for name in SYSTEM_TYPE_NAMES]
 
 
 def create_role(session: Session, name: str) -> Role:
@@ -303,7 +326,7 @@ def create_healthcare_providers(
     ]
 
 
-def run():
+def run(count: int):
     with session_factory() as session:
         # define roles in the database
         roles = create_roles(session)
@@ -335,5 +358,399 @@ def run():
         session.commit()
 
 
+# Bulk mode. Rows are plain tuples in the column order of TABLE_COLUMNS. The work is
+# split into chunks of a fixed number of providers or vendors, so the generated data
+# depends only on the seed and the count, not on the number of workers.
+
+CHUNK_SIZE = 1_000
+VERSIONS_PER_PROTOCOL = 3
+FIRST_DATE = datetime(2000, 1, 1)
+LAST_DATE = datetime(2024, 1, 1)
+
+Row = Tuple[Any, ...]
+
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    Role.__tablename__: ("id", "name", "created_at", "modified_at"),
+    SystemType.__tablename__: ("id", "name", "created_at", "modified_at"),
+    Protocol.__tablename__: (
+        "id",
+        "protocol_type",
+        "name",
+        "description",
+        "created_at",
+        "modified_at",
+    ),
+    ProtocolVersion.__tablename__: (
+        "id",
+        "version",
+        "description",
+        "protocol_id",
+        "created_at",
+        "modified_at",
+    ),
+    HealthcareProvider.__tablename__: (
+        "id",
+        "ura_code",
+        "agb_code",
+        "trade_name",
+        "statutory_name",
+        "created_at",
+        "modified_at",
+    ),
+    HealthcareProviderQualification.__tablename__: (
+        "id",
+        "healthcare_provider_id",
+        "protocol_version_id",
+        "qualification_date",
+        "created_at",
+        "modified_at",
+    ),
+    Vendor.__tablename__: (
+        "id",
+        "kvk_number",
+        "trade_name",
+        "statutory_name",
+        "created_at",
+        "modified_at",
+    ),
+    Application.__tablename__: ("id", "name", "vendor_id", "created_at", "modified_at"),
+    ApplicationVersion.__tablename__: (
+        "id",
+        "version",
+        "application_id",
+        "created_at",
+        "modified_at",
+    ),
+    ApplicationRole.__tablename__: (
+        "id",
+        "application_id",
+        "role_id",
+        "created_at",
+        "modified_at",
+    ),
+    ApplicationType.__tablename__: (
+        "id",
+        "application_id",
+        "system_type_id",
+        "created_at",
+        "modified_at",
+    ),
+    ProtocolApplicationQualification.__tablename__: (
+        "id",
+        "application_version_id",
+        "protocol_version_id",
+        "qualification_date",
+        "created_at",
+        "modified_at",
+    ),
+    HealthcareProviderApplicationVersion.__tablename__: (
+        "id",
+        "healthcare_provider_id",
+        "application_version_id",
+        "created_at",
+        "modified_at",
+    ),
+}
+
+
+class ChunkTask(NamedTuple):
+    kind: str
+    index: int
+    start: int
+    stop: int
+    seed: int
+    count: int
+    role_ids: List[uuid.UUID]
+    system_type_ids: List[uuid.UUID]
+
+
+def stable_uuid(seed: int, *key: Any) -> uuid.UUID:
+    """
+    Derives the id of a row from the seed and its position, so workers can refer to
+    rows generated by other workers without sharing state.
+    """
+    digest = hashlib.blake2b(f"{seed}:{key}".encode(), digest_size=16).digest()
+    return uuid.UUID(bytes=digest, version=4)
+
+
+def protocol_version_id(seed: int, protocol: int, version: int) -> uuid.UUID:
+    return stable_uuid(seed, "protocol_version", protocol, version)
+
+
+def seeded_faker(seed: int, *key: Any) -> Tuple[random.Random, Faker]:
+    rng = random.Random(f"{seed}:{key}")
+    _fake = Faker("nl_nl")
+    _fake.seed_instance(rng.getrandbits(64))
+    return rng, _fake
+
+
+def timestamps(_fake: Faker) -> Tuple[datetime, datetime]:
+    # Fixed bounds, as Faker's default ends at the current time
+    return (
+        _fake.date_time_between(FIRST_DATE, LAST_DATE),
+        _fake.date_time_between(FIRST_DATE, LAST_DATE),
+    )
+
+
+def generate_reference_rows(
+    seed: int, count: int, connection: Connection
+) -> Tuple[Dict[str, List[Row]], ChunkTask]:
+    """
+    Generates the roles and system types in the main process, reusing the ones that
+    already exist. Returns them with the template for the chunk tasks.
+    """
+    _, _fake = seeded_faker(seed, "reference")
+    rows: Dict[str, List[Row]] = {table: [] for table in TABLE_COLUMNS}
+
+    role_ids = dict(connection.execute(select(Role.name, Role.id)).all())
+    for name in ROLE_NAMES:
+        if name not in role_ids:
+            role_ids[name] = stable_uuid(seed, "role", name)
+            rows[Role.__tablename__].append((role_ids[name], name, *timestamps(_fake)))
+
+    system_type_ids = dict(
+        connection.execute(select(SystemType.name, SystemType.id)).all()
+    )
+    for name in SYSTEM_TYPE_NAMES:
+        if name not in system_type_ids:
+            system_type_ids[name] = stable_uuid(seed, "system_type", name)
+            rows[SystemType.__tablename__].append(
+                (system_type_ids[name], name, *timestamps(_fake))
+            )
+
+    template = ChunkTask(
+        kind="",
+        index=0,
+        start=0,
+        stop=0,
+        seed=seed,
+        count=count,
+        role_ids=[role_ids[name] for name in ROLE_NAMES],
+        system_type_ids=[system_type_ids[name] for name in SYSTEM_TYPE_NAMES],
+    )
+    return rows, template
+
+
+def generate_chunk(task: ChunkTask) -> Dict[str, List[Row]]:
+    rng, _fake = seeded_faker(task.seed, task.kind, task.index)
+    rows: Dict[str, List[Row]] = {table: [] for table in TABLE_COLUMNS}
+    if task.kind == "protocols":
+        # All protocols have the same versions, as in create_protocols()
+        _versions = random.Random(task.seed).sample(versions, VERSIONS_PER_PROTOCOL)
+        for i in range(task.start, task.stop):
+            _generate_protocol(task, i, _versions, rng, _fake, rows)
+    elif task.kind == "healthcare_providers":
+        for i in range(task.start, task.stop):
+            _generate_healthcare_provider(task, i, rng, _fake, rows)
+    else:
+        for i in range(task.start, task.stop):
+            _generate_vendor(task, i, rng, _fake, rows)
+    return rows
+
+
+def _generate_protocol(
+    task: ChunkTask,
+    i: int,
+    _versions: List[str],
+    rng: random.Random,
+    _fake: Faker,
+    rows: Dict[str, List[Row]],
+) -> None:
+    protocol_id = stable_uuid(task.seed, "protocol", i)
+    rows[Protocol.__tablename__].append(
+        (
+            protocol_id,
+            rng.choice(["InformationStandard", "Directive"]),
+            _fake.name(),
+            _fake.catch_phrase(),
+            *timestamps(_fake),
+        )
+    )
+    for j, version in enumerate(_versions):
+        rows[ProtocolVersion.__tablename__].append(
+            (
+                protocol_version_id(task.seed, i, j),
+                version,
+                _fake.catch_phrase(),
+                protocol_id,
+                *timestamps(_fake),
+            )
+        )
+
+
+def _generate_healthcare_provider(
+    task: ChunkTask,
+    i: int,
+    rng: random.Random,
+    _fake: Faker,
+    rows: Dict[str, List[Row]],
+) -> None:
+    provider_id = stable_uuid(task.seed, "healthcare_provider", i)
+    company_name = _fake.company()
+    rows[HealthcareProvider.__tablename__].append(
+        (
+            provider_id,
+            f"{i:08d}",
+            f"{i:08d}",
+            company_name,
+            company_name + " B.V.",
+            *timestamps(_fake),
+        )
+    )
+
+    for protocol in rng.sample(range(task.count), rng.randint(1, min(5, task.count))):
+        for j in rng.sample(
+            range(VERSIONS_PER_PROTOCOL), rng.randint(1, VERSIONS_PER_PROTOCOL)
+        ):
+            version_id = protocol_version_id(task.seed, protocol, j)
+            rows[HealthcareProviderQualification.__tablename__].append(
+                (
+                    stable_uuid(task.seed, "provider_qualification", i, version_id),
+                    provider_id,
+                    version_id,
+                    _fake.date_between(FIRST_DATE, LAST_DATE),
+                    *timestamps(_fake),
+                )
+            )
+
+
+def _generate_vendor(
+    task: ChunkTask,
+    i: int,
+    rng: random.Random,
+    _fake: Faker,
+    rows: Dict[str, List[Row]],
+) -> None:
+    vendor_id = stable_uuid(task.seed, "vendor", i)
+    company_name = _fake.company()
+    rows[Vendor.__tablename__].append(
+        (
+            vendor_id,
+            f"{i:08d}",
+            company_name,
+            company_name + " B.V.",
+            *timestamps(_fake),
+        )
+    )
+
+    for j in range(rng.randint(2, 5)):
+        application_id = stable_uuid(task.seed, "application", i, j)
+        rows[Application.__tablename__].append(
+            (application_id, _fake.catch_phrase(), vendor_id, *timestamps(_fake))
+        )
+        for role_id in rng.sample(task.role_ids, 2):
+            rows[ApplicationRole.__tablename__].append(
+                (
+                    stable_uuid(task.seed, "application_role", application_id, role_id),
+                    application_id,
+                    role_id,
+                    *timestamps(_fake),
+                )
+            )
+        for system_type_id in rng.sample(task.system_type_ids, 2):
+            rows[ApplicationType.__tablename__].append(
+                (
+                    stable_uuid(
+                        task.seed, "application_type", application_id, system_type_id
+                    ),
+                    application_id,
+                    system_type_id,
+                    *timestamps(_fake),
+                )
+            )
+
+        for version in rng.sample(versions, rng.randint(1, 3)):
+            version_id = stable_uuid(task.seed, "application_version", i, j, version)
+            rows[ApplicationVersion.__tablename__].append(
+                (version_id, version, application_id, *timestamps(_fake))
+            )
+            rows[ProtocolApplicationQualification.__tablename__].append(
+                (
+                    stable_uuid(task.seed, "application_qualification", version_id),
+                    version_id,
+                    protocol_version_id(
+                        task.seed,
+                        rng.randrange(task.count),
+                        rng.randrange(VERSIONS_PER_PROTOCOL),
+                    ),
+                    _fake.date_between(FIRST_DATE, LAST_DATE),
+                    *timestamps(_fake),
+                )
+            )
+            for provider in rng.sample(
+                range(task.count), min(rng.randint(1, 3), task.count)
+            ):
+                rows[HealthcareProviderApplicationVersion.__tablename__].append(
+                    (
+                        stable_uuid(task.seed, "provider_version", version_id, provider),
+                        stable_uuid(task.seed, "healthcare_provider", provider),
+                        version_id,
+                        *timestamps(_fake),
+                    )
+                )
+
+
+def copy_rows(connection: Connection, rows: Dict[str, List[Row]]) -> int:
+    """
+    Loads the rows with one COPY per table, in the order of TABLE_COLUMNS so that
+    referenced rows are loaded first.
+    """
+    cursor = connection.connection.driver_connection.cursor()  # type: ignore
+    loaded = 0
+    for table, columns in TABLE_COLUMNS.items():
+        if not rows[table]:
+            continue
+
+        statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table), sql.SQL(", ").join(map(sql.Identifier, columns))
+        )
+        with cursor.copy(statement) as copy:
+            for row in rows[table]:
+                copy.write_row(row)
+        loaded += len(rows[table])
+
+    return loaded
+
+
+def chunks(kind: str, count: int, template: ChunkTask) -> List[ChunkTask]:
+    return [
+        template._replace(
+            kind=kind,
+            index=index,
+            start=start,
+            stop=min(start + CHUNK_SIZE, count),
+        )
+        for index, start in enumerate(range(0, count, CHUNK_SIZE))
+    ]
+
+
+def run_bulk(count: int, seed: int, workers: int):
+    start = perf_counter()
+    with engine.begin() as connection:
+        if connection.execute(select(exists(Vendor))).scalar():
+            raise SystemExit("Bulk mode needs a register without vendors")
+
+        rows, template = generate_reference_rows(seed, count, connection)
+        loaded = copy_rows(connection, rows)
+
+        # Chunks are loaded in order, so protocols and providers exist before the
+        # rows of later chunks refer to them
+        tasks = (
+            chunks("protocols", count, template)
+            + chunks("healthcare_providers", count, template)
+            + chunks("vendors", count, template)
+        )
+        with Pool(workers) as pool:
+            for rows in pool.imap(generate_chunk, tasks):
+                loaded += copy_rows(connection, rows)
+
+    print(f"Loaded {loaded} rows with seed {seed} in {perf_counter() - start:.1f}s")
+
+
 if __name__ == "__main__":
-    run()
+    args = parser.parse_args()
+    if args.bulk:
+        seed = args.seed if args.seed is not None else random.randrange(2**32)
+        run_bulk(args.count, seed, args.workers)
+    else:
+        run(args.count)
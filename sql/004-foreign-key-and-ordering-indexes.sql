@@ -0,0 +1,22 @@
+-- Index the referencing side of foreign keys, so reverse lookups and ON DELETE CASCADE
+-- do not scan the whole child table
+CREATE INDEX applications_vendor_id_idx ON applications (vendor_id);
+CREATE INDEX application_versions_application_id_idx ON application_versions (application_id);
+CREATE INDEX protocol_versions_protocol_id_idx ON protocol_versions (protocol_id);
+
+-- The primary keys of the junction tables only cover lookups on their first column
+CREATE INDEX applications_roles_role_id_idx ON applications_roles (role_id);
+CREATE INDEX applications_types_system_type_id_idx ON applications_types (system_type_id);
+CREATE INDEX healthcare_providers_app_versions_version_id_idx ON healthcare_providers_application_versions (application_version_id);
+CREATE INDEX healthcare_providers_qualifications_protocol_version_id_idx ON healthcare_providers_qualifications (protocol_version_id);
+CREATE INDEX protocol_application_qualifications_protocol_version_id_idx ON protocol_application_qualifications (protocol_version_id);
+
+-- Repositories order by (created_at DESC, id DESC), which a backward scan of these indexes serves
+CREATE INDEX vendors_created_at_id_idx ON vendors (created_at, id);
+CREATE INDEX applications_created_at_id_idx ON applications (created_at, id);
+CREATE INDEX application_versions_created_at_id_idx ON application_versions (created_at, id);
+CREATE INDEX protocols_created_at_id_idx ON protocols (created_at, id);
+CREATE INDEX protocol_versions_created_at_id_idx ON protocol_versions (created_at, id);
+CREATE INDEX roles_created_at_id_idx ON roles (created_at, id);
+CREATE INDEX system_types_created_at_id_idx ON system_types (created_at, id);
+CREATE INDEX healthcare_providers_created_at_id_idx ON healthcare_providers (created_at, id);
@@ -0,0 +1,22 @@
+-- Rendered list pages shared by all API processes. They can be rebuilt at any time,
+-- so the tables are not written to the WAL
+CREATE UNLOGGED TABLE response_cache_entries (
+    key VARCHAR NOT NULL,
+    body BYTEA NOT NULL,
+    expires_at TIMESTAMP NOT NULL,
+
+    PRIMARY KEY (key)
+);
+CREATE INDEX response_cache_entries_expires_at_idx ON response_cache_entries (expires_at);
+
+-- Bumped whenever rows of the entity type (a table name) change, which makes the
+-- cached pages built from those rows unreachable
+CREATE UNLOGGED TABLE response_cache_generations (
+    entity_type VARCHAR(150) NOT NULL,
+    generation INTEGER NOT NULL,
+
+    PRIMARY KEY (entity_type)
+);
+
+GRANT SELECT,INSERT,UPDATE,DELETE ON response_cache_entries TO qualification_admin;
+GRANT SELECT,INSERT,UPDATE,DELETE ON response_cache_generations TO qualification_admin;
@@ -0,0 +1,3 @@
+-- Application names are unique per vendor. The constraint is the conflict target that
+-- lets registering an application use INSERT ... ON CONFLICT instead of a lookup first
+ALTER TABLE applications ADD CONSTRAINT applications_vendor_id_name_key UNIQUE (vendor_id, name);
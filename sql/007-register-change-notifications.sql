@@ -0,0 +1,36 @@
+-- Tells the read-only API that the register changed, so it reloads its snapshot.
+-- Notifications are sent when the transaction commits, and identical ones of a
+-- transaction are sent once, so a bulk change causes a single reload
+CREATE FUNCTION notify_register_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('register_changed', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vendors_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON vendors
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER protocols_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON protocols
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER protocol_versions_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON protocol_versions
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER roles_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON roles
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER system_types_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON system_types
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER applications_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON applications
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER application_versions_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON application_versions
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER healthcare_providers_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON healthcare_providers
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER applications_roles_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON applications_roles
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER applications_types_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON applications_types
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER healthcare_providers_application_versions_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON healthcare_providers_application_versions
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER healthcare_providers_qualifications_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON healthcare_providers_qualifications
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
+CREATE TRIGGER protocol_application_qualifications_changed AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON protocol_application_qualifications
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_register_changed();
@@ -0,0 +1,10 @@
+-- Applications filtered on their vendor are paged in (created_at, id) order straight
+-- from this index. It still serves the reverse lookups of the vendor foreign key
+DROP INDEX applications_vendor_id_idx;
+CREATE INDEX applications_vendor_id_created_at_id_idx ON applications (vendor_id, created_at, id);
+
+-- List pages can be filtered on a modified_at range, which these indexes serve. The
+-- created_at ranges are served by the (created_at, id) indexes of 004
+CREATE INDEX vendors_modified_at_idx ON vendors (modified_at);
+CREATE INDEX applications_modified_at_idx ON applications (modified_at);
+CREATE INDEX healthcare_providers_modified_at_idx ON healthcare_providers (modified_at);
@@ -0,0 +1,12 @@
+-- Search matches names and codes with ILIKE '%query%', which a b-tree cannot serve.
+-- Trigram indexes can, for queries of at least three characters
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX vendors_trade_name_trgm_idx ON vendors USING gin (trade_name gin_trgm_ops);
+CREATE INDEX vendors_statutory_name_trgm_idx ON vendors USING gin (statutory_name gin_trgm_ops);
+CREATE INDEX vendors_kvk_number_trgm_idx ON vendors USING gin (kvk_number gin_trgm_ops);
+CREATE INDEX applications_name_trgm_idx ON applications USING gin (name gin_trgm_ops);
+CREATE INDEX healthcare_providers_trade_name_trgm_idx ON healthcare_providers USING gin (trade_name gin_trgm_ops);
+CREATE INDEX healthcare_providers_statutory_name_trgm_idx ON healthcare_providers USING gin (statutory_name gin_trgm_ops);
+CREATE INDEX healthcare_providers_ura_code_trgm_idx ON healthcare_providers USING gin (ura_code gin_trgm_ops);
+CREATE INDEX healthcare_providers_agb_code_trgm_idx ON healthcare_providers USING gin (agb_code gin_trgm_ops);
@@ -0,0 +1,286 @@
+"""
+Service layer benchmarks.
+
+Seeds a register of each requested size and times the hot service methods and
+DTO mappers. Reports p50/p95 latency, SQL statements per call and peak memory:
+
+    python -m tests.benchmarks --sizes 10,1000,100000 --output after.json
+    python -m tests.benchmarks --sizes 10,1000,100000 --compare before.json
+
+Runs against an in-memory SQLite database unless --dsn is given. A database given
+with --dsn must have the schema migrated, and it is emptied before every size.
+"""
+
+import argparse
+import random
+from datetime import date
+from itertools import count
+from typing import Any, Callable
+
+import inject
+from gfmodules_python_shared.schema.sql_model import SQLModelBase
+from sqlalchemy import Engine, create_engine, select, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.entities import Application, HealthcareProvider, Vendor
+from app.db.repository import (
+    ApplicationRepository,
+    HealthcareProviderRepository,
+    VendorRepository,
+)
+from app.db.services import (
+    ApplicationService,
+    HealthcareProviderQualificationService,
+    HealthcareProviderService,
+    ProtocolApplicationQualificationService,
+    VendorService,
+)
+from app.metrics.database import instrument_engine
+from app.helpers.responses import dto_list_response
+from app.schemas.application.mapper import (
+    map_application_entities_to_dtos,
+    map_application_entity_to_dto,
+)
+from app.schemas.application.schema import ApplicationDto
+from app.schemas.healthcare_provider.mapper import (
+    map_healthcare_provider_entity_to_dto,
+)
+from app.schemas.vendor.mapper import map_vendor_entity_to_dto
+from tests.benchmarks.fixtures import SeededRegister, seed_register
+from tests.benchmarks.runner import (
+    BenchmarkResult,
+    format_results,
+    measure,
+    read_results,
+    write_results,
+)
+from tests.utests.db.services.utils import bind_services
+
+PAGE_SIZE = 50
+QUALIFICATION_DATE = date(2024, 6, 1)
+
+
+def create_benchmark_engine(dsn: str | None) -> Engine:
+    if dsn is None:
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        SQLModelBase.metadata.create_all(engine)
+    else:
+        engine = create_engine(dsn)
+        tables = ", ".join(table.name for table in SQLModelBase.metadata.sorted_tables)
+        with engine.begin() as connection:
+            connection.execute(text(f"TRUNCATE {tables} CASCADE"))
+
+    instrument_engine(engine, "benchmark")
+    return engine
+
+
+def service_benchmarks(
+    register: SeededRegister, seed: int
+) -> list[tuple[str, Callable[[], Any]]]:
+    rng = random.Random(seed)
+    calls = count()
+    application_service = inject.instance(ApplicationService)
+    vendor_service = inject.instance(VendorService)
+    healthcare_provider_service = inject.instance(HealthcareProviderService)
+    protocol_qualification_service = inject.instance(
+        ProtocolApplicationQualificationService
+    )
+    provider_qualification_service = inject.instance(
+        HealthcareProviderQualificationService
+    )
+    versions = register.application_version_ids
+    providers = register.healthcare_provider_ids
+    protocol_versions = register.protocol_version_ids
+    # The offset of the page in the middle of the seeded applications
+    middle = len(register.application_ids) // 2
+
+    def qualify_application_version() -> None:
+        # Every call qualifies a pair that is not qualified yet, see seed_register
+        i = next(calls)
+        protocol_qualification_service.qualify_protocol_version_to_application_version(
+            protocol_version_id=protocol_versions[
+                (i % len(versions) + 1 + i // len(versions)) % len(protocol_versions)
+            ],
+            application_version_id=versions[i % len(versions)],
+            qualification_date=QUALIFICATION_DATE,
+        )
+
+    def qualify_healthcare_provider() -> None:
+        i = next(calls)
+        provider_qualification_service.qualify_healthcare_provider(
+            healthcare_provider_id=providers[i % len(providers)],
+            protocol_version_id=protocol_versions[
+                (i % len(providers) + 2 + i // len(providers)) % len(protocol_versions)
+            ],
+            qualification_date=QUALIFICATION_DATE,
+        )
+
+    def add_vendor() -> None:
+        i = next(calls)
+        vendor_service.add_one(
+            kvk_number=f"benchmark {i}",
+            trade_name=f"benchmark vendor {i}",
+            statutory_name=f"benchmark vendor {i} B.V.",
+        )
+
+    def add_application() -> None:
+        i = next(calls)
+        application_service.add_one(
+            vendor_id=register.vendor_ids[i % len(register.vendor_ids)],
+            application_name=f"benchmark application {i}",
+            version="1.0.0",
+            system_type_names=register.system_type_names[:2],
+            role_names=register.role_names[:2],
+        )
+
+    return [
+        (
+            "ApplicationService.get_paginated",
+            lambda: application_service.get_paginated(limit=PAGE_SIZE, offset=0),
+        ),
+        (
+            "ApplicationService.get_paginated (middle)",
+            lambda: application_service.get_paginated(limit=PAGE_SIZE, offset=middle),
+        ),
+        (
+            "ApplicationService.get_paginated (no total)",
+            lambda: application_service.get_paginated(
+                limit=PAGE_SIZE, offset=0, count_mode=None
+            ),
+        ),
+        (
+            "ApplicationService.get_paginated_json",
+            lambda: application_service.get_paginated_json(limit=PAGE_SIZE, offset=0),
+        ),
+        (
+            "VendorService.get_paginated",
+            lambda: vendor_service.get_paginated(limit=PAGE_SIZE, offset=0),
+        ),
+        (
+            "VendorService.get_paginated_json",
+            lambda: vendor_service.get_paginated_json(limit=PAGE_SIZE, offset=0),
+        ),
+        (
+            "HealthcareProviderService.get_paginated",
+            lambda: healthcare_provider_service.get_paginated(
+                limit=PAGE_SIZE, offset=0
+            ),
+        ),
+        (
+            "ApplicationService.get_one",
+            lambda: application_service.get_one(rng.choice(register.application_ids)),
+        ),
+        (
+            "VendorService.get_one",
+            lambda: vendor_service.get_one(rng.choice(register.vendor_ids)),
+        ),
+        (
+            "HealthcareProviderService.get_one",
+            lambda: healthcare_provider_service.get_one(rng.choice(providers)),
+        ),
+        (
+            "qualify_protocol_version_to_application_version",
+            qualify_application_version,
+        ),
+        ("qualify_healthcare_provider", qualify_healthcare_provider),
+        ("VendorService.add_one", add_vendor),
+        ("ApplicationService.add_one", add_application),
+    ]
+
+
+def mapper_benchmarks(session: Session) -> list[tuple[str, Callable[[], Any]]]:
+    """
+    Maps a page of entities that is loaded once, so only the mapping is timed.
+    """
+    applications = session.scalars(
+        select(Application)
+        .options(*ApplicationRepository(session).loader_options())
+        .limit(PAGE_SIZE)
+    ).all()
+    vendors = session.scalars(
+        select(Vendor)
+        .options(*VendorRepository(session).loader_options())
+        .limit(PAGE_SIZE)
+    ).all()
+    providers = session.scalars(
+        select(HealthcareProvider)
+        .options(*HealthcareProviderRepository(session).loader_options())
+        .limit(PAGE_SIZE)
+    ).all()
+
+    return [
+        (
+            f"map_application_entity_to_dto x{len(applications)}",
+            lambda: [map_application_entity_to_dto(entity) for entity in applications],
+        ),
+        (
+            f"map_vendor_entity_to_dto x{len(vendors)}",
+            lambda: [map_vendor_entity_to_dto(entity) for entity in vendors],
+        ),
+        (
+            f"map_healthcare_provider_entity_to_dto x{len(providers)}",
+            lambda: [
+                map_healthcare_provider_entity_to_dto(entity) for entity in providers
+            ],
+        ),
+        (
+            f"dto_list_response applications x{len(applications)}",
+            lambda: dto_list_response(
+                map_application_entities_to_dtos(applications), ApplicationDto
+            ),
+        ),
+    ]
+
+
+def run_size(
+    size: int, repeat: int, seed: int, dsn: str | None
+) -> list[BenchmarkResult]:
+    engine = create_benchmark_engine(dsn)
+    inject.configure(lambda binder: bind_services(binder, engine), clear=True)
+    session_factory = sessionmaker(engine)
+
+    with session_factory() as session:
+        register = seed_register(session, size, seed)
+
+    results = [
+        measure(size, name, func, repeat)
+        for name, func in service_benchmarks(register, seed)
+    ]
+    with session_factory() as session:
+        results += [
+            measure(size, name, func, repeat)
+            for name, func in mapper_benchmarks(session)
+        ]
+
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser("Service benchmarks")
+    parser.add_argument(
+        "--sizes",
+        default="10,100,1000",
+        help="Comma separated register sizes, e.g. 10,1000,100000",
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per case")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the data")
+    parser.add_argument("--dsn", default=None, help="Database to run against")
+    parser.add_argument("--output", default=None, help="Write the results as JSON")
+    parser.add_argument("--compare", default=None, help="JSON results to compare to")
+    args = parser.parse_args()
+
+    results: list[BenchmarkResult] = []
+    for size in (int(size) for size in args.sizes.split(",")):
+        results += run_size(size, args.repeat, args.seed, args.dsn)
+
+    baseline = read_results(args.compare) if args.compare else None
+    print(format_results(results, baseline))
+
+    if args.output:
+        write_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
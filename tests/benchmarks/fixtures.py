@@ -0,0 +1,239 @@
+import random
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, NamedTuple, Type
+from uuid import UUID
+
+from gfmodules_python_shared.schema.sql_model import SQLModelBase
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.db.entities import (
+    Application,
+    ApplicationRole,
+    ApplicationType,
+    ApplicationVersion,
+    HealthcareProvider,
+    HealthcareProviderApplicationVersion,
+    HealthcareProviderQualification,
+    Protocol,
+    ProtocolApplicationQualification,
+    ProtocolVersion,
+    Role,
+    SystemType,
+    Vendor,
+)
+
+BATCH_SIZE = 10_000
+APPLICATIONS_PER_VENDOR = 2
+VERSIONS_PER_APPLICATION = 2
+VERSIONS_PER_PROTOCOL = 3
+QUALIFICATIONS_PER_PROVIDER = 2
+
+
+class SeededRegister(NamedTuple):
+    """
+    Ids of the seeded rows, so benchmarks can pick existing entities and pairs
+    that are not qualified yet.
+    """
+
+    vendor_ids: list[UUID]
+    application_ids: list[UUID]
+    application_version_ids: list[UUID]
+    healthcare_provider_ids: list[UUID]
+    protocol_version_ids: list[UUID]
+    role_names: list[str]
+    system_type_names: list[str]
+
+
+def seed_register(session: Session, size: int, seed: int = 0) -> SeededRegister:
+    """
+    Inserts a register with `size` vendors and healthcare providers, and related
+    applications, versions, protocols and qualifications in proportion. Rows are
+    inserted with batched executemany statements instead of through the unit of
+    work, so large sizes seed in seconds. The same seed gives the same data.
+    """
+    rng = random.Random(seed)
+    epoch = datetime(2024, 1, 1)
+
+    def uuid() -> UUID:
+        return UUID(int=rng.getrandbits(128), version=4)
+
+    def timestamps(index: int) -> dict[str, datetime]:
+        moment = epoch + timedelta(seconds=index)
+        return {"created_at": moment, "modified_at": moment}
+
+    # The ids and names the register returns are generated as lists first, and the
+    # rows are built from them
+    role_names = [f"role {i}" for i in range(20)]
+    roles = [
+        {"id": uuid(), "name": name, "description": None, **timestamps(i)}
+        for i, name in enumerate(role_names)
+    ]
+    system_type_names = [f"system type {i}" for i in range(10)]
+    system_types = [
+        {"id": uuid(), "name": name, "description": None, **timestamps(i)}
+        for i, name in enumerate(system_type_names)
+    ]
+    protocols = [
+        {
+            "id": uuid(),
+            "protocol_type": "Directive",
+            "name": f"protocol {i}",
+            "description": None,
+            **timestamps(i),
+        }
+        for i in range(max(size // 10, 5))
+    ]
+    protocol_version_ids = [
+        uuid() for _ in range(len(protocols) * VERSIONS_PER_PROTOCOL)
+    ]
+    protocol_versions = [
+        {
+            "id": protocol_version_ids[i * VERSIONS_PER_PROTOCOL + j],
+            "version": f"{j}.0",
+            "description": None,
+            "protocol_id": protocol["id"],
+            **timestamps(i * VERSIONS_PER_PROTOCOL + j),
+        }
+        for i, protocol in enumerate(protocols)
+        for j in range(VERSIONS_PER_PROTOCOL)
+    ]
+    vendor_ids = [uuid() for _ in range(size)]
+    vendors = [
+        {
+            "id": vendor_id,
+            "kvk_number": f"{i:08d}",
+            "trade_name": f"vendor {i}",
+            "statutory_name": f"vendor {i} B.V.",
+            **timestamps(i),
+        }
+        for i, vendor_id in enumerate(vendor_ids)
+    ]
+    application_ids = [uuid() for _ in range(size * APPLICATIONS_PER_VENDOR)]
+    applications = [
+        {
+            "id": application_ids[i * APPLICATIONS_PER_VENDOR + j],
+            "name": f"application {i * APPLICATIONS_PER_VENDOR + j}",
+            "vendor_id": vendor_id,
+            **timestamps(i * APPLICATIONS_PER_VENDOR + j),
+        }
+        for i, vendor_id in enumerate(vendor_ids)
+        for j in range(APPLICATIONS_PER_VENDOR)
+    ]
+    application_version_ids = [
+        uuid() for _ in range(len(application_ids) * VERSIONS_PER_APPLICATION)
+    ]
+    application_versions = [
+        {
+            "id": application_version_ids[i * VERSIONS_PER_APPLICATION + j],
+            "version": f"{j}.0.0",
+            "application_id": application_id,
+            **timestamps(i * VERSIONS_PER_APPLICATION + j),
+        }
+        for i, application_id in enumerate(application_ids)
+        for j in range(VERSIONS_PER_APPLICATION)
+    ]
+    application_roles = [
+        {
+            "id": uuid(),
+            "application_id": application_id,
+            "role_id": role["id"],
+            **timestamps(i),
+        }
+        for i, application_id in enumerate(application_ids)
+        for role in rng.sample(roles, 2)
+    ]
+    application_types = [
+        {
+            "id": uuid(),
+            "application_id": application_id,
+            "system_type_id": system_type["id"],
+            **timestamps(i),
+        }
+        for i, application_id in enumerate(application_ids)
+        for system_type in rng.sample(system_types, 2)
+    ]
+    healthcare_provider_ids = [uuid() for _ in range(size)]
+    healthcare_providers = [
+        {
+            "id": provider_id,
+            "ura_code": f"{i:08d}",
+            "agb_code": f"{i:08d}",
+            "trade_name": f"provider {i}",
+            "statutory_name": f"provider {i} B.V.",
+            **timestamps(i),
+        }
+        for i, provider_id in enumerate(healthcare_provider_ids)
+    ]
+    # Version i is qualified for protocol version i, so pairing it with protocol
+    # version i + 1 gives a pair that is still free
+    application_qualifications = [
+        {
+            "id": uuid(),
+            "application_version_id": version_id,
+            "protocol_version_id": protocol_version_ids[i % len(protocol_version_ids)],
+            "qualification_date": date(2024, 1, 1),
+            "archived_date": None,
+            **timestamps(i),
+        }
+        for i, version_id in enumerate(application_version_ids)
+    ]
+    provider_qualifications = [
+        {
+            "id": uuid(),
+            "healthcare_provider_id": provider_id,
+            "protocol_version_id": protocol_version_ids[
+                (i + j) % len(protocol_version_ids)
+            ],
+            "qualification_date": date(2024, 1, 1),
+            "archived_date": None,
+            **timestamps(i),
+        }
+        for i, provider_id in enumerate(healthcare_provider_ids)
+        for j in range(QUALIFICATIONS_PER_PROVIDER)
+    ]
+    provider_application_versions = [
+        {
+            "id": uuid(),
+            "healthcare_provider_id": provider_id,
+            "application_version_id": application_version_ids[i],
+            **timestamps(i),
+        }
+        for i, provider_id in enumerate(healthcare_provider_ids)
+    ]
+
+    # Parents before children, so the foreign keys hold
+    tables: list[tuple[Type[SQLModelBase], list[dict[str, Any]]]] = [
+        (Role, roles),
+        (SystemType, system_types),
+        (Protocol, protocols),
+        (ProtocolVersion, protocol_versions),
+        (Vendor, vendors),
+        (Application, applications),
+        (ApplicationVersion, application_versions),
+        (ApplicationRole, application_roles),
+        (ApplicationType, application_types),
+        (HealthcareProvider, healthcare_providers),
+        (ProtocolApplicationQualification, application_qualifications),
+        (HealthcareProviderQualification, provider_qualifications),
+        (HealthcareProviderApplicationVersion, provider_application_versions),
+    ]
+    for entity, rows in tables:
+        for batch in _batches(rows, BATCH_SIZE):
+            session.execute(insert(entity), batch)
+    session.commit()
+
+    return SeededRegister(
+        vendor_ids=vendor_ids,
+        application_ids=application_ids,
+        application_version_ids=application_version_ids,
+        healthcare_provider_ids=healthcare_provider_ids,
+        protocol_version_ids=protocol_version_ids,
+        role_names=role_names,
+        system_type_names=system_type_names,
+    )
+
+
+def _batches(rows: list[dict[str, Any]], size: int) -> Iterable[list[dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
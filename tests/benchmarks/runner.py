@@ -0,0 +1,107 @@
+import json
+import math
+import tracemalloc
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any, Callable, Sequence
+
+from app.metrics.database import track_queries
+
+
+@dataclass
+class BenchmarkResult:
+    size: int
+    name: str
+    calls: int
+    p50_ms: float
+    p95_ms: float
+    queries_per_call: float
+    peak_memory_kib: float
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile, `q` between 0 and 100.
+    """
+    ordered = sorted(samples)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def measure(
+    size: int, name: str, func: Callable[[], Any], repeat: int
+) -> BenchmarkResult:
+    """
+    Calls `func` once to warm up, then `repeat` times while timing every call and
+    counting its SQL statements. Peak memory is measured on one extra call, so the
+    tracing overhead does not end up in the timings.
+    """
+    func()
+
+    durations = []
+    with track_queries() as stats:
+        for _ in range(repeat):
+            start = perf_counter()
+            func()
+            durations.append(perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        size=size,
+        name=name,
+        calls=repeat,
+        p50_ms=percentile(durations, 50) * 1000,
+        p95_ms=percentile(durations, 95) * 1000,
+        queries_per_call=stats.statements / repeat,
+        peak_memory_kib=peak / 1024,
+    )
+
+
+def format_results(
+    results: Sequence[BenchmarkResult],
+    baseline: Sequence[BenchmarkResult] | None = None,
+) -> str:
+    """
+    Renders the results as a table. With a baseline, the change of the p50 and p95
+    latency against the baseline run is added.
+    """
+    previous = {(result.size, result.name): result for result in baseline or []}
+    header = f"{'size':>7}  {'benchmark':<50} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8} {'peak KiB':>9}"
+    if previous:
+        header += f" {'Δp50':>8} {'Δp95':>8}"
+
+    lines = [header, "-" * len(header)]
+    for result in results:
+        line = (
+            f"{result.size:>7}  {result.name:<50} {result.p50_ms:>9.2f} "
+            f"{result.p95_ms:>9.2f} {result.queries_per_call:>8.1f} "
+            f"{result.peak_memory_kib:>9.0f}"
+        )
+        before = previous.get((result.size, result.name))
+        if before is not None:
+            line += f" {_change(before.p50_ms, result.p50_ms):>8} {_change(before.p95_ms, result.p95_ms):>8}"
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+def _change(before: float, after: float) -> str:
+    if before == 0:
+        return "n/a"
+    return f"{(after - before) / before:+.0%}"
+
+
+def write_results(path: str, results: Sequence[BenchmarkResult]) -> None:
+    with open(path, "w") as file:
+        json.dump([asdict(result) for result in results], file, indent=2)
+
+
+def read_results(path: str) -> list[BenchmarkResult]:
+    with open(path) as file:
+        return [BenchmarkResult(**result) for result in json.load(file)]
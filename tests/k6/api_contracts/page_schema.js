@@ -15,7 +15,10 @@ export const pageResponseSchema = function(item) {
             type: "number"
         },
         total: {
-            type: "number"
+            type: ["number", "null"]
+        },
+        nextCursor: {
+            type: ["string", "null"]
         }
     },
     required: [
@@ -0,0 +1,185 @@
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from gfmodules_python_shared.schema.sql_model import SQLModelBase
+from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.cache.response_cache import (
+    DatabaseResponseCache,
+    MemoryResponseCache,
+    invalidate_on_commit,
+)
+from app.db.entities import (
+    Application,
+    ApplicationVersion,
+    ResponseCacheGeneration,
+    Role,
+    Vendor,
+)
+from app.db.repository import ApplicationRepository
+from app.db.session_manager import ReadReplica, reading_from_replica
+from app.middleware.read_replica import LAST_WRITE_COOKIE, ReadReplicaMiddleware
+from app.middleware.response_cache import ResponseCacheMiddleware
+from tests.utests.db.services.utils import enforce_foreign_keys
+
+
+def create_client(backend: MemoryResponseCache) -> tuple[TestClient, list[bool]]:
+    # Whether each build of the page read from the replica
+    builds: list[bool] = []
+    api = FastAPI()
+    api.add_middleware(
+        ResponseCacheMiddleware, backend=backend, pages={"/roles": ("roles",)}
+    )
+
+    @api.get("/roles")
+    def get_roles(limit: int = 10, offset: int = 0) -> dict[str, int]:
+        builds.append(reading_from_replica())
+        return {"limit": limit, "offset": offset, "builds": len(builds)}
+
+    return TestClient(api), builds
+
+
+def create_session_factory() -> sessionmaker[Session]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    enforce_foreign_keys(engine)
+    SQLModelBase.metadata.create_all(engine)
+    return sessionmaker(engine)
+
+
+def test_list_pages_should_be_served_from_the_cache() -> None:
+    client, builds = create_client(MemoryResponseCache())
+
+    first = client.get("/roles?limit=5&offset=0")
+    second = client.get("/roles?offset=0&limit=5")
+
+    assert first.json() == second.json() == {"limit": 5, "offset": 0, "builds": 1}
+    assert len(builds) == 1
+
+    client.get("/roles?limit=5&offset=5")
+    assert len(builds) == 2
+
+
+def test_invalidated_entity_types_should_rebuild_the_page() -> None:
+    backend = MemoryResponseCache()
+    client, builds = create_client(backend)
+
+    client.get("/roles")
+    backend.invalidate(["vendors"])
+    client.get("/roles")
+    assert len(builds) == 1
+
+    backend.invalidate(["roles"])
+    assert client.get("/roles").json()["builds"] == 2
+
+
+def test_pages_read_from_the_replica_should_be_built_on_the_primary() -> None:
+    backend = MemoryResponseCache()
+    client, builds = create_client(backend)
+    client.app.add_middleware(  # type: ignore[attr-defined]
+        ReadReplicaMiddleware,
+        replica=ReadReplica(sessionmaker(), async_sessionmaker()),
+        sticky_seconds=5,
+    )
+
+    client.get("/roles")
+    client.get("/roles")
+    assert builds == [False]
+
+    client.cookies.set(LAST_WRITE_COOKIE, str(time.time()))
+    client.get("/roles")
+    assert builds == [False]
+
+    backend.invalidate(["roles"])
+    client.cookies.clear()
+    assert client.get("/roles").json()["builds"] == 2
+    assert builds == [False, False]
+
+
+def test_commits_should_invalidate_the_written_tables() -> None:
+    backend = MemoryResponseCache()
+    session_factory = create_session_factory()
+    invalidate_on_commit(backend, session_factory.class_)
+
+    with session_factory() as session:
+        session.add(Role(name="example", description="example"))
+        session.flush()
+        session.rollback()
+    assert asyncio.run(backend.version(["roles"])) == "0"
+
+    with session_factory() as session:
+        session.add(Role(name="example", description="example"))
+        session.commit()
+    assert asyncio.run(backend.version(["roles"])) == "1"
+
+    with session_factory() as session:
+        session.execute(delete(Role))
+        session.commit()
+    assert asyncio.run(backend.version(["roles", "vendors"])) == "2,0"
+
+
+def test_deletes_should_invalidate_the_tables_reached_by_on_delete_cascade() -> None:
+    backend = MemoryResponseCache()
+    session_factory = create_session_factory()
+    invalidate_on_commit(backend, session_factory.class_)
+    with session_factory() as session:
+        vendor = Vendor(kvk_number="1", trade_name="vendor", statutory_name="vendor")
+        application = Application(name="application", vendor=vendor)
+        session.add(ApplicationVersion(version="v1", application=application))
+        session.commit()
+        application_id = application.id
+
+    api = FastAPI()
+    api.add_middleware(
+        ResponseCacheMiddleware,
+        backend=backend,
+        pages={
+            "/healthcare-provider": (
+                "healthcare_providers",
+                "healthcare_providers_application_versions",
+                "application_versions",
+            )
+        },
+    )
+
+    @api.get("/healthcare-provider")
+    def get_versions() -> int:
+        with session_factory() as session:
+            stmt = select(func.count()).select_from(ApplicationVersion)
+            return session.execute(stmt).scalar_one()
+
+    client = TestClient(api)
+    assert client.get("/healthcare-provider").json() == 1
+
+    with session_factory() as session:
+        ApplicationRepository(session).delete_returning(
+            Application, Application.id == application_id
+        )
+        session.commit()
+
+    assert client.get("/healthcare-provider").json() == 0
+
+
+def test_database_backend_should_bump_generations() -> None:
+    session_factory = create_session_factory()
+    engine = session_factory.kw["bind"]
+    backend = DatabaseResponseCache(engine, engine)  # type: ignore[arg-type]
+
+    backend.invalidate(["roles"])
+    backend.invalidate(["roles", "vendors"])
+
+    with session_factory() as session:
+        generations = session.execute(
+            select(
+                ResponseCacheGeneration.entity_type, ResponseCacheGeneration.generation
+            )
+        ).all()
+    assert sorted(generations) == [("roles", 2), ("vendors", 1)]
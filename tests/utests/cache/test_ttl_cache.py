@@ -0,0 +1,58 @@
+from app.cache.ttl_cache import TTLCache
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl() -> None:
+    timer = FakeTimer()
+    cache: TTLCache[str, int] = TTLCache("test", ttl=10, timer=timer)
+    cache.set("a", 1)
+
+    timer.now = 9.9
+    assert cache.get("a") == 1
+
+    timer.now = 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLCache[str, int] = TTLCache("test", maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_get_or_load_only_loads_on_a_miss() -> None:
+    cache: TTLCache[str, int] = TTLCache("test")
+    loads = []
+
+    def load() -> int:
+        loads.append(1)
+        return 1
+
+    assert cache.get_or_load("a", load) == 1
+    assert cache.get_or_load("a", load) == 1
+    assert len(loads) == 1
+
+    cache.invalidate()
+    assert cache.get_or_load("a", load) == 1
+    assert len(loads) == 2
+
+
+def test_zero_ttl_disables_the_cache() -> None:
+    cache: TTLCache[str, int] = TTLCache("test", ttl=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
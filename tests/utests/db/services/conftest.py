@@ -16,6 +16,7 @@ from app.db.services import (
     HealthcareProviderQualificationService,
     HealthcareProviderService,
     RoleService,
+    SearchService,
     SystemTypeService,
     VendorService,
 )
@@ -112,6 +113,11 @@ def protocol_application_qualification_service() -> (
     )
 
 
+@pytest.fixture
+def search_service() -> SearchService:
+    return cast(SearchService, Services.SEARCH.get_instance())
+
+
 @pytest.fixture
 def role(role_service: RoleService) -> Role:
     return role_service.add_one(name="example role", description="some description")
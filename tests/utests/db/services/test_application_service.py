@@ -1,14 +1,36 @@
+from datetime import date, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
 import pytest
+from inject import instance
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.db.entities import Application
-from app.db.entities import Vendor
+from app.db.entities import (
+    ApplicationRole,
+    ApplicationType,
+    ApplicationVersion,
+    ProtocolVersion,
+    Role,
+    SystemType,
+    Vendor,
+)
 from app.exceptions.app_exceptions import ApplicationNotFoundException
+from app.db.repository import ApplicationRepository
 from app.db.services import ApplicationService
+from app.db.services.protocol_application_qualification_service import (
+    ProtocolApplicationQualificationService,
+)
 from app.schemas.application.mapper import map_application_entity_to_dto
+from app.schemas.application.schema import ApplicationCreateDto
+from app.schemas.enums.bulk_item_status import BulkItemStatus
+from app.schemas.enums.count_mode import CountMode
+from app.schemas.filter_query_params.schema import ApplicationFilterQueryParams
 from app.schemas.meta.schema import Page
-from .utils import are_the_same_entity
+from .utils import are_the_same_entity, assert_max_queries
 
 
 def test_add_one_application(
@@ -28,6 +50,35 @@ def test_remove_one_application_by_id(
         application_service.get_one(application.id)
 
 
+def test_remove_one_application_should_delete_its_children_in_one_statement(
+    application: Application, application_service: ApplicationService
+) -> None:
+    # The versions, roles and system types go with the ON DELETE CASCADE, after
+    # one update that bumps the vendor and one that bumps the healthcare
+    # providers using its versions
+    with assert_max_queries(3):
+        application_service.remove_one(application.id)
+
+    with instance(sessionmaker[Session])() as session:
+        for entity in (ApplicationVersion, ApplicationRole, ApplicationType):
+            assert session.scalars(select(entity)).all() == []
+
+
+def test_get_one_with_lock_should_lock_the_application_row(
+    application: Application, application_service: ApplicationService
+) -> None:
+    assert are_the_same_entity(
+        application_service.get_one(application.id, lock=True), application
+    )
+
+    repository = ApplicationRepository(None)  # type: ignore[arg-type]
+    stmt = repository.loaded_statement(
+        repository.loader_options(), lock=True, id=application.id
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))  # type: ignore[no-untyped-call]
+    assert sql.endswith("FOR UPDATE OF applications")
+
+
 def test_remove_one_by_id_application_dont_exist(
     application_service: ApplicationService,
 ) -> None:
@@ -71,3 +122,266 @@ def test_applications_paginated(
         offset=0,
         total=1,
     )
+
+
+@pytest.mark.parametrize("count_mode", list(CountMode))
+def test_applications_paginated_total_per_count_mode(
+    count_mode: CountMode,
+    application: Application,
+    application_service: ApplicationService,
+) -> None:
+    page = application_service.get_paginated(limit=10, offset=0, count_mode=count_mode)
+
+    assert page.total == 1
+    assert page.items == [map_application_entity_to_dto(application)]
+
+
+def test_applications_paginated_without_total(
+    application: Application, application_service: ApplicationService
+) -> None:
+    assert application_service.get_paginated(
+        limit=10, offset=0, count_mode=None
+    ) == Page(
+        items=[map_application_entity_to_dto(application)],
+        limit=10,
+        offset=0,
+        total=None,
+    )
+
+
+def test_applications_paginated_window_total_past_last_page(
+    application: Application, application_service: ApplicationService
+) -> None:
+    page = application_service.get_paginated(
+        limit=10, offset=10, count_mode=CountMode.WINDOW
+    )
+
+    assert page.items == []
+    assert page.total == 1
+
+
+def test_export_applications_yields_every_application(
+    application: Application, application_service: ApplicationService
+) -> None:
+    assert list(application_service.export(batch_size=1)) == [
+        map_application_entity_to_dto(application)
+    ]
+
+
+def test_applications_paginated_with_expand_maps_only_expanded_relationships(
+    application: Application, application_service: ApplicationService
+) -> None:
+    page = application_service.get_paginated(limit=10, offset=0, expand={"versions"})
+
+    assert len(page.items) == 1
+    assert page.items[0].model_fields_set == {
+        "id",
+        "name",
+        "created_at",
+        "modified_at",
+        "versions",
+    }
+    assert page.items[0].versions == map_application_entity_to_dto(application).versions
+
+
+def test_get_one_application_without_expand_skips_relationships(
+    application: Application, application_service: ApplicationService
+) -> None:
+    actual = application_service.get_one(application.id, expand=set())
+
+    assert are_the_same_entity(actual, application)
+    assert "vendor" not in map_application_entity_to_dto(actual, set()).model_fields_set
+
+
+def test_applications_paginated_stays_within_query_budget(
+    application: Application, application_service: ApplicationService
+) -> None:
+    # The page query joins the vendors, the versions, roles and system types are
+    # loaded with one query each, with the roles and system types joined, and one
+    # query counts the total
+    with assert_max_queries(5):
+        application_service.get_paginated(limit=10, offset=0)
+
+
+def test_applications_paginated_without_expand_only_queries_page_and_count(
+    application: Application, application_service: ApplicationService
+) -> None:
+    with assert_max_queries(2):
+        application_service.get_paginated(limit=10, offset=0, expand=set())
+
+
+def test_add_many_applications_should_report_failures_per_item(
+    application: Application,
+    vendor: Vendor,
+    role: Role,
+    system_type: SystemType,
+    application_service: ApplicationService,
+) -> None:
+    def create(
+        name: str, vendor_id: UUID = vendor.id, role: str = role.name
+    ) -> ApplicationCreateDto:
+        return ApplicationCreateDto(
+            vendor_id=vendor_id,
+            name=name,
+            version="v1.0.0",
+            roles=[role],
+            system_types=[system_type.name],
+        )
+
+    applications = [
+        create("first"),
+        create(application.name),
+        create("first"),
+        create("second", vendor_id=UUID("1f5991fd-260d-4bd6-8889-b79e5e98a623")),
+        create("third", role="unknown role"),
+    ]
+
+    results = application_service.add_many(applications)
+
+    assert [result.status for result in results] == [
+        BulkItemStatus.CREATED,
+        BulkItemStatus.CONFLICT,
+        BulkItemStatus.CONFLICT,
+        BulkItemStatus.NOT_FOUND,
+        BulkItemStatus.NOT_FOUND,
+    ]
+    assert results[0].id is not None
+    created = application_service.get_one(results[0].id)
+    assert [version.version for version in created.versions] == ["v1.0.0"]
+    assert [role.role.name for role in created.roles] == [role.name]
+    assert [type.system_type.name for type in created.system_types] == [
+        system_type.name
+    ]
+
+
+def test_add_many_applications_stays_within_query_budget(
+    vendor: Vendor,
+    role: Role,
+    system_type: SystemType,
+    application_service: ApplicationService,
+) -> None:
+    applications = [
+        ApplicationCreateDto(
+            vendor_id=vendor.id,
+            name=f"application {i}",
+            version="v1.0.0",
+            roles=[role.name],
+            system_types=[system_type.name],
+        )
+        for i in range(50)
+    ]
+
+    # The vendors and names are checked once, the roles and system types are
+    # resolved with one query each as the cache is cold, every table is written
+    # with one insert and the vendors are bumped with one update, however many
+    # applications there are
+    with assert_max_queries(9):
+        results = application_service.add_many(applications)
+
+    assert {result.status for result in results} == {BulkItemStatus.CREATED}
+
+
+def test_remove_many_applications_should_report_missing_applications(
+    application: Application, application_service: ApplicationService
+) -> None:
+    missing = UUID("1f5991fd-260d-4bd6-8889-b79e5e98a623")
+
+    results = application_service.remove_many([application.id, missing])
+
+    assert [result.status for result in results] == [
+        BulkItemStatus.DELETED,
+        BulkItemStatus.NOT_FOUND,
+    ]
+    with pytest.raises(ApplicationNotFoundException):
+        application_service.get_one(application.id)
+
+
+@pytest.mark.parametrize("json_pages", [False, True])
+def test_applications_paginated_should_only_return_matching_applications(
+    json_pages: bool,
+    application: Application,
+    vendor: Vendor,
+    role: Role,
+    system_type: SystemType,
+    protocol_version: ProtocolVersion,
+    application_service: ApplicationService,
+    protocol_application_qualification_service: ProtocolApplicationQualificationService,
+) -> None:
+    other = application_service.add_one(
+        vendor_id=vendor.id,
+        application_name="other application",
+        version="v1.0.0",
+        role_names=[],
+        system_type_names=[],
+    )
+    protocol_application_qualification_service.qualify_protocol_version_to_application_version(
+        protocol_version.id, application.versions[0].id, date.today()
+    )
+
+    def matching(filters: ApplicationFilterQueryParams) -> tuple[set[UUID], int | None]:
+        if json_pages:
+            json_page = Page[dict[str, Any]].model_validate_json(
+                application_service.get_paginated_json(
+                    limit=10, offset=0, fields={"id"}, filters=filters
+                )
+            )
+            return {UUID(item["id"]) for item in json_page.items}, json_page.total
+
+        page = application_service.get_paginated(limit=10, offset=0, filters=filters)
+        return {item.id for item in page.items}, page.total
+
+    assert matching(ApplicationFilterQueryParams(vendor_id=vendor.id)) == (
+        {application.id, other.id},
+        2,
+    )
+    assert matching(ApplicationFilterQueryParams(role=role.name)) == (
+        {application.id},
+        1,
+    )
+    assert matching(
+        ApplicationFilterQueryParams(system_type=system_type.name, role=role.name)
+    ) == ({application.id}, 1)
+    assert matching(
+        ApplicationFilterQueryParams(qualified_for=protocol_version.id)
+    ) == (
+        {application.id},
+        1,
+    )
+    assert matching(ApplicationFilterQueryParams(role="unknown role")) == (set(), 0)
+
+    protocol_application_qualification_service.archive_protocol_application_qualification(
+        application.versions[0].id, protocol_version.id
+    )
+    assert matching(
+        ApplicationFilterQueryParams(qualified_for=protocol_version.id)
+    ) == (
+        set(),
+        0,
+    )
+
+
+def test_applications_paginated_should_filter_on_timestamps(
+    application: Application, application_service: ApplicationService
+) -> None:
+    after = ApplicationFilterQueryParams(
+        created_after=application.created_at - timedelta(seconds=1)
+    )
+    before = ApplicationFilterQueryParams(
+        modified_before=application.modified_at - timedelta(seconds=1)
+    )
+
+    assert (
+        application_service.get_paginated(limit=10, offset=0, filters=after).total == 1
+    )
+    assert application_service.get_paginated(
+        limit=10, offset=0, filters=before
+    ) == Page(items=[], limit=10, offset=0, total=0)
+    assert (
+        application_service.get_paginated(
+            limit=10,
+            offset=0,
+            count_mode=CountMode.ESTIMATED,
+            filters=ApplicationFilterQueryParams(created_after=datetime.max),
+        ).total
+        == 0
+    )
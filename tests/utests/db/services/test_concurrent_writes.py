@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Barrier
+from typing import Any, Callable, List, Type
+
+import pytest
+from gfmodules_python_shared.schema.sql_model import SQLModelBase
+from inject import configure, instance
+from sqlalchemy import create_engine
+
+from app.db.entities import Role, SystemType, Vendor
+from app.db.services import (
+    ApplicationService,
+    RoleService,
+    SystemTypeService,
+    VendorService,
+)
+from app.exceptions.app_exceptions import (
+    ApplicationAlreadyExistsException,
+    RoleAlreadyExistsException,
+    SystemTypeAlreadyExistsException,
+    VendorAlreadyExistsException,
+)
+from .utils import bind_services
+
+PARALLEL_REQUESTS = 8
+
+
+@pytest.fixture(autouse=True)
+def container(tmp_path: Path) -> None:
+    # Every thread needs its own connection to the same database, which an
+    # in-memory database cannot offer
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'register.db'}", connect_args={"timeout": 30}
+    )
+    SQLModelBase.metadata.create_all(engine)
+    configure(lambda binder: bind_services(binder, engine), clear=True)
+
+
+def run_in_parallel(create: Callable[[], Any]) -> List[Any]:
+    """
+    Calls `create` from several threads at once and returns what every call
+    returned or raised.
+    """
+    barrier = Barrier(PARALLEL_REQUESTS)
+
+    def call() -> Any:
+        barrier.wait()
+        try:
+            return create()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(PARALLEL_REQUESTS) as executor:
+        futures = [executor.submit(call) for _ in range(PARALLEL_REQUESTS)]
+
+    return [future.result() for future in futures]
+
+
+@pytest.mark.parametrize(
+    "create, exception",
+    [
+        (
+            lambda: instance(VendorService).add_one(
+                kvk_number="12456", trade_name="vendor", statutory_name="vendor bv"
+            ),
+            VendorAlreadyExistsException,
+        ),
+        (
+            lambda: instance(RoleService).add_one(name="role", description=None),
+            RoleAlreadyExistsException,
+        ),
+        (
+            lambda: instance(SystemTypeService).add_one(
+                name="system type", description=None
+            ),
+            SystemTypeAlreadyExistsException,
+        ),
+    ],
+    ids=["vendor", "role", "system_type"],
+)
+def test_parallel_duplicate_creates_should_conflict_instead_of_failing(
+    create: Callable[[], Any], exception: Type[Exception]
+) -> None:
+    results = run_in_parallel(create)
+
+    errors = [result for result in results if isinstance(result, Exception)]
+    assert len(errors) == PARALLEL_REQUESTS - 1
+    assert all(isinstance(error, exception) for error in errors), errors
+
+
+def test_parallel_duplicate_applications_should_conflict_instead_of_failing(
+    vendor: Vendor,
+    role: Role,
+    system_type: SystemType,
+    application_service: ApplicationService,
+) -> None:
+    results = run_in_parallel(
+        lambda: application_service.add_one(
+            vendor_id=vendor.id,
+            application_name="example application",
+            version="v1.0.0",
+            system_type_names=[system_type.name],
+            role_names=[role.name],
+        )
+    )
+
+    errors = [result for result in results if isinstance(result, Exception)]
+    assert len(errors) == PARALLEL_REQUESTS - 1
+    assert all(
+        isinstance(error, ApplicationAlreadyExistsException) for error in errors
+    ), errors
@@ -0,0 +1,75 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.db.entities import Application, Vendor
+from app.db.services import ApplicationService, VendorService
+from app.helpers.responses import dto_list_response, dto_response
+from app.schemas.application.mapper import (
+    map_application_entities_to_dtos,
+    map_application_entity_to_dto,
+)
+from app.schemas.application.schema import ApplicationDto
+from app.schemas.vendor.mapper import (
+    map_vendor_entities_to_dtos,
+    map_vendor_entity_to_dto,
+)
+from app.schemas.vendor.schema import VendorDto
+
+
+def test_batch_mappers_should_match_the_single_mappers(
+    application: Application,
+    application_service: ApplicationService,
+    vendor_service: VendorService,
+) -> None:
+    applications = [application_service.get_one(application.id)]
+    vendors = [vendor_service.get_one(application.vendor_id)]
+
+    assert map_application_entities_to_dtos(applications) == [
+        map_application_entity_to_dto(applications[0])
+    ]
+    assert map_vendor_entities_to_dtos(vendors) == [
+        map_vendor_entity_to_dto(vendors[0])
+    ]
+
+
+def test_batch_mappers_with_expand_should_only_set_expanded_fields(
+    application: Application, application_service: ApplicationService
+) -> None:
+    entity = application_service.get_one(application.id)
+
+    [dto] = map_application_entities_to_dtos([entity], expand={"roles"})
+
+    assert dto == map_application_entity_to_dto(entity, expand={"roles"})
+    assert "vendor" not in dto.model_fields_set
+    assert dto.roles == map_application_entity_to_dto(entity).roles
+
+
+def test_dto_responses_should_match_the_response_model_serialization(
+    application: Application,
+    application_service: ApplicationService,
+    vendor: Vendor,
+) -> None:
+    application_dto = map_application_entity_to_dto(
+        application_service.get_one(application.id)
+    )
+    vendor_dto = map_vendor_entity_to_dto(vendor)
+    api = FastAPI()
+    api.get("/model/vendor", response_model=VendorDto)(lambda: vendor_dto)
+    api.get("/direct/vendor", response_model=VendorDto)(
+        lambda: dto_response(vendor_dto)
+    )
+    api.get("/model/applications", response_model=list[ApplicationDto])(
+        lambda: [application_dto]
+    )
+    api.get("/direct/applications", response_model=list[ApplicationDto])(
+        lambda: dto_list_response([application_dto], ApplicationDto)
+    )
+    client = TestClient(api)
+
+    for path in ("vendor", "applications"):
+        expected = client.get(f"/model/{path}")
+        actual = client.get(f"/direct/{path}")
+
+        assert actual.status_code == 200
+        assert actual.headers["content-type"] == expected.headers["content-type"]
+        assert actual.json() == expected.json()
@@ -1,4 +1,5 @@
 from datetime import date
+from uuid import UUID
 
 import pytest
 
@@ -13,6 +14,7 @@ from app.exceptions.app_exceptions import (
     HealthcareProviderNotQualifiedForProtocolException,
     HealthcareProviderQualificationAlreadyArchivedException,
 )
+from app.schemas.enums.bulk_item_status import BulkItemStatus
 from tests.utests.db.services.utils import are_the_same_entity
 
 
@@ -130,3 +132,61 @@ def test_archive_a_non_qualified_healthcare_provider_should_raise_exception(
             healthcare_provider_id=healthcare_provider.id,
             protocol_version_id=protocol_version.id,
         )
+
+
+def test_qualify_and_archive_healthcare_providers_should_report_results_per_item(
+    healthcare_provider_qualification_service: HealthcareProviderQualificationService,
+    healthcare_provider_service: HealthcareProviderService,
+    protocol_version_service: ProtocolVersionService,
+    protocol: Protocol,
+    healthcare_provider: HealthcareProvider,
+) -> None:
+    service = healthcare_provider_qualification_service
+    protocol_version = protocol_version_service.add_one(
+        protocol_id=protocol.id, version="next", description="next"
+    )
+    missing = UUID("c8f4dd3e-a6ce-4d33-8e6a-9c3b3f1a8a84")
+
+    qualified = service.qualify_healthcare_providers(
+        protocol_version.id, [healthcare_provider.id, missing], date.today()
+    )
+    archived = service.archive_healthcare_providers(
+        protocol_version.id, [healthcare_provider.id, healthcare_provider.id]
+    )
+
+    assert [result.status for result in qualified] == [
+        BulkItemStatus.CREATED,
+        BulkItemStatus.NOT_FOUND,
+    ]
+    assert [result.status for result in archived] == [
+        BulkItemStatus.ARCHIVED,
+        BulkItemStatus.CONFLICT,
+    ]
+    assert {
+        qualification.protocol_version_id: qualification.archived_date is not None
+        for qualification in healthcare_provider_service.get_one(
+            healthcare_provider.id
+        ).qualified_protocols
+    } == {
+        healthcare_provider.qualified_protocols[0].protocol_version_id: False,
+        protocol_version.id: True,
+    }
+
+
+def test_archive_all_healthcare_providers_of_a_protocol_version(
+    healthcare_provider_qualification_service: HealthcareProviderQualificationService,
+    protocol_version: ProtocolVersion,
+    healthcare_provider: HealthcareProvider,
+) -> None:
+    results = healthcare_provider_qualification_service.archive_healthcare_providers(
+        protocol_version.id
+    )
+
+    assert [(result.status, result.id) for result in results] == [
+        (BulkItemStatus.ARCHIVED, healthcare_provider.id)
+    ]
+    with pytest.raises(HealthcareProviderQualificationAlreadyArchivedException):
+        healthcare_provider_qualification_service.archive_healthcare_provider_qualification(
+            healthcare_provider_id=healthcare_provider.id,
+            protocol_version_id=protocol_version.id,
+        )
@@ -2,16 +2,25 @@ from uuid import UUID
 
 import pytest
 
-from app.db.entities import HealthcareProvider, ProtocolVersion
+from app.db.entities import Application, HealthcareProvider, ProtocolVersion
 from app.db.services import (
     HealthcareProviderService,
 )
+from app.db.services.healthcare_provider_application_version_service import (
+    HealthcareProviderApplicationVersionService,
+)
+from app.db.services.protocol_version_service import ProtocolVersionService
 from app.exceptions.app_exceptions import (
     AGBCodeAlreadyExists,
     HealthcareProviderNotFoundException,
     URACodeAlreadyExists,
 )
+from app.schemas.enums.bulk_item_status import BulkItemStatus
+from app.schemas.filter_query_params.schema import (
+    HealthcareProviderFilterQueryParams,
+)
 from app.schemas.healthcare_provider.mapper import map_healthcare_provider_entity_to_dto
+from app.schemas.healthcare_provider.schema import HealthcareProviderCreateDto
 from app.schemas.meta.schema import Page
 from tests.utests.db.services.utils import are_the_same_entity
 
@@ -101,3 +110,110 @@ def test_get_paginated_healthcare_providers(
         items=[map_healthcare_provider_entity_to_dto(healthcare_provider)],
         total=1,
     )
+
+
+def test_get_paginated_healthcare_providers_should_only_return_matching_providers(
+    healthcare_provider: HealthcareProvider,
+    application: Application,
+    protocol_version: ProtocolVersion,
+    healthcare_provider_service: HealthcareProviderService,
+    healthcare_provider_application_version_service: HealthcareProviderApplicationVersionService,
+    protocol_version_service: ProtocolVersionService,
+) -> None:
+    other_version = protocol_version_service.add_one(
+        protocol_id=protocol_version.protocol_id, version="other", description="other"
+    )
+    other = healthcare_provider_service.add_one(
+        ura_code="other",
+        agb_code="other",
+        trade_name="other",
+        statutory_name="other",
+        protocol_version_id=other_version.id,
+    )
+    application_version_id = application.versions[0].id
+    healthcare_provider_application_version_service.assign_application_version_to_healthcare_provider(
+        healthcare_provider.id, application_version_id
+    )
+
+    def matching(filters: HealthcareProviderFilterQueryParams) -> list[UUID]:
+        page = healthcare_provider_service.get_paginated(
+            limit=10, offset=0, filters=filters
+        )
+        assert page.total == len(page.items)
+        return [item.id for item in page.items]
+
+    assert matching(
+        HealthcareProviderFilterQueryParams(
+            application_version_id=application_version_id
+        )
+    ) == [healthcare_provider.id]
+    assert matching(
+        HealthcareProviderFilterQueryParams(qualified_for=protocol_version.id)
+    ) == [healthcare_provider.id]
+    assert matching(
+        HealthcareProviderFilterQueryParams(qualified_for=other_version.id)
+    ) == [other.id]
+    assert (
+        matching(
+            HealthcareProviderFilterQueryParams(
+                application_version_id=application_version_id,
+                qualified_for=other_version.id,
+            )
+        )
+        == []
+    )
+
+
+def test_add_many_healthcare_providers_should_report_failures_per_item(
+    healthcare_provider: HealthcareProvider,
+    healthcare_provider_service: HealthcareProviderService,
+    protocol_version: ProtocolVersion,
+) -> None:
+    def create(
+        code: str, protocol_version_id: UUID = protocol_version.id
+    ) -> HealthcareProviderCreateDto:
+        return HealthcareProviderCreateDto(
+            ura_code=code,
+            agb_code=code,
+            trade_name=code,
+            statutory_name=code,
+            protocol_version_id=protocol_version_id,
+        )
+
+    providers = [
+        create("first"),
+        create(healthcare_provider.ura_code),
+        create("first"),
+        create("second", UUID("c8f4dd3e-a6ce-4d33-8e6a-9c3b3f1a8a84")),
+    ]
+
+    results = healthcare_provider_service.add_many(providers)
+
+    assert [result.status for result in results] == [
+        BulkItemStatus.CREATED,
+        BulkItemStatus.CONFLICT,
+        BulkItemStatus.CONFLICT,
+        BulkItemStatus.NOT_FOUND,
+    ]
+    assert results[0].id is not None
+    created = healthcare_provider_service.get_one(results[0].id)
+    assert [
+        qualification.protocol_version_id
+        for qualification in created.qualified_protocols
+    ] == [protocol_version.id]
+
+
+def test_remove_many_healthcare_providers_should_report_missing_providers(
+    healthcare_provider: HealthcareProvider,
+    healthcare_provider_service: HealthcareProviderService,
+) -> None:
+    missing = UUID("c8f4dd3e-a6ce-4d33-8e6a-9c3b3f1a8a84")
+
+    results = healthcare_provider_service.remove_many([healthcare_provider.id, missing])
+
+    assert [result.status for result in results] == [
+        BulkItemStatus.DELETED,
+        BulkItemStatus.NOT_FOUND,
+    ]
+    with pytest.raises(HealthcareProviderNotFoundException):
+        healthcare_provider_service.get_one(healthcare_provider.id)
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.entities import Application
+from app.db.repository import ApplicationRepository, VendorRepository
+from app.db.services import ApplicationService, VendorService
+from app.schemas.application.schema import ApplicationDto
+from app.schemas.enums.count_mode import CountMode
+from app.schemas.meta.schema import Page
+from app.schemas.vendor.schema import VendorDto
+from .utils import assert_max_queries
+
+
+@pytest.mark.parametrize("count_mode", [CountMode.EXACT, CountMode.WINDOW, None])
+def test_vendors_json_page_should_match_the_dto_page(
+    application: Application, vendor_service: VendorService, count_mode: CountMode
+) -> None:
+    vendor_service.add_one(
+        kvk_number="99999", trade_name="other vendor", statutory_name="other bv"
+    )
+
+    first = vendor_service.get_paginated(limit=1, offset=0, count_mode=count_mode)
+    actual = vendor_service.get_paginated_json(limit=1, offset=0, count_mode=count_mode)
+    assert Page[VendorDto].model_validate_json(actual) == first
+
+    cursor = first.next_cursor
+    assert cursor is not None
+    assert Page[VendorDto].model_validate_json(
+        vendor_service.get_paginated_json(limit=1, offset=0, cursor=cursor)
+    ) == vendor_service.get_paginated(limit=1, offset=0, cursor=cursor)
+
+
+def test_applications_json_page_should_match_the_dto_page(
+    application: Application, application_service: ApplicationService
+) -> None:
+    expected = application_service.get_paginated(limit=10, offset=0)
+
+    actual = application_service.get_paginated_json(limit=10, offset=0)
+
+    assert Page[ApplicationDto].model_validate_json(actual) == expected
+    assert expected.items[0].roles and expected.items[0].system_types
+
+
+def test_json_page_should_only_render_selected_fields(
+    application: Application, application_service: ApplicationService
+) -> None:
+    with assert_max_queries(2):
+        actual = application_service.get_paginated_json(
+            limit=10, offset=0, fields={"name", "vendor"}
+        )
+
+    [item] = Page[dict].model_validate_json(actual).items  # type: ignore[type-arg]
+    assert item == {
+        "name": application.name,
+        "vendor": {
+            "id": item["vendor"]["id"],
+            "tradeName": application.vendor.trade_name,
+            "statutoryName": application.vendor.statutory_name,
+            "kvkNumber": application.vendor.kvk_number,
+        },
+    }
+
+
+def test_json_items_should_compile_for_postgresql() -> None:
+    dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+    for repository in (VendorRepository, ApplicationRepository):
+        sql = str(repository(None).json_item(None).compile(dialect=dialect))  # type: ignore[arg-type]
+
+        assert sql.startswith("json_build_object('")
+        assert "coalesce(json_agg(json_build_object(" in sql
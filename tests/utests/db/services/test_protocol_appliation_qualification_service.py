@@ -1,4 +1,5 @@
 from datetime import date
+from uuid import UUID
 
 import pytest
 
@@ -12,7 +13,9 @@ from app.exceptions.app_exceptions import (
     AppVersionAlreadyQualifiedException,
 )
 
-from .utils import are_the_same_entity
+from app.schemas.enums.bulk_item_status import BulkItemStatus
+
+from .utils import are_the_same_entity, assert_max_queries
 
 
 def test_qualify_protocol_version_to_application_version(
@@ -119,3 +122,69 @@ def test_archive_an_already_archived_app_should_raise_exception(
             protocol_version_id=protocol_version.id,
             application_version_id=application_version.id,
         )
+
+
+def test_qualify_and_archive_application_versions_should_report_results_per_item(
+    application: Application,
+    protocol_version: ProtocolVersion,
+    protocol_application_qualification_service: ProtocolApplicationQualificationService,
+) -> None:
+    service = protocol_application_qualification_service
+    version_id = application.versions[0].id
+    missing = UUID("1f5991fd-260d-4bd6-8889-b79e5e98a623")
+
+    # The protocol version and the versions are checked, and the versions that are
+    # new are qualified with one insert
+    with assert_max_queries(4):
+        qualified = service.qualify_application_versions(
+            protocol_version.id, [version_id, missing, version_id], date.today()
+        )
+    archived = service.archive_application_versions(
+        protocol_version.id, [version_id, missing]
+    )
+
+    assert [result.status for result in qualified] == [
+        BulkItemStatus.CREATED,
+        BulkItemStatus.NOT_FOUND,
+        BulkItemStatus.CONFLICT,
+    ]
+    assert [result.status for result in archived] == [
+        BulkItemStatus.ARCHIVED,
+        BulkItemStatus.NOT_FOUND,
+    ]
+    assert archived[1].detail == "Application version is not qualified for the protocol"
+    assert [
+        result.detail
+        for result in service.qualify_application_versions(
+            protocol_version.id, [version_id], date.today()
+        )
+        + service.archive_application_versions(protocol_version.id, [version_id])
+    ] == ["Application Version is already archived for protocol"] * 2
+
+
+def test_archive_all_application_versions_of_a_protocol_version(
+    application: Application,
+    protocol: Protocol,
+    protocol_version: ProtocolVersion,
+    protocol_version_service: ProtocolVersionService,
+    protocol_application_qualification_service: ProtocolApplicationQualificationService,
+) -> None:
+    version_id = application.versions[0].id
+    protocol_application_qualification_service.qualify_application_versions(
+        protocol_version.id, [version_id], date.today()
+    )
+
+    results = protocol_application_qualification_service.archive_application_versions(
+        protocol_version.id
+    )
+
+    assert [(result.status, result.id) for result in results] == [
+        (BulkItemStatus.ARCHIVED, version_id)
+    ]
+    actual_protocol_version = protocol_version_service.get_one(
+        protocol_id=protocol.id, version_id=protocol_version.id
+    )
+    assert (
+        actual_protocol_version.qualified_application_versions[0].archived_date
+        is not None
+    )
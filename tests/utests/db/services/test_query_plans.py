@@ -0,0 +1,109 @@
+import inject
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.entities import Application, Role, SystemType, Vendor
+from app.db.entities.healthcare_provider import HealthcareProvider
+from app.db.entities.protocol_version import ProtocolVersion
+from app.db.services import (
+    ApplicationService,
+    HealthcareProviderService,
+    RoleService,
+    SystemTypeService,
+    VendorService,
+)
+from app.db.services.protocol_version_service import ProtocolVersionService
+from app.schemas.filter_query_params.schema import (
+    ApplicationFilterQueryParams,
+    HealthcareProviderFilterQueryParams,
+)
+from tests.utests.db.services.utils import assert_no_full_scans
+
+
+def test_full_scan_should_fail_the_plan_check() -> None:
+    session_factory = inject.instance(sessionmaker[Session])
+    with pytest.raises(AssertionError, match="SCAN protocols"):
+        with assert_no_full_scans(), session_factory() as session:
+            session.execute(text("SELECT * FROM protocols WHERE name = 'example'"))
+
+
+def test_paginated_queries_should_use_indexes(
+    application: Application,
+    healthcare_provider: HealthcareProvider,
+    application_service: ApplicationService,
+    vendor_service: VendorService,
+    healthcare_provider_service: HealthcareProviderService,
+) -> None:
+    with assert_no_full_scans():
+        first_page = application_service.get_paginated(limit=1, offset=0)
+        application_service.get_paginated(
+            limit=1, offset=0, cursor=first_page.next_cursor
+        )
+        vendor_service.get_paginated(limit=10, offset=0)
+        healthcare_provider_service.get_paginated(limit=10, offset=0)
+
+
+def test_filtered_pages_should_use_indexes(
+    application: Application,
+    role: Role,
+    system_type: SystemType,
+    protocol_version: ProtocolVersion,
+    healthcare_provider: HealthcareProvider,
+    application_service: ApplicationService,
+    healthcare_provider_service: HealthcareProviderService,
+) -> None:
+    with assert_no_full_scans():
+        application_service.get_paginated(
+            limit=10,
+            offset=0,
+            filters=ApplicationFilterQueryParams(
+                vendor_id=application.vendor_id,
+                role=role.name,
+                system_type=system_type.name,
+                qualified_for=protocol_version.id,
+            ),
+        )
+        application_service.get_paginated(
+            limit=10,
+            offset=0,
+            filters=ApplicationFilterQueryParams(role=role.name),
+        )
+        healthcare_provider_service.get_paginated(
+            limit=10,
+            offset=0,
+            filters=HealthcareProviderFilterQueryParams(
+                application_version_id=application.versions[0].id,
+                qualified_for=protocol_version.id,
+            ),
+        )
+
+
+def test_lookups_by_foreign_key_should_use_indexes(
+    application: Application,
+    vendor: Vendor,
+    role: Role,
+    system_type: SystemType,
+    protocol_version: ProtocolVersion,
+    healthcare_provider: HealthcareProvider,
+    application_service: ApplicationService,
+    vendor_service: VendorService,
+    role_service: RoleService,
+    system_type_service: SystemTypeService,
+    protocol_version_service: ProtocolVersionService,
+) -> None:
+    with assert_no_full_scans():
+        application_service.get_by_vendor_id(vendor_id=vendor.id)
+        vendor_service.get_one(vendor.id)
+        role_service.get_one(role.id)
+        system_type_service.get_one(system_type.id)
+        protocol_version_service.get_one(
+            protocol_version.protocol_id, protocol_version.id
+        )
+
+
+def test_removing_an_application_should_use_indexes(
+    application: Application, application_service: ApplicationService
+) -> None:
+    with assert_no_full_scans():
+        application_service.remove_one(application.id)
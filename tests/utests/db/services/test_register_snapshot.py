@@ -0,0 +1,150 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from gfmodules_python_shared.schema.sql_model import SQLModelBase
+from inject import configure, instance
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.entities import Application, Vendor
+from app.db.entities.healthcare_provider import HealthcareProvider
+from app.db.entities.protocol_version import ProtocolVersion
+from app.db.services import (
+    ApplicationService,
+    HealthcareProviderService,
+    VendorService,
+)
+from app.exceptions.app_exceptions import SnapshotUnavailableException
+from app.routers.v1.snapshot_router import router
+from app.schemas.application.mapper import map_application_entity_to_dto
+from app.schemas.healthcare_provider.mapper import map_healthcare_provider_entity_to_dto
+from app.schemas.protocol.mapper import map_protocol_version_entity_to_dto
+from app.schemas.vendor.mapper import map_vendor_entity_to_dto
+from app.snapshot.refresher import SnapshotRefresher, get_register_snapshot
+from app.snapshot.register import RegisterSnapshot
+from .utils import bind_services
+
+
+@pytest.fixture(autouse=True)
+def container(tmp_path: Path) -> None:
+    # The refresher loads snapshots in a worker thread, which would get a database
+    # of its own from an in-memory engine
+    engine = create_engine(f"sqlite:///{tmp_path / 'register.db'}")
+    SQLModelBase.metadata.create_all(engine)
+    configure(lambda binder: bind_services(binder, engine), clear=True)
+
+
+@pytest.fixture
+def refresher() -> SnapshotRefresher:
+    return SnapshotRefresher(instance(sessionmaker[Session]), refresh_seconds=60)
+
+
+def create_client(snapshot: RegisterSnapshot) -> TestClient:
+    api = FastAPI()
+    api.include_router(router)
+    api.dependency_overrides[get_register_snapshot] = lambda: snapshot
+    return TestClient(api)
+
+
+def test_snapshot_should_index_entities_by_id_and_natural_keys(
+    application: Application,
+    healthcare_provider: HealthcareProvider,
+    protocol_version: ProtocolVersion,
+    application_service: ApplicationService,
+    healthcare_provider_service: HealthcareProviderService,
+    vendor_service: VendorService,
+    refresher: SnapshotRefresher,
+) -> None:
+    snapshot = refresher.reload()
+    vendor = map_vendor_entity_to_dto(vendor_service.get_one(application.vendor_id))
+    provider = map_healthcare_provider_entity_to_dto(
+        healthcare_provider_service.get_one(healthcare_provider.id)
+    )
+
+    assert snapshot.vendors.get(vendor.id) == vendor
+    assert snapshot.vendors_by_kvk_number[vendor.kvk_number] == vendor
+    assert snapshot.applications_by_vendor[vendor.id] == (
+        map_application_entity_to_dto(application_service.get_one(application.id)),
+    )
+    assert snapshot.protocol_versions[
+        (protocol_version.protocol_id, protocol_version.id)
+    ] == map_protocol_version_entity_to_dto(protocol_version)
+    assert snapshot.healthcare_providers_by_ura_code[provider.ura_code] == provider
+    assert snapshot.healthcare_providers_by_agb_code[provider.agb_code] == provider
+
+
+def test_snapshot_pages_should_match_the_database_pages(
+    vendor_service: VendorService, refresher: SnapshotRefresher
+) -> None:
+    for number in range(5):
+        vendor_service.add_one(
+            kvk_number=f"kvk {number}",
+            trade_name=f"vendor {number}",
+            statutory_name=f"vendor {number} bv",
+        )
+    snapshot = refresher.reload()
+
+    first = snapshot.vendors.page(limit=2)
+    assert first == vendor_service.get_paginated(limit=2, offset=0)
+    assert first.next_cursor is not None
+
+    second = snapshot.vendors.page(limit=2, cursor=first.next_cursor)
+    assert second == vendor_service.get_paginated(
+        limit=2, offset=0, cursor=first.next_cursor
+    )
+    assert snapshot.vendors.page(limit=2, offset=2).items == second.items
+
+    last = snapshot.vendors.page(limit=2, offset=4, include_total=False)
+    assert len(last.items) == 1
+    assert last.next_cursor is None
+    assert last.total is None
+
+
+def test_snapshot_routes_should_serve_the_snapshot(
+    vendor: Vendor, refresher: SnapshotRefresher
+) -> None:
+    client = create_client(refresher.reload())
+
+    response = client.get(f"/vendors/{vendor.id}", params={"fields": "tradeName"})
+    assert response.status_code == 200
+    assert response.json() == {"tradeName": vendor.trade_name}
+
+    response = client.get(f"/vendors/kvk_number/{vendor.kvk_number}")
+    assert response.json()["id"] == str(vendor.id)
+
+    response = client.get("/vendors/2c907623-a8e7-4bdd-8fd5-3eb3feb16d35")
+    assert response.status_code == 404
+
+
+def test_snapshot_should_be_unavailable_until_loaded(
+    refresher: SnapshotRefresher,
+) -> None:
+    with pytest.raises(SnapshotUnavailableException):
+        refresher.snapshot
+
+
+def test_refresher_should_reload_when_changed(
+    vendor_service: VendorService, refresher: SnapshotRefresher
+) -> None:
+    async def add_vendor_and_wait_for_reload() -> int:
+        await refresher.start()
+        try:
+            assert len(refresher.snapshot.vendors) == 0
+            vendor_service.add_one(
+                kvk_number="12456",
+                trade_name="example vendor",
+                statutory_name="example vendor bv",
+            )
+            refresher.changed()
+            for _ in range(100):
+                if len(refresher.snapshot.vendors) > 0:
+                    break
+                await asyncio.sleep(0.01)
+            return len(refresher.snapshot.vendors)
+        finally:
+            await refresher.stop()
+
+    assert asyncio.run(add_vendor_and_wait_for_reload()) == 1
@@ -6,7 +6,7 @@ from app.exceptions.app_exceptions import RoleNotFoundException
 from app.schemas.meta.schema import Page
 from app.schemas.roles.mapper import map_role_model_to_dto
 
-from .utils import are_the_same_entity
+from .utils import are_the_same_entity, assert_max_queries
 
 
 def test_create_role(role_service: RoleService) -> None:
@@ -54,3 +54,20 @@ def test_get_paginated_roles(role: Role, role_service: RoleService) -> None:
         offset=0,
         total=1,
     )
+
+
+def test_resolve_names_should_be_cached(role: Role, role_service: RoleService) -> None:
+    expected = role_service.resolve_names([role.name])
+
+    with assert_max_queries(0):
+        assert role_service.resolve_names([role.name]) == expected
+
+
+def test_adding_a_role_should_invalidate_cached_pages(
+    role: Role, role_service: RoleService
+) -> None:
+    assert role_service.get_paginated(limit=10, offset=0).total == 1
+
+    role_service.add_one(name="another role", description="some description")
+
+    assert role_service.get_paginated(limit=10, offset=0).total == 2
@@ -0,0 +1,113 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.entities import ProtocolVersion, Vendor
+from app.db.repository import (
+    ApplicationRepository,
+    HealthcareProviderRepository,
+    VendorRepository,
+)
+from app.db.services import (
+    ApplicationService,
+    HealthcareProviderService,
+    SearchService,
+    VendorService,
+)
+from app.exceptions.app_exceptions import InvalidCursorException
+from app.schemas.enums.search_hit_type import SearchHitType
+from app.schemas.search.schema import SearchHitDto
+from .utils import assert_max_queries
+
+
+@pytest.fixture
+def acme(
+    protocol_version: ProtocolVersion,
+    vendor_service: VendorService,
+    application_service: ApplicationService,
+    healthcare_provider_service: HealthcareProviderService,
+) -> list[SearchHitDto]:
+    """
+    Registers a vendor, an application and a healthcare provider with "acme" in
+    their names, and returns their hits in the order they rank for "acme".
+    """
+    vendor = vendor_service.add_one(
+        kvk_number="11112222", trade_name="Acme Health", statutory_name="Acme bv"
+    )
+    application = application_service.add_one(
+        vendor_id=vendor.id,
+        application_name="Acme Portal",
+        version="v1.0.0",
+        role_names=[],
+        system_type_names=[],
+    )
+    provider = healthcare_provider_service.add_one(
+        ura_code="00001234",
+        agb_code="00005678",
+        trade_name="Zorg Acme",
+        statutory_name="Zorg bv",
+        protocol_version_id=protocol_version.id,
+    )
+    return [
+        SearchHitDto(type=SearchHitType.VENDOR, id=vendor.id, name="Acme Health"),
+        SearchHitDto(
+            type=SearchHitType.APPLICATION, id=application.id, name="Acme Portal"
+        ),
+        SearchHitDto(
+            type=SearchHitType.HEALTHCARE_PROVIDER, id=provider.id, name="Zorg Acme"
+        ),
+    ]
+
+
+def test_search_should_rank_prefix_matches_before_other_matches(
+    acme: list[SearchHitDto], vendor: Vendor, search_service: SearchService
+) -> None:
+    with assert_max_queries(1):
+        page = search_service.search("ACME", limit=10)
+
+    assert page.items == acme
+    assert page.next_cursor is None
+
+
+def test_search_should_rank_exact_codes_first(
+    acme: list[SearchHitDto], search_service: SearchService
+) -> None:
+    assert search_service.search("00001234", limit=10).items == [acme[2]]
+    assert search_service.search("1111", limit=10).items == [acme[0]]
+
+
+def test_search_with_cursor_should_return_every_hit_once(
+    acme: list[SearchHitDto], search_service: SearchService
+) -> None:
+    page = search_service.search("acme", limit=2)
+    seen = list(page.items)
+    while page.next_cursor is not None:
+        page = search_service.search("acme", limit=2, cursor=page.next_cursor)
+        seen.extend(page.items)
+
+    assert seen == acme
+
+
+def test_search_should_match_wildcards_literally(
+    acme: list[SearchHitDto], search_service: SearchService
+) -> None:
+    assert search_service.search("a_me", limit=10).items == []
+    assert search_service.search("%", limit=10).items == []
+
+
+def test_search_with_invalid_cursor_should_raise(
+    search_service: SearchService,
+) -> None:
+    with pytest.raises(InvalidCursorException, match="400: Invalid pagination cursor"):
+        search_service.search("acme", limit=2, cursor="not-a-cursor")
+
+
+def test_search_statements_should_match_with_ilike_on_postgresql() -> None:
+    dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+    for repository in (
+        VendorRepository,
+        ApplicationRepository,
+        HealthcareProviderRepository,
+    ):
+        sql = str(repository(None).search_statement("acme").compile(dialect=dialect))  # type: ignore[arg-type]
+
+        assert " ILIKE " in sql
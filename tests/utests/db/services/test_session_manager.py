@@ -0,0 +1,17 @@
+import inject
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.entities import Vendor
+from app.db.services import VendorService
+from app.db.session_manager import use_session
+
+
+def test_service_calls_inside_use_session_share_the_session(
+    vendor: Vendor, vendor_service: VendorService
+) -> None:
+    session_factory = inject.instance(sessionmaker[Session])
+    with session_factory() as session, use_session(session):
+        actual_vendor = vendor_service.get_one(vendor.id)
+
+        assert actual_vendor in session
+        assert vendor_service.get_one_by_kvk_number(vendor.kvk_number) is actual_vendor
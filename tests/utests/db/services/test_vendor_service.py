@@ -1,3 +1,4 @@
+from datetime import timedelta
 from uuid import UUID
 
 import pytest
@@ -6,12 +7,16 @@ from app.db.entities import Application
 from app.db.entities import Vendor
 from app.db.services import VendorService
 from app.exceptions.app_exceptions import (
+    InvalidCursorException,
     VendorCannotBeDeletedException,
     VendorNotFoundException,
 )
+from app.schemas.enums.bulk_item_status import BulkItemStatus
+from app.schemas.filter_query_params.schema import TimestampFilterQueryParams
 from app.schemas.meta.schema import Page
 from app.schemas.vendor.mapper import map_vendor_entity_to_dto
-from .utils import are_the_same_entity
+from app.schemas.vendor.schema import VendorCreateDto
+from .utils import are_the_same_entity, assert_max_queries
 
 
 def test_add_one_should_succeed(vendor_service: VendorService) -> None:
@@ -56,6 +61,66 @@ def test_get_vendors_paginated_should_succeed(
     )
 
 
+def test_get_vendors_paginated_without_expand_should_leave_out_applications(
+    vendor: Vendor, vendor_service: VendorService
+) -> None:
+    page = vendor_service.get_paginated(limit=10, offset=0, expand=set())
+
+    assert len(page.items) == 1
+    assert "applications" not in page.items[0].model_fields_set
+    assert page.items[0].model_dump(exclude_unset=True) == {
+        "id": vendor.id,
+        "kvk_number": vendor.kvk_number,
+        "trade_name": vendor.trade_name,
+        "statutory_name": vendor.statutory_name,
+    }
+
+
+def test_get_vendors_paginated_should_filter_on_timestamps(
+    vendor: Vendor, vendor_service: VendorService
+) -> None:
+    second = timedelta(seconds=1)
+    within = TimestampFilterQueryParams(
+        created_after=vendor.created_at - second,
+        created_before=vendor.created_at + second,
+    )
+    modified_later = TimestampFilterQueryParams(modified_after=vendor.modified_at)
+
+    assert vendor_service.get_paginated(limit=10, offset=0, filters=within).total == 1
+    assert vendor_service.get_paginated(
+        limit=10, offset=0, filters=modified_later
+    ) == Page(items=[], limit=10, offset=0, total=0)
+
+
+def test_get_vendors_with_cursor_should_return_every_vendor_once(
+    vendor_service: VendorService,
+) -> None:
+    vendors = [
+        vendor_service.add_one(
+            kvk_number=f"1245{i}",
+            trade_name=f"example vendor {i}",
+            statutory_name=f"example vendor {i} bv",
+        )
+        for i in range(5)
+    ]
+
+    page = vendor_service.get_paginated(limit=2, offset=0)
+    seen = [item.id for item in page.items]
+    while page.next_cursor is not None:
+        page = vendor_service.get_paginated(limit=2, offset=0, cursor=page.next_cursor)
+        seen.extend(item.id for item in page.items)
+
+    assert len(seen) == len(vendors)
+    assert set(seen) == {vendor.id for vendor in vendors}
+
+
+def test_get_vendors_with_invalid_cursor_should_raise(
+    vendor_service: VendorService,
+) -> None:
+    with pytest.raises(InvalidCursorException, match="400: Invalid pagination cursor"):
+        vendor_service.get_paginated(limit=2, offset=0, cursor="not-a-cursor")
+
+
 def test_delete_one_should_raise_exception_when_vendor_has_applications(
     vendor: Vendor,
     application: Application,
@@ -65,3 +130,70 @@ def test_delete_one_should_raise_exception_when_vendor_has_applications(
         VendorCannotBeDeletedException, match="405: Vendor cannot be deleted"
     ):
         vendor_service.remove_one(vendor_id=vendor.id)
+
+
+def test_delete_one_should_check_for_applications_without_loading_them(
+    vendor: Vendor,
+    application: Application,
+    vendor_service: VendorService,
+) -> None:
+    with assert_max_queries(1) as stats:
+        with pytest.raises(VendorCannotBeDeletedException):
+            vendor_service.remove_one(vendor_id=vendor.id)
+
+    [statement] = stats.executed
+    assert "EXISTS" in statement
+
+
+def test_export_vendors_yields_every_vendor(
+    vendor: Vendor, application: Application, vendor_service: VendorService
+) -> None:
+    assert list(vendor_service.export()) == [
+        map_vendor_entity_to_dto(vendor_service.get_one(vendor.id))
+    ]
+
+
+def test_add_many_should_report_conflicts_per_item(
+    vendor: Vendor, vendor_service: VendorService
+) -> None:
+    vendors = [
+        VendorCreateDto(kvk_number=f"9999{i}", trade_name=name, statutory_name=name)
+        for i, name in enumerate(["first", vendor.trade_name, "first", "second"])
+    ]
+
+    # One query for the taken names and one insert for the whole batch
+    with assert_max_queries(2):
+        results = vendor_service.add_many(vendors)
+
+    assert [result.status for result in results] == [
+        BulkItemStatus.CREATED,
+        BulkItemStatus.CONFLICT,
+        BulkItemStatus.CONFLICT,
+        BulkItemStatus.CREATED,
+    ]
+    assert results[1].detail == "Vendor already exists"
+    assert results[3].id is not None
+    assert vendor_service.get_one(results[3].id).trade_name == "second"
+
+
+def test_remove_many_should_report_missing_vendors_and_keep_vendors_in_use(
+    vendor: Vendor, application: Application, vendor_service: VendorService
+) -> None:
+    other = vendor_service.add_one(
+        kvk_number="99999", trade_name="other", statutory_name="other bv"
+    )
+    missing = UUID("2c907623-a8e7-4bdd-8fd5-3eb3feb16d35")
+    # Adding the application bumped the vendor
+    kept = vendor_service.get_one(vendor.id)
+
+    results = vendor_service.remove_many([other.id, missing, vendor.id])
+
+    assert [result.status for result in results] == [
+        BulkItemStatus.DELETED,
+        BulkItemStatus.NOT_FOUND,
+        BulkItemStatus.CONFLICT,
+    ]
+    assert [result.id for result in results] == [other.id, missing, vendor.id]
+    with pytest.raises(VendorNotFoundException):
+        vendor_service.get_one(other.id)
+    assert are_the_same_entity(vendor_service.get_one(vendor.id), kept)
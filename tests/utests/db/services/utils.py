@@ -1,10 +1,13 @@
+from contextlib import contextmanager
 from enum import StrEnum, auto
 import re
-from typing import Type
+from typing import Any, Iterator, Type
 from gfmodules_python_shared.schema.sql_model import SQLModelBase, TSQLModel
 from inject import Binder, instance
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
+
+from app.metrics.database import QueryStats, instrument_engine, track_queries
 from app.db.services import (
     Service,
     ApplicationRolesService,
@@ -18,25 +21,48 @@ from app.db.services import (
     ProtocolService,
     ProtocolVersionService,
     RoleService,
+    SearchService,
     SystemTypeService,
     VendorService,
 )
 
 
 def container_config(binder: Binder) -> None:
-    application_service = ApplicationService()
-    healthcare_provider_service = HealthcareProviderService()
-    protocol_service = ProtocolService()
     engine = create_engine(
         "sqlite:///:memory:", echo=False, pool_recycle=25, pool_size=10
     )
+    enforce_foreign_keys(engine)
     SQLModelBase.metadata.create_all(engine)
+    instrument_engine(engine, "test")
+    bind_services(binder, engine)
+
+
+def enforce_foreign_keys(engine: Engine) -> None:
+    """
+    SQLite only checks foreign keys, and applies their ON DELETE CASCADE, when they
+    are switched on for the connection.
+    """
+
+    def switch_on(connection: Any, record: Any) -> None:
+        connection.execute("PRAGMA foreign_keys=ON")
+
+    event.listen(engine, "connect", switch_on)
+
+
+def bind_services(binder: Binder, engine: Engine) -> None:
+    role_service = RoleService()
+    system_type_service = SystemTypeService()
+    application_service = ApplicationService(
+        role_service=role_service, system_type_service=system_type_service
+    )
+    healthcare_provider_service = HealthcareProviderService()
+    protocol_service = ProtocolService()
 
     (
         binder.bind(sessionmaker[Session], sessionmaker(engine))
         .bind(VendorService, VendorService())
-        .bind(RoleService, RoleService())
-        .bind(SystemTypeService, SystemTypeService())
+        .bind(RoleService, role_service)
+        .bind(SystemTypeService, system_type_service)
         .bind(ApplicationService, application_service)
         .bind(ApplicationTypeService, ApplicationTypeService())
         .bind(ProtocolService, protocol_service)
@@ -67,6 +93,7 @@ def container_config(binder: Binder) -> None:
             HealthcareProviderQualificationService,
             HealthcareProviderQualificationService(),
         )
+        .bind(SearchService, SearchService())
     )
 
 
@@ -82,6 +109,7 @@ class Services(StrEnum):
     PROTOCOL = auto()
     PROTOCOL_VERSION = auto()
     ROLE = auto()
+    SEARCH = auto()
     SYSTEM_TYPE = auto()
     VENDOR = auto()
 
@@ -104,3 +132,58 @@ def are_the_same_entity(actual: TSQLModel, comparer: TSQLModel) -> bool:
         getattr(actual, key) == getattr(comparer, key)
         for key in actual.__table__.columns.keys()  # noqa: SIM118
     )
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """
+    Fails when the block executes more than `limit` SQL statements.
+    """
+    with track_queries() as stats:
+        yield stats
+
+    assert stats.statements <= limit, (
+        f"Expected at most {limit} SQL statements, got {stats.statements}:\n"
+        + "\n".join(stats.executed)
+    )
+
+
+@contextmanager
+def assert_no_full_scans() -> Iterator[None]:
+    """
+    Fails when a query executed in the block reads a whole table instead of using
+    an index, or sorts its rows in a temporary b-tree, according to SQLite's
+    EXPLAIN QUERY PLAN.
+    """
+    engine: Engine = instance(sessionmaker[Session]).kw["bind"]
+    queries: list[tuple[str, Any]] = []
+
+    def record(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if not executemany and statement.lstrip().startswith(("SELECT", "DELETE")):
+            queries.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    with engine.connect() as connection:
+        for statement, parameters in queries:
+            plan = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).all()
+            problems = [
+                row.detail
+                for row in plan
+                if re.fullmatch(r"SCAN \S+", row.detail)
+                or row.detail.startswith("USE TEMP B-TREE FOR ORDER BY")
+            ]
+            assert not problems, f"{', '.join(problems)} in:\n{statement}"
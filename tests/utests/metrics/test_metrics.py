@@ -0,0 +1,62 @@
+from sqlalchemy import create_engine, text
+
+from app.metrics.database import instrument_engine, track_queries
+from app.metrics.registry import Counter, Histogram, Registry
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = Registry()
+    histogram = Histogram(
+        "request_seconds",
+        "Request time",
+        ["route"],
+        buckets=(0.1, 1),
+        registry=registry,
+    )
+    histogram.observe(0.05, "/vendors")
+    histogram.observe(0.5, "/vendors")
+    histogram.observe(2, "/vendors")
+
+    assert registry.render().splitlines() == [
+        "# HELP request_seconds Request time",
+        "# TYPE request_seconds histogram",
+        'request_seconds_bucket{route="/vendors",le="0.1"} 1',
+        'request_seconds_bucket{route="/vendors",le="1"} 2',
+        'request_seconds_bucket{route="/vendors",le="+Inf"} 3',
+        'request_seconds_sum{route="/vendors"} 2.55',
+        'request_seconds_count{route="/vendors"} 3',
+    ]
+
+
+def test_counter_escapes_label_values() -> None:
+    registry = Registry()
+    counter = Counter("responses_total", "Responses", ["route"], registry=registry)
+    counter.inc('/a"b')
+
+    assert 'responses_total{route="/a\\"b"} 1' in registry.render()
+
+
+def test_track_queries_counts_statements_of_instrumented_engine() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    instrument_engine(engine, "test")
+
+    with track_queries() as stats, engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 2"))
+
+    assert stats.statements == 2
+    assert stats.duration > 0
+
+
+def test_nested_track_queries_count_for_every_block() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    instrument_engine(engine, "test")
+
+    with track_queries() as outer, engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as inner:
+            connection.execute(text("SELECT 1"))
+
+    assert outer.statements == 2
+    assert inner.statements == 1
+    assert outer.repeated(threshold=2) == {"SELECT 1": 2}
@@ -0,0 +1,82 @@
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from app.helpers.etag import compute_etag, etag_matches
+from app.middleware.conditional_request import ConditionalRequestMiddleware
+
+
+class ExampleDto(BaseModel):
+    name: str
+    trade_name: str = Field(alias="tradeName")
+
+
+EXAMPLE = ExampleDto(name="é", tradeName="example")
+
+
+def create_client() -> TestClient:
+    api = FastAPI()
+    api.add_middleware(ConditionalRequestMiddleware)
+
+    @api.get("/example", response_model=ExampleDto)
+    def get_example() -> ExampleDto:
+        return EXAMPLE
+
+    @api.get("/tagged")
+    def get_tagged() -> Response:
+        return Response(
+            b"{}", media_type="application/json", headers={"ETag": '"tagged"'}
+        )
+
+    @api.get("/text")
+    def get_text() -> PlainTextResponse:
+        return PlainTextResponse("text")
+
+    return TestClient(api)
+
+
+def test_get_should_return_the_etag_of_the_body() -> None:
+    response = create_client().get("/example")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == compute_etag(response.content)
+
+
+def test_responses_tagged_by_their_route_should_be_passed_through() -> None:
+    response = create_client().get("/tagged", headers={"If-None-Match": '"tagged"'})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"tagged"'
+
+
+def test_matching_if_none_match_should_return_not_modified() -> None:
+    client = create_client()
+    etag = client.get("/example").headers["ETag"]
+
+    response = client.get("/example", headers={"If-None-Match": f'"other", W/{etag}'})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    assert "content-length" not in response.headers
+
+
+def test_stale_if_none_match_should_return_the_body() -> None:
+    response = create_client().get("/example", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json() == {"name": "é", "tradeName": "example"}
+
+
+def test_non_json_responses_should_not_get_an_etag() -> None:
+    response = create_client().get("/text")
+
+    assert "ETag" not in response.headers
+
+
+def test_if_match_should_use_the_strong_comparison() -> None:
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('W/"b"', '"b"')
+    assert etag_matches('W/"b"', '"b"', weak=True)
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from inject import Binder, configure
+from sqlalchemy import Connection, Engine, create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.session_manager import ReadReplica, streaming_session
+from app.middleware.read_replica import LAST_WRITE_COOKIE, ReadReplicaMiddleware
+
+PRIMARY = create_engine("sqlite://")
+REPLICA = create_engine("sqlite://")
+
+
+@pytest.fixture(autouse=True)
+def container() -> None:
+    def bind_primary(binder: Binder) -> None:
+        binder.bind(sessionmaker[Session], sessionmaker(PRIMARY))
+
+    configure(bind_primary, clear=True)
+
+
+def engine_name(engine: Engine | Connection) -> str:
+    return "replica" if engine is REPLICA else "primary"
+
+
+def create_client() -> TestClient:
+    api = FastAPI()
+    api.add_middleware(
+        ReadReplicaMiddleware,
+        replica=ReadReplica(sessionmaker(REPLICA), async_sessionmaker()),
+        sticky_seconds=5,
+    )
+
+    @api.get("/database")
+    def read() -> str:
+        with streaming_session() as session:
+            return engine_name(session.get_bind())
+
+    @api.post("/database")
+    def write(fail: bool = False) -> str:
+        if fail:
+            raise HTTPException(status_code=409)
+        with streaming_session() as session:
+            return engine_name(session.get_bind())
+
+    return TestClient(api)
+
+
+def test_reads_should_run_on_the_replica_and_writes_on_the_primary() -> None:
+    client = create_client()
+
+    assert client.get("/database").json() == "replica"
+    assert client.post("/database").json() == "primary"
+
+
+def test_reads_after_a_write_should_run_on_the_primary() -> None:
+    client = create_client()
+    client.post("/database")
+
+    assert LAST_WRITE_COOKIE in client.cookies
+    assert client.get("/database").json() == "primary"
+
+
+def test_failed_writes_should_not_move_reads_to_the_primary() -> None:
+    client = create_client()
+    client.post("/database", params={"fail": True})
+
+    assert LAST_WRITE_COOKIE not in client.cookies
+    assert client.get("/database").json() == "replica"
+
+
+def test_reads_after_the_sticky_window_should_run_on_the_replica() -> None:
+    client = create_client()
+    client.cookies.set(LAST_WRITE_COOKIE, str(time.time() - 60))
+
+    assert client.get("/database").json() == "replica"
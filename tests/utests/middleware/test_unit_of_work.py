@@ -0,0 +1,113 @@
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from gfmodules_python_shared.schema.sql_model import SQLModelBase
+from inject import Binder, configure
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.db.entities import Vendor
+from app.db.services import VendorService
+from app.db.session_manager import mapped, run_in_session
+from app.middleware.unit_of_work import UnitOfWorkMiddleware
+from app.schemas.vendor.mapper import map_vendor_entity_to_dto
+
+
+class RecordingAsyncSession(AsyncSession):
+    """
+    Records the sessions that were opened and their commits.
+    """
+
+    opened: list["RecordingAsyncSession"] = []
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.commits = 0
+        self.opened.append(self)
+
+    async def commit(self) -> None:
+        await super().commit()
+        self.commits += 1
+
+
+@pytest.fixture(autouse=True)
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    database = tmp_path / "register.db"
+    engine = create_engine(f"sqlite:///{database}")
+    SQLModelBase.metadata.create_all(engine)
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{database}", poolclass=NullPool
+    )
+    RecordingAsyncSession.opened.clear()
+
+    def bind_session_factory(binder: Binder) -> None:
+        binder.bind(
+            async_sessionmaker[AsyncSession],
+            async_sessionmaker(
+                async_engine, class_=RecordingAsyncSession, expire_on_commit=False
+            ),
+        )
+
+    configure(bind_session_factory, clear=True)
+    yield engine
+    engine.dispose()
+
+
+def create_client() -> TestClient:
+    api = FastAPI()
+    api.add_middleware(UnitOfWorkMiddleware)
+    service = VendorService()
+
+    @api.post("/vendors")
+    async def add_vendor(fail: bool = False) -> str:
+        await run_in_session(
+            service.add_one,
+            kvk_number="12456",
+            trade_name="example vendor",
+            statutory_name="example vendor bv",
+        )
+        vendor = await run_in_session(
+            mapped(map_vendor_entity_to_dto, service.get_one_by_kvk_number), "12456"
+        )
+        if fail:
+            raise HTTPException(status_code=409)
+        return vendor.trade_name
+
+    @api.get("/ping")
+    async def ping() -> str:
+        return "pong"
+
+    return TestClient(api)
+
+
+def stored_vendors(engine: Engine) -> list[str]:
+    with Session(engine) as session:
+        return list(session.scalars(select(Vendor.trade_name)))
+
+
+def test_service_calls_of_a_request_should_share_one_session_and_commit_once(
+    engine: Engine,
+) -> None:
+    response = create_client().post("/vendors")
+
+    assert response.json() == "example vendor"
+    assert [session.commits for session in RecordingAsyncSession.opened] == [1]
+    assert stored_vendors(engine) == ["example vendor"]
+
+
+def test_failed_requests_should_be_rolled_back(engine: Engine) -> None:
+    response = create_client().post("/vendors", params={"fail": True})
+
+    assert response.status_code == 409
+    assert [session.commits for session in RecordingAsyncSession.opened] == [0]
+    assert stored_vendors(engine) == []
+
+
+def test_requests_without_service_calls_should_not_open_a_session() -> None:
+    assert create_client().get("/ping").json() == "pong"
+    assert RecordingAsyncSession.opened == []
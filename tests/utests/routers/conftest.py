@@ -0,0 +1,78 @@
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from gfmodules_python_shared.schema.sql_model import SQLModelBase
+from inject import Binder, configure
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import get_config, reset_config
+from tests.utests.db.services.utils import bind_services, enforce_foreign_keys
+
+CONFIG = """
+[app]
+loglevel=warning
+
+[database]
+dsn={dsn}
+
+[cache]
+response_backend=none
+
+[uvicorn]
+ssl_base_dir=
+ssl_cert_file=
+ssl_key_file=
+"""
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> Iterator[TestClient]:
+    """
+    The application as it is served, its routes running on an async engine. Both
+    engines share a database file, as the connections of the async driver live in
+    a thread of their own.
+    """
+    database = tmp_path / "register.db"
+    engine = create_engine(f"sqlite:///{database}")
+    enforce_foreign_keys(engine)
+    SQLModelBase.metadata.create_all(engine)
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{database}", poolclass=NullPool
+    )
+    enforce_foreign_keys(async_engine.sync_engine)
+
+    def container_config(binder: Binder) -> None:
+        bind_services(binder, engine)
+        binder.bind(
+            async_sessionmaker[AsyncSession],
+            async_sessionmaker(async_engine, expire_on_commit=False),
+        )
+
+    configure(container_config, clear=True)
+    config = tmp_path / "app.conf"
+    config.write_text(CONFIG.format(dsn=f"sqlite:///{database}"))
+    reset_config()
+    get_config(str(config))
+    # Imported once the injector is configured, app.container configures it from
+    # app.conf otherwise
+    from app.fastapi_application import create_fastapi_app
+
+    with TestClient(create_fastapi_app()) as test_client:
+        yield test_client
+
+    reset_config()
+    engine.dispose()
+
+
+def created(client: TestClient, path: str, **data: Any) -> Any:
+    """
+    Posts `data` to `path` and returns the response body, failing unless the
+    request succeeded.
+    """
+    response = client.post(f"/v1{path}", json=data)
+    assert response.is_success, response.text
+    return response.json()
@@ -0,0 +1,156 @@
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.db.services.application_service import ApplicationService
+from tests.utests.routers.conftest import created
+
+
+def register_application(client: TestClient) -> dict[str, Any]:
+    vendor = created(
+        client,
+        "/vendors",
+        kvk_number="12345678",
+        trade_name="example vendor",
+        statutory_name="example vendor bv",
+    )
+    created(client, "/roles", name="example role", description=None)
+    created(client, "/system-types", name="example system type", description=None)
+    application: dict[str, Any] = created(
+        client,
+        f"/applications/vendors/{vendor['id']}",
+        name="example application",
+        version="1.0.0",
+        roles=["example role"],
+        system_types=["example system type"],
+    )
+    return application
+
+
+def test_registered_applications_should_be_returned_with_their_children(
+    client: TestClient,
+) -> None:
+    application = register_application(client)
+
+    assert [version["version"] for version in application["versions"]] == ["1.0.0"]
+    assert [role["name"] for role in application["roles"]] == ["example role"]
+    assert [system_type["name"] for system_type in application["systemTypes"]] == [
+        "example system type"
+    ]
+    stored = client.get(f"/v1/applications/{application['id']}").json()
+    assert stored == application
+
+
+def test_adding_a_version_should_return_every_version_with_its_id(
+    client: TestClient,
+) -> None:
+    application = register_application(client)
+    etag = client.get(f"/v1/applications/{application['id']}").headers["etag"]
+
+    response = client.post(
+        f"/v1/applications/{application['id']}/versions",
+        json={"version": "2.0.0"},
+        headers={"If-Match": etag},
+    )
+
+    assert response.status_code == 200, response.text
+    stored = client.get(f"/v1/applications/{application['id']}").json()
+    assert sorted(response.json(), key=lambda version: version["version"]) == sorted(
+        stored["versions"], key=lambda version: version["version"]
+    )
+
+
+def test_assigning_a_role_should_return_the_application_with_the_role(
+    client: TestClient,
+) -> None:
+    application = register_application(client)
+    role = created(client, "/roles", name="other role", description="other")
+
+    response = client.patch(f"/v1/applications/{application['id']}/roles/{role['id']}")
+
+    assert response.status_code == 200, response.text
+    stored = client.get(f"/v1/applications/{application['id']}").json()
+    assert sorted(role["name"] for role in response.json()["roles"]) == [
+        "example role",
+        "other role",
+    ]
+    assert sorted(role["id"] for role in response.json()["roles"]) == sorted(
+        role["id"] for role in stored["roles"]
+    )
+
+
+def test_applications_of_a_vendor_should_be_returned_with_their_children(
+    client: TestClient,
+) -> None:
+    application = register_application(client)
+
+    response = client.get(f"/v1/applications/vendors/{application['vendor']['id']}")
+
+    assert response.status_code == 200
+    assert response.json() == [application]
+
+
+def test_matching_if_none_match_should_not_load_the_application(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    application = register_application(client)
+    path = f"/v1/applications/{application['id']}"
+    etag = client.get(path).headers["etag"]
+
+    def get_one(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("the application was loaded")
+
+    monkeypatch.setattr(ApplicationService, "get_one", get_one)
+    response = client.get(path, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_adding_a_version_should_change_the_etag_of_the_application_and_vendor(
+    client: TestClient,
+) -> None:
+    application = register_application(client)
+    path = f"/v1/applications/{application['id']}"
+    vendor_path = f"/v1/vendors/{application['vendor']['id']}"
+    etag = client.get(path).headers["etag"]
+    vendor_etag = client.get(vendor_path).headers["etag"]
+
+    response = client.post(
+        f"{path}/versions", json={"version": "2.0.0"}, headers={"If-Match": etag}
+    )
+
+    assert response.status_code == 200, response.text
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 200
+    assert (
+        client.get(vendor_path, headers={"If-None-Match": vendor_etag}).status_code
+        == 200
+    )
+
+
+def test_changing_a_role_description_should_change_the_etag_of_the_application(
+    client: TestClient,
+) -> None:
+    application = register_application(client)
+    path = f"/v1/applications/{application['id']}"
+    etag = client.get(path).headers["etag"]
+
+    response = client.put(
+        f"/v1/roles/{application['roles'][0]['id']}", json={"description": "other"}
+    )
+
+    assert response.status_code == 200, response.text
+    response = client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["roles"][0]["description"] == "other"
+
+
+def test_etag_should_depend_on_the_selected_fields(client: TestClient) -> None:
+    application = register_application(client)
+    path = f"/v1/applications/{application['id']}"
+
+    full = client.get(path).headers["etag"]
+    sparse = client.get(path, params={"fields": "name"}).headers["etag"]
+
+    assert full != sparse
@@ -0,0 +1,92 @@
+from typing import Any
+
+from fastapi.testclient import TestClient
+from inject import instance
+
+from app.db.services import ProtocolService, ProtocolVersionService
+from tests.utests.routers.conftest import created
+
+
+def register_healthcare_provider(client: TestClient) -> dict[str, Any]:
+    protocol = instance(ProtocolService).add_one(
+        protocol_type="Directive", name="example protocol", description="example"
+    )
+    protocol_version = instance(ProtocolVersionService).add_one(
+        protocol_id=protocol.id, version="1.0", description=None
+    )
+    provider: dict[str, Any] = created(
+        client,
+        "/healthcare-provider",
+        ura_code="12345678",
+        agb_code="87654321",
+        trade_name="example provider",
+        statutory_name="example provider bv",
+        protocol_version_id=str(protocol_version.id),
+    )
+    return provider
+
+
+def test_registered_healthcare_providers_should_be_returned_qualified(
+    client: TestClient,
+) -> None:
+    provider = register_healthcare_provider(client)
+
+    assert [
+        qualification["version"] for qualification in provider["qualifiedProtocols"]
+    ] == ["1.0"]
+    assert provider == client.get(f"/v1/healthcare-provider/{provider['id']}").json()
+
+
+def register_application(client: TestClient) -> dict[str, Any]:
+    vendor = created(
+        client,
+        "/vendors",
+        kvk_number="12345678",
+        trade_name="example vendor",
+        statutory_name="example vendor bv",
+    )
+    application: dict[str, Any] = created(
+        client,
+        f"/applications/vendors/{vendor['id']}",
+        name="example application",
+        version="1.0.0",
+        roles=[],
+        system_types=[],
+    )
+    return application
+
+
+def test_assigned_application_versions_should_be_returned_once(
+    client: TestClient,
+) -> None:
+    provider = register_healthcare_provider(client)
+    version = register_application(client)["versions"][0]
+
+    response = client.post(
+        f"/v1/healthcare-provider/{provider['id']}/application-versions/{version['id']}"
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["applicationVersions"] == [version]
+    assert (
+        response.json()
+        == client.get(f"/v1/healthcare-provider/{provider['id']}").json()
+    )
+
+
+def test_deleting_an_assigned_application_should_change_the_etag(
+    client: TestClient,
+) -> None:
+    provider = register_healthcare_provider(client)
+    application = register_application(client)
+    path = f"/v1/healthcare-provider/{provider['id']}"
+    client.post(
+        f"{path}/application-versions/{application['versions'][0]['id']}"
+    ).raise_for_status()
+    etag = client.get(path).headers["etag"]
+
+    client.delete(f"/v1/applications/{application['id']}").raise_for_status()
+
+    response = client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["applicationVersions"] == []
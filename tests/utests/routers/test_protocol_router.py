@@ -0,0 +1,38 @@
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from tests.utests.routers.conftest import created
+
+
+def register_protocol(client: TestClient) -> dict[str, Any]:
+    protocol: dict[str, Any] = created(
+        client,
+        "/protocols",
+        protocol_type="Directive",
+        name="example protocol",
+        description="example",
+    )
+    return protocol
+
+
+def test_registered_protocols_should_be_returned_without_versions(
+    client: TestClient,
+) -> None:
+    protocol = register_protocol(client)
+
+    assert protocol["versions"] == []
+    assert client.get(f"/v1/protocols/{protocol['id']}").json() == protocol
+
+
+def test_added_protocol_versions_should_be_returned_with_their_id(
+    client: TestClient,
+) -> None:
+    protocol = register_protocol(client)
+
+    version = created(
+        client, f"/protocols/{protocol['id']}/versions", version="1.0", description=None
+    )
+
+    stored = client.get(f"/v1/protocols/{protocol['id']}").json()
+    assert stored["versions"] == [version]